@@ -1,5 +1,12 @@
 import numpy as np
+import pandas as pd
+import scipy.sparse as sp
 from collections import Counter
+from itertools import chain
+
+from cache import fingerprint
+from matcher import AhoCorasick
+from tfidf import count_matrix
 
 # ===============================
 # KEYWORD UNTUK SENTIMEN
@@ -197,9 +204,12 @@ def analyze_sentiment(text):
     - skor: skor sentimen (positif - negatif)
     """
     words = set(text.lower().split())
-    
-    pos_count = len(words & POSITIVE_WORDS)
-    neg_count = len(words & NEGATIVE_WORDS)
+    return _sentiment_from_words(words)
+
+def _sentiment_from_words(words):
+    """Hitung kategori & skor sentimen dari kumpulan kata unik"""
+    pos_count = len(POSITIVE_WORDS.intersection(words))
+    neg_count = len(NEGATIVE_WORDS.intersection(words))
     
     # Hitung skor sentimen
     score = pos_count - neg_count
@@ -214,26 +224,205 @@ def analyze_sentiment(text):
     else:
         return "Netral", 0
 
+# ===============================
+# SENTIMEN BATCH (MATRIKS SPARSE)
+# ===============================
+def term_matrix(texts):
+    """
+    Bangun matriks document-term (count, CSR) dari banyak teks sekaligus
+
+    Returns:
+    - X: sparse matrix (n_docs x n_terms)
+    - vocabulary: dict {term: kolom}
+    """
+    vocabulary = {}
+    lookup = vocabulary.setdefault
+    indptr = [0]
+    indices = []
+    for text in texts:
+        indices.extend(lookup(w, len(vocabulary)) for w in text.lower().split())
+        indptr.append(len(indices))
+
+    X = sp.csr_matrix(
+        (np.ones(len(indices), dtype=np.int64),
+         np.asarray(indices, dtype=np.int64),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, len(vocabulary))
+    )
+    X.sum_duplicates()
+    return X, vocabulary
+
+def term_matrix_from_counts(term_counts):
+    """Matriks document-term dari list {term: jumlah} (mode streaming)"""
+    vocabulary = {}
+    for counts in term_counts:
+        for term in counts:
+            vocabulary.setdefault(term, len(vocabulary))
+    return count_matrix(term_counts, vocabulary), vocabulary
+
+def lexicon_vector(words, vocabulary):
+    """Vektor bobot 1/0 sepanjang kosakata untuk kata-kata lexicon"""
+    vec = np.zeros(len(vocabulary))
+    cols = [vocabulary[w] for w in words if w in vocabulary]
+    vec[cols] = 1.0
+    return vec
+
+def sentiment_from_matrix(X, vocabulary):
+    """
+    Skor sentimen semua dokumen dari matriks document-term
+
+    Sama dengan analyze_sentiment per dokumen: yang dihitung adalah jumlah
+    kata positif/negatif UNIK yang muncul.
+
+    Returns:
+    - kategori: array kategori per dokumen
+    - skor: array skor (positif - negatif) per dokumen
+    """
+    # Presence (0/1) karena analyze_sentiment memakai set kata
+    present = sp.csr_matrix(X, copy=True)
+    present.data = (present.data > 0).astype(np.float64)
+
+    pos_count = present @ lexicon_vector(POSITIVE_WORDS, vocabulary)
+    neg_count = present @ lexicon_vector(NEGATIVE_WORDS, vocabulary)
+    score = (pos_count - neg_count).astype(np.int64)
+
+    kategori = np.select(
+        [pos_count > neg_count * 1.5, pos_count > neg_count, neg_count > pos_count],
+        ["Sangat Baik", "Baik", "Kurang Baik"],
+        default="Netral"
+    ).astype(object)
+    return kategori, score
+
+def analyze_sentiment_batch(texts):
+    """
+    Analisis sentimen untuk banyak teks (per tempat atau per review)
+
+    Returns:
+    - kategori: array kategori per teks
+    - skor: array skor sentimen per teks
+    """
+    X, vocabulary = term_matrix(texts)
+    return sentiment_from_matrix(X, vocabulary)
+
+def analyze_sentiment_corpus(corpus):
+    """Sama dengan analyze_sentiment_batch, dari TokenizedCorpus"""
+    return sentiment_from_matrix(corpus.count_matrix(), corpus.vocabulary_index)
+
 # ===============================
 # FUNGSI DETEKSI TEMA
 # ===============================
-def detect_tema(text):
+# Automaton semua keyword tema, dibangun sekali saat import
+_TEMA_MATCHER = AhoCorasick(
+    keyword for keywords in TEMA_KEYWORDS.values() for keyword in keywords
+)
+_TEMA_KEYWORD_IDS = {
+    tema: {_TEMA_MATCHER.patterns.index(keyword) for keyword in keywords}
+    for tema, keywords in TEMA_KEYWORDS.items()
+}
+
+def detect_tema(text, word_boundary=False):
     """
     Deteksi tema wisata berdasarkan keywords
     
+    Semua keyword dicari sekaligus dalam satu scan (Aho-Corasick).
+    
+    Parameters:
+    - word_boundary: False = cocok sebagai substring (perilaku lama),
+      True = keyword harus berupa kata utuh
+    
     Returns:
     - tema_utama: tema dengan skor tertinggi
     - tema_terkait: list tema lainnya yang relevan
     """
-    text_lower = text.lower()
+    found = _TEMA_MATCHER.find(text.lower(), word_boundary=word_boundary)
+    return _rank_tema(_score_tema(found))
+
+def detect_tema_from_counts(term_counts, word_boundary=False):
+    """
+    Sama dengan detect_tema, tetapi dari hitungan unigram+bigram per
+    dokumen (mode streaming). Keyword tanpa spasi selalu berada di dalam
+    satu kata dan keyword dua kata berada di dalam satu bigram, sehingga
+    pencocokan pada setiap term memberi hasil yang sama dengan teks utuh.
+    """
+    found = set()
+    for term in term_counts:
+        found |= _TEMA_MATCHER.find(term, word_boundary=word_boundary)
+    return _rank_tema(_score_tema(found))
+
+def detect_tema_corpus(corpus, word_boundary=False):
+    """
+    Deteksi tema untuk semua dokumen TokenizedCorpus
+
+    Automaton dijalankan sekali per kata unik, bukan per dokumen; hasilnya
+    disebar ke dokumen lewat perkalian matriks presence (dokumen x kata)
+    dengan (kata x keyword). Keyword multi-kata dicocokkan pada token
+    berurutan: kata pertama sebagai akhiran, kata terakhir sebagai awalan
+    (atau kata utuh jika word_boundary=True), sama dengan pencocokan
+    substring pada teks gabungan.
+
+    Returns:
+    - list (per dokumen) berisi tuple (tema_utama, tema_terkait)
+    """
+    n_keywords = len(_TEMA_MATCHER.patterns)
+    vocabulary = corpus.vocabulary
+
+    rows, cols = [], []
+    for i, word in enumerate(vocabulary):
+        for pid in _TEMA_MATCHER.find(word, word_boundary=word_boundary):
+            rows.append(i)
+            cols.append(pid)
+    word_keywords = sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(vocabulary), n_keywords)
+    )
+    presence = corpus.count_matrix()
+    presence.data[:] = 1.0
+    found = sp.csr_matrix(presence.astype(np.float64) @ word_keywords)
+    found = found.tolil()
+
+    # Keyword multi-kata
+    words = pd.Series(vocabulary, dtype=object)
+    doc_of = corpus.doc_ids()
+    tokens = corpus.token_ids
+    for pid, pattern in enumerate(_TEMA_MATCHER.patterns):
+        parts = pattern.split(" ")
+        n = len(parts)
+        if n == 1 or len(tokens) < n:
+            continue
+        if word_boundary:
+            head = (words == parts[0]).to_numpy()
+            tail = (words == parts[-1]).to_numpy()
+        else:
+            head = words.str.endswith(parts[0]).to_numpy(dtype=bool)
+            tail = words.str.startswith(parts[-1]).to_numpy(dtype=bool)
+
+        span = len(tokens) - n + 1
+        match = head[tokens[:span]] & tail[tokens[n - 1:]] & (doc_of[:span] == doc_of[n - 1:])
+        for k, part in enumerate(parts[1:-1], 1):
+            match &= (words == part).to_numpy()[tokens[k:k + span]]
+
+        for d in np.unique(doc_of[:span][match]):
+            found[d, pid] = 1.0
+
+    found = found.tocsr()
+    return [
+        _rank_tema(_score_tema(set(found.indices[found.indptr[d]:found.indptr[d + 1]].tolist())))
+        for d in range(corpus.n_docs)
+    ]
+
+def _score_tema(found):
+    """Skor tema = jumlah keyword berbeda dari tema tersebut yang ditemukan"""
     tema_scores = {}
     
     # Hitung skor untuk setiap tema
-    for tema, keywords in TEMA_KEYWORDS.items():
-        score = sum(1 for keyword in keywords if keyword in text_lower)
+    for tema, keyword_ids in _TEMA_KEYWORD_IDS.items():
+        score = len(keyword_ids & found)
         if score > 0:
             tema_scores[tema] = score
     
+    return tema_scores
+
+def _rank_tema(tema_scores):
+    """Urutkan skor tema menjadi (tema_utama, tema_terkait)"""
     # Jika tidak ada tema yang terdeteksi
     if not tema_scores:
         return "Umum", []
@@ -310,4 +499,119 @@ def extract_top_keywords(text, top_n=5):
     # Ambil top N kata
     top_words = [word for word, count in word_freq.most_common(top_n)]
     
-    return top_words
\ No newline at end of file
+    return top_words
+
+def extract_top_keywords_from_counts(term_counts, top_n=5):
+    """
+    Sama dengan extract_top_keywords, tetapi dari hitungan term per
+    dokumen (mode streaming). Urutan term di Counter mengikuti kemunculan
+    pertama, sehingga urutan untuk skor yang sama tetap identik.
+    """
+    word_freq = Counter({
+        word: count for word, count in term_counts.items()
+        if _is_keyword(word)
+    })
+    
+    return [word for word, count in word_freq.most_common(top_n)]
+
+def _is_keyword(word):
+    """Filter kata kunci: kata sifat/benda, bukan kata fungsional"""
+    return (
+        len(word) > 3
+        and word not in FUNCTIONAL_WORDS
+        and (word in ADJECTIVES or word in NOUNS)
+    )
+
+# ===============================
+# EKSTRAK KATA KUNCI (BATCH)
+# ===============================
+# Kosakata kata kunci yang diizinkan, dihitung sekali
+KEYWORD_VOCAB = pd.Index(sorted(w for w in ADJECTIVES | NOUNS if _is_keyword(w)))
+
+def top_keywords_from_ids(doc_ids, term_ids, n_docs, top_n=5):
+    """
+    Top-N term per dokumen dari aliran token (doc_id, term_id) berurutan
+
+    Urutan: frekuensi tertinggi dulu; jika sama, yang muncul lebih awal
+    (sama dengan Counter.most_common).
+
+    Parameters:
+    - doc_ids, term_ids: array token sesuai urutan kemunculan, term_id
+      adalah indeks di KEYWORD_VOCAB
+    - n_docs: jumlah dokumen
+
+    Returns:
+    - list (per dokumen) berisi list kata kunci
+    """
+    n_terms = len(KEYWORD_VOCAB)
+    keys = np.asarray(doc_ids, dtype=np.int64) * n_terms + np.asarray(term_ids, dtype=np.int64)
+
+    # Satu pasangan (dokumen, term) unik = satu entri matriks count sparse
+    pairs, first_pos, counts = np.unique(keys, return_index=True, return_counts=True)
+    pair_docs = pairs // n_terms
+    pair_terms = pairs % n_terms
+
+    # Urutkan per dokumen: count menurun, lalu kemunculan pertama
+    order = np.lexsort((first_pos, -counts, pair_docs))
+    pair_docs = pair_docs[order]
+    pair_terms = pair_terms[order]
+
+    doc_start = np.searchsorted(pair_docs, np.arange(n_docs + 1))
+    rank = np.arange(len(pair_docs)) - doc_start[pair_docs]
+    keep = rank < top_n
+
+    words = KEYWORD_VOCAB.to_numpy()[pair_terms[keep]]
+    bounds = np.searchsorted(pair_docs[keep], np.arange(n_docs + 1))
+    return [words[bounds[d]:bounds[d + 1]].tolist() for d in range(n_docs)]
+
+def extract_top_keywords_batch(texts, top_n=5):
+    """
+    Ekstrak kata kunci untuk banyak teks sekaligus
+
+    Token dipetakan ke KEYWORD_VOCAB dalam satu operasi (get_indexer),
+    lalu dihitung dan diurutkan dengan NumPy untuk semua dokumen.
+
+    Returns:
+    - list (per teks) berisi list kata kunci teratas
+    """
+    split = [text.lower().split() for text in texts]
+    lengths = np.fromiter(map(len, split), dtype=np.int64, count=len(split))
+    tokens = np.fromiter(chain.from_iterable(split), dtype=object, count=int(lengths.sum()))
+
+    term_ids = KEYWORD_VOCAB.get_indexer(tokens)
+    doc_ids = np.repeat(np.arange(len(split)), lengths)
+    allowed = term_ids >= 0
+
+    return top_keywords_from_ids(doc_ids[allowed], term_ids[allowed], len(split), top_n)
+
+def extract_top_keywords_corpus(corpus, top_n=5):
+    """
+    Sama dengan extract_top_keywords_batch, dari TokenizedCorpus
+
+    Kosakata korpus dipetakan ke KEYWORD_VOCAB sekali saja, lalu id token
+    langsung diterjemahkan lewat lookup array.
+    """
+    term_ids = KEYWORD_VOCAB.get_indexer(corpus.vocabulary)[corpus.token_ids]
+    allowed = term_ids >= 0
+    return top_keywords_from_ids(
+        corpus.doc_ids()[allowed], term_ids[allowed], corpus.n_docs, top_n
+    )
+
+# ===============================
+# VERSI LEXICON
+# ===============================
+def lexicon_version():
+    """
+    Fingerprint semua lexicon analyzer
+
+    Dipakai cache tahap analisis: mengubah daftar kata sentimen, tema,
+    atau kata kunci membuat hasil analisis lama tidak dipakai lagi.
+    """
+    return fingerprint(
+        sorted(POSITIVE_WORDS),
+        sorted(NEGATIVE_WORDS),
+        sorted((tema, tuple(keywords)) for tema, keywords in TEMA_KEYWORDS.items()),
+        sorted(FUNCTIONAL_WORDS),
+        sorted(ADJECTIVES),
+        sorted(NOUNS),
+    )
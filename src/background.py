@@ -0,0 +1,161 @@
+"""
+Menjalankan pekerjaan berat di luar thread Tk
+
+- run_in_thread  : fungsi I/O (load hasil, buka review store) di thread
+                   latar, hasilnya diserahkan ke callback di thread Tk
+- PipelineProcess: run_pipeline di proses terpisah (CPU-bound, tidak
+                   berebut GIL dengan GUI), progres dibaca dari log tahap
+                   "[n/7]" yang dikirim lewat multiprocessing.Queue
+
+Widget Tk hanya disentuh dari thread Tk: hasil dari thread/proses latar
+diambil dengan polling root.after.
+"""
+
+import multiprocessing as mp
+import queue
+import re
+import threading
+import traceback
+
+# Interval (ms) polling hasil dari thread/proses latar
+POLL_MS = 50
+
+# Penanda tahap di log run_pipeline, mis. "[4/7] Melakukan TF-IDF..."
+STEP_PATTERN = re.compile(r"\[(\d+)/(\d+)\]")
+
+# ===============================
+# THREAD
+# ===============================
+def run_in_thread(root, func, on_done, on_error=None):
+    """
+    Jalankan func() di thread latar, lalu on_done(hasil) di thread Tk
+
+    Parameters:
+    - root: root Tk (untuk root.after)
+    - func: fungsi tanpa argumen, tidak boleh menyentuh widget Tk
+    - on_done: callback(hasil) di thread Tk
+    - on_error: callback(exception) di thread Tk (None = exception
+      dilempar ulang ke handler callback Tk)
+    """
+    results = queue.Queue()
+
+    def work():
+        try:
+            results.put((True, func()))
+        except Exception as e:
+            results.put((False, e))
+
+    def check():
+        try:
+            ok, value = results.get_nowait()
+        except queue.Empty:
+            root.after(POLL_MS, check)
+            return
+        if ok:
+            on_done(value)
+        elif on_error is not None:
+            on_error(value)
+        else:
+            raise value
+
+    threading.Thread(target=work, daemon=True).start()
+    root.after(POLL_MS, check)
+
+# ===============================
+# PROSES CLUSTERING
+# ===============================
+def _pipeline_main(config, messages):
+    """Entry point proses anak: run_pipeline dengan log ke queue"""
+    try:
+        from main import run_pipeline
+        run_pipeline(
+            config,
+            log=lambda *args: messages.put(("log", " ".join(str(a) for a in args)))
+        )
+        messages.put(("done", None))
+    except Exception:
+        messages.put(("error", traceback.format_exc()))
+
+class PipelineProcess:
+    """
+    run_pipeline di proses terpisah; hasil ditulis ke output_dir seperti
+    saat dijalankan dari main.py
+
+    Contoh (di thread Tk):
+        job = PipelineProcess({"k": 4}).start()
+        ...
+        lines = job.poll()      # tiap POLL_MS
+        job.progress            # 0..1
+        job.state               # "running", "done", "error"
+
+    Parameters:
+    - config: dict untuk run_pipeline (lihat main.DEFAULT_CONFIG)
+    """
+
+    def __init__(self, config=None):
+        self.config = dict(config or {})
+        self.state = "idle"
+        self.error = None
+        self.step = 0
+        self.n_steps = None
+        self.step_text = ""
+        self._messages = mp.Queue()
+        self._process = mp.Process(
+            target=_pipeline_main, args=(self.config, self._messages), daemon=True
+        )
+
+    def start(self):
+        self._process.start()
+        self.state = "running"
+        return self
+
+    @property
+    def progress(self):
+        """Fraksi tahap yang sudah dimulai (0..1), None jika belum diketahui"""
+        if not self.n_steps:
+            return None
+        return self.step / self.n_steps
+
+    def poll(self):
+        """
+        Ambil pesan baru dari proses clustering
+
+        Returns:
+        - list baris log baru
+        """
+        lines = self._drain()
+        if self.state == "running" and not self._process.is_alive():
+            # Pesan terakhir bisa masuk sesaat setelah proses selesai
+            lines += self._drain()
+            if self.state == "running":
+                self.state = "error"
+                self.error = f"Proses clustering berhenti (exit code {self._process.exitcode})"
+        return lines
+
+    def _drain(self):
+        lines = []
+        while True:
+            try:
+                kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                return lines
+            if kind == "log":
+                lines.append(value)
+                match = STEP_PATTERN.search(value)
+                if match:
+                    self.step, self.n_steps = int(match.group(1)), int(match.group(2))
+                    self.step_text = value.strip()
+            elif kind == "done":
+                self.state = "done"
+            else:
+                self.state = "error"
+                self.error = value
+
+    def cancel(self):
+        """Hentikan proses clustering yang masih berjalan"""
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        if self.state == "running":
+            self.state = "error"
+            self.error = "Dibatalkan"
@@ -0,0 +1,259 @@
+"""
+Benchmark hot path pipeline clustering
+
+Membangkitkan review sintetis dari kosakata wisata_balikpapan.csv
+(distribusi kata dan panjang review mengikuti data asli), lalu mengukur
+waktu, throughput dan peak memori (tracemalloc) untuk preprocessing,
+TF-IDF, K-Means, dan fungsi analyzer. Hasil bisa dibandingkan dengan
+baseline yang disimpan sebelumnya untuk menandai regresi.
+
+Skala:
+  small  :    10.000 review,     14 tempat
+  medium :   100.000 review,  1.000 tempat
+  large  : 1.000.000 review, 10.000 tempat
+
+Pemakaian:
+  cd src
+  python benchmark.py --scale small --save-baseline
+  python benchmark.py --scale small medium      # bandingkan dengan baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from preprocess import clean_text, preprocess_series
+from corpus import TokenizedCorpus
+from vectorize import vectorize_text, vectorize_corpus
+from cluster import run_kmeans
+from summarize import top_words_per_cluster
+from analyzer import (
+    analyze_sentiment, detect_tema, extract_top_keywords,
+    analyze_sentiment_corpus, detect_tema_corpus, extract_top_keywords_corpus
+)
+
+SCALES = {
+    "small": (10_000, 14),
+    "medium": (100_000, 1_000),
+    "large": (1_000_000, 10_000),
+}
+
+# Fungsi per dokumen (loop Python) di skala besar dijalankan pada sampel
+# sebanyak ini saja; throughput tetap dihitung per item
+PER_DOC_SAMPLE = 20_000
+
+# Waktu lebih lambat dari baseline * (1 + threshold) dianggap regresi,
+# asalkan selisihnya di atas MIN_REGRESSION_SECONDS (abaikan noise kecil)
+REGRESSION_THRESHOLD = 0.20
+MIN_REGRESSION_SECONDS = 0.02
+
+# ===============================
+# GENERATOR REVIEW SINTETIS
+# ===============================
+def load_vocabulary(path):
+    """
+    Kosakata dan distribusi dari data asli
+
+    Returns:
+    - words: array kata (token mentah, sebelum cleaning)
+    - probs: probabilitas kemunculan tiap kata
+    - lengths: array panjang review (jumlah token) untuk di-sampling
+    """
+    reviews = pd.read_csv(path)["review"].dropna().astype(str)
+    tokens = reviews.str.split()
+    counts = pd.Series([w for review in tokens for w in review]).value_counts()
+
+    words = counts.index.to_numpy(dtype=object)
+    probs = counts.to_numpy(dtype=np.float64)
+    lengths = tokens.str.len().to_numpy()
+    return words, probs / probs.sum(), lengths[lengths > 0]
+
+def generate_reviews(n_reviews, n_places, vocabulary, seed=0):
+    """
+    Bangkitkan DataFrame [wisata, review] sintetis
+
+    Parameters:
+    - n_reviews: jumlah review
+    - n_places: jumlah tempat wisata
+    - vocabulary: hasil load_vocabulary
+    - seed: seed random
+    """
+    words, probs, lengths = vocabulary
+    rng = np.random.default_rng(seed)
+
+    review_lengths = rng.choice(lengths, size=n_reviews)
+    tokens = words[rng.choice(len(words), size=int(review_lengths.sum()), p=probs)]
+    bounds = np.concatenate(([0], np.cumsum(review_lengths)))
+    reviews = [" ".join(tokens[bounds[i]:bounds[i + 1]]) for i in range(n_reviews)]
+
+    # Popularitas tempat tidak merata (sebagian tempat punya banyak review)
+    popularity = rng.pareto(1.5, size=n_places) + 1
+    places = rng.choice(n_places, size=n_reviews, p=popularity / popularity.sum())
+    names = np.array([f"wisata_{i:05d}" for i in range(n_places)], dtype=object)
+    return pd.DataFrame({"wisata": names[places], "review": reviews})
+
+# ===============================
+# PENGUKURAN
+# ===============================
+def measure(func, n_items, repeat=3):
+    """
+    Ukur satu fungsi
+
+    Run pertama memakai tracemalloc untuk peak memori; waktu diambil
+    dari run tercepat tanpa tracemalloc.
+
+    Returns:
+    - hasil func (dari run terakhir)
+    - dict {seconds, items, items_per_s, peak_mb}
+    """
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    return result, {
+        "seconds": round(best, 6),
+        "items": n_items,
+        "items_per_s": round(n_items / best, 1) if best > 0 else None,
+        "peak_mb": round(peak / (1024 * 1024), 2),
+    }
+
+def run_benchmarks(df, repeat=3, log=print):
+    """
+    Jalankan semua benchmark pada satu dataset
+
+    Returns:
+    - dict {nama_benchmark: hasil measure}
+    """
+    results = {}
+
+    def bench(name, func, n_items):
+        output, stats = measure(func, n_items, repeat)
+        results[name] = stats
+        log(f"   {name:<32} {stats['seconds']:>10.4f}s  "
+            f"{stats['items_per_s']:>14,.0f} item/s  {stats['peak_mb']:>9.1f} MB")
+        return output
+
+    sample = df["review"].iloc[:PER_DOC_SAMPLE]
+
+    # Preprocessing
+    bench("clean_text", lambda: [clean_text(t) for t in sample], len(sample))
+    clean = bench("preprocess_series", lambda: preprocess_series(df["review"]), len(df))
+
+    # Gabung per tempat
+    grouped = clean.groupby(df["wisata"]).apply(" ".join)
+    corpus = bench("TokenizedCorpus.from_texts", lambda: TokenizedCorpus.from_texts(clean), len(df))
+    _, place_corpus = bench("TokenizedCorpus.group", lambda: corpus.group(df["wisata"]), len(df))
+
+    # TF-IDF + K-Means
+    vectorizer, X = bench("vectorize_text", lambda: vectorize_text(grouped), len(grouped))
+    bench("vectorize_corpus", lambda: vectorize_corpus(place_corpus), len(grouped))
+    k = min(3, X.shape[0])
+    model, _ = bench("run_kmeans", lambda: run_kmeans(X, k=k), X.shape[0])
+    bench("top_words_per_cluster", lambda: top_words_per_cluster(vectorizer, model, top_n=10), k)
+
+    # Analyzer per dokumen (per tempat) dan versi batch dari korpus
+    docs = grouped.iloc[:PER_DOC_SAMPLE]
+    bench("analyze_sentiment", lambda: [analyze_sentiment(t) for t in docs], len(docs))
+    bench("detect_tema", lambda: [detect_tema(t) for t in docs], len(docs))
+    bench("extract_top_keywords", lambda: [extract_top_keywords(t) for t in docs], len(docs))
+    bench("analyze_sentiment_corpus", lambda: analyze_sentiment_corpus(place_corpus), len(grouped))
+    bench("detect_tema_corpus", lambda: detect_tema_corpus(place_corpus), len(grouped))
+    bench("extract_top_keywords_corpus", lambda: extract_top_keywords_corpus(place_corpus), len(grouped))
+
+    return results
+
+# ===============================
+# BASELINE
+# ===============================
+def compare_baseline(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Bandingkan hasil dengan baseline
+
+    Returns:
+    - list (scale, benchmark, detik_baseline, detik_sekarang, rasio)
+      untuk benchmark yang lebih lambat dari batas threshold
+    """
+    regressions = []
+    for scale, results in report["scales"].items():
+        base_results = baseline.get("scales", {}).get(scale, {})
+        for name, stats in results.items():
+            base = base_results.get(name)
+            if not base or not base["seconds"]:
+                continue
+            ratio = stats["seconds"] / base["seconds"]
+            slower = stats["seconds"] - base["seconds"]
+            if ratio > 1 + threshold and slower > MIN_REGRESSION_SECONDS:
+                regressions.append((scale, name, base["seconds"], stats["seconds"], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline clustering wisata")
+    parser.add_argument("--data", default="../data/raw/wisata_balikpapan.csv")
+    parser.add_argument("--scale", nargs="+", default=["small"], choices=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="../outputs/benchmark.json")
+    parser.add_argument("--baseline", default="../outputs/benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="simpan hasil run ini sebagai baseline baru")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("BENCHMARK PIPELINE CLUSTERING WISATA")
+    print("="*60)
+
+    vocabulary = load_vocabulary(args.data)
+    report = {"seed": args.seed, "repeat": args.repeat, "scales": {}}
+
+    for scale in args.scale:
+        n_reviews, n_places = SCALES[scale]
+        print(f"\n[{scale}] {n_reviews:,} review, {n_places:,} tempat")
+        df = generate_reviews(n_reviews, n_places, vocabulary, seed=args.seed)
+        report["scales"][scale] = run_benchmarks(df, repeat=args.repeat)
+
+    folder = os.path.dirname(args.output)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Hasil disimpan ke '{args.output}'")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Baseline disimpan ke '{args.baseline}'")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("  (belum ada baseline; jalankan dengan --save-baseline)")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_baseline(report, baseline, args.threshold)
+
+    if not regressions:
+        print(f"✓ Tidak ada regresi (batas +{args.threshold:.0%} dari baseline)")
+        return
+
+    print(f"\n⚠️  Regresi (lebih lambat > {args.threshold:.0%} dari baseline):")
+    for scale, name, base, now, ratio in regressions:
+        print(f"   [{scale}] {name:<32} {base:.4f}s -> {now:.4f}s ({ratio:.2f}x)")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import scipy.sparse as sp
+
+# ===============================
+# CACHE HASIL CLEANING REVIEW
+# ===============================
+def text_digest(text):
+    """Hash konten teks (16 byte) sebagai key cache"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+class CleanCache:
+    """
+    Cache persisten (on-disk) untuk hasil clean_text per review
+
+    Key   : hash isi review mentah
+    Value : teks bersih
+    Seluruh isi cache terikat ke satu versi konfigurasi preprocessing
+    (stopwords + pola regex). Jika versi berubah, cache otomatis dikosongkan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._loaded = False
+        self._dirty = False
+
+    def ensure_version(self, version):
+        """Load cache dari disk dan buang isinya jika versi konfigurasi beda"""
+        if not self._loaded:
+            self._load()
+
+        if self.version != version:
+            self.entries = {}
+            self.version = version
+            self._dirty = True
+
+    def _load(self):
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                payload = pickle.load(f)
+            self.version = payload["version"]
+            self.entries = payload["entries"]
+        except Exception:
+            # File rusak / format lama -> mulai dari cache kosong
+            self.version = None
+            self.entries = {}
+
+    def lookup(self, keys):
+        """
+        Cari banyak key sekaligus
+
+        Returns:
+        - values: list hasil (None untuk key yang belum ada)
+        - missing: list posisi yang belum ada di cache
+        """
+        get = self.entries.get
+        values = [get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+
+        self.hits += len(values) - len(missing)
+        self.misses += len(missing)
+        return values, missing
+
+    def update(self, keys, values):
+        """Simpan pasangan key -> hasil ke cache"""
+        self.entries.update(zip(keys, values))
+        if keys:
+            self._dirty = True
+
+    def save(self):
+        """Tulis cache ke disk (hanya jika ada perubahan)"""
+        if not self._dirty:
+            return
+
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"version": self.version, "entries": self.entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def stats(self):
+        """Ringkasan hit/miss untuk ditampilkan di log"""
+        total = self.hits + self.misses
+        ratio = self.hits / total * 100 if total else 0.0
+        return f"{self.hits} hit, {self.misses} miss ({ratio:.1f}% hit)"
+
+# ===============================
+# CACHE HASIL PER TAHAP PIPELINE
+# ===============================
+def file_digest(path, block_size=1 << 20):
+    """Hash isi file (hex), dibaca per blok agar hemat memori"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def fingerprint(*parts):
+    """
+    Fingerprint input sebuah tahap (hex)
+
+    Parts bisa berupa fingerprint tahap sebelumnya, hash file, atau
+    parameter (dict/tuple/angka); semuanya di-hash lewat repr().
+    """
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+class StageCache:
+    """
+    Cache persisten untuk output setiap tahap pipeline
+
+    Setiap tahap disimpan di folder sendiri bersama fingerprint input-nya:
+    - matriks sparse -> <nama>.npz (scipy.sparse.save_npz)
+    - array NumPy    -> arrays.npz
+    - objek lain     -> objects.pkl (DataFrame, model, dll.)
+    Tahap dilewati hanya jika fingerprint yang tersimpan sama persis.
+    Karena fingerprint tahap berikutnya memuat fingerprint tahap
+    sebelumnya, perubahan di hulu otomatis membatalkan tahap di hilir.
+
+    folder=None mematikan cache (semua tahap selalu dihitung).
+    """
+
+    META_FILE = "meta.pkl"
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.status = {}
+
+    def _stage_dir(self, stage):
+        return os.path.join(self.folder, stage)
+
+    def load(self, stage, fingerprint):
+        """Output tahap dari disk (dict), atau None jika tidak ada/kedaluwarsa"""
+        if self.folder is None:
+            return None
+
+        stage_dir = self._stage_dir(stage)
+        try:
+            with open(os.path.join(stage_dir, self.META_FILE), "rb") as f:
+                meta = pickle.load(f)
+            if meta["fingerprint"] != fingerprint:
+                return None
+
+            outputs = {}
+            for name in meta["sparse"]:
+                outputs[name] = sp.load_npz(os.path.join(stage_dir, f"{name}.npz"))
+            if meta["arrays"]:
+                with np.load(os.path.join(stage_dir, "arrays.npz"), allow_pickle=False) as arrays:
+                    outputs.update({name: arrays[name] for name in meta["arrays"]})
+            if meta["objects"]:
+                with open(os.path.join(stage_dir, "objects.pkl"), "rb") as f:
+                    outputs.update(pickle.load(f))
+            return outputs
+        except Exception:
+            # Belum ada / rusak / format lama -> hitung ulang
+            return None
+
+    def save(self, stage, fingerprint, outputs):
+        """Simpan output tahap; meta ditulis terakhir agar penulisan atomik"""
+        if self.folder is None:
+            return
+
+        stage_dir = self._stage_dir(stage)
+        os.makedirs(stage_dir, exist_ok=True)
+        meta_path = os.path.join(stage_dir, self.META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        sparse, arrays, objects = [], {}, {}
+        for name, value in outputs.items():
+            if sp.issparse(value):
+                sp.save_npz(os.path.join(stage_dir, f"{name}.npz"), value)
+                sparse.append(name)
+            elif isinstance(value, np.ndarray) and value.dtype != object:
+                arrays[name] = value
+            else:
+                objects[name] = value
+
+        if arrays:
+            np.savez(os.path.join(stage_dir, "arrays.npz"), **arrays)
+        if objects:
+            with open(os.path.join(stage_dir, "objects.pkl"), "wb") as f:
+                pickle.dump(objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        meta = {
+            "fingerprint": fingerprint,
+            "sparse": sparse,
+            "arrays": list(arrays),
+            "objects": list(objects),
+        }
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, meta_path)
+
+    def run(self, stage, fingerprint, compute):
+        """
+        Ambil output tahap dari cache, atau jalankan compute() lalu simpan
+
+        Parameters:
+        - stage: nama tahap (nama folder)
+        - fingerprint: fingerprint input tahap
+        - compute: fungsi tanpa argumen yang mengembalikan dict output
+
+        Returns:
+        - dict output tahap
+        """
+        outputs = self.load(stage, fingerprint)
+        if outputs is not None:
+            self.status[stage] = "cache"
+            return outputs
+
+        outputs = compute()
+        self.save(stage, fingerprint, outputs)
+        self.status[stage] = "dihitung"
+        return outputs
+
+    def stats(self):
+        """Ringkasan status tiap tahap untuk ditampilkan di log"""
+        return ", ".join(f"{stage}: {status}" for stage, status in self.status.items())
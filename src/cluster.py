@@ -1,6 +1,103 @@
-from sklearn.cluster import KMeans
+import numpy as np
+import pandas as pd
+
+from kmeans import KMeans, MiniBatchKMeans, SphericalKMeans
+
+# Di atas jumlah baris ini algorithm="auto" memakai mini-batch
+MINIBATCH_THRESHOLD = 10000
+
+# Versi hasil clustering untuk fingerprint cache tahap "kmeans"; naikkan
+# jika label/centroid untuk input yang sama berubah
+CLUSTER_VERSION = 2
+
+def run_kmeans(X, k=3, algorithm="full", batch_size=1024, max_no_improvement=10,
+               reassignment_ratio=0.01, minibatch_threshold=MINIBATCH_THRESHOLD,
+               random_state=42):
+    """
+    Clustering K-Means pada matriks TF-IDF (sparse)
+
+    Parameters:
+    - X: matriks TF-IDF dari vectorize_text
+    - k: jumlah cluster
+    - algorithm: "full" (K-Means biasa), "minibatch", atau "auto"
+      (mini-batch jika jumlah baris >= minibatch_threshold)
+    - batch_size, max_no_improvement, reassignment_ratio: parameter mode
+      mini-batch
+    - random_state: seed inisialisasi centroid
+
+    Returns:
+    - model: object KMeans/MiniBatchKMeans yang sudah di-fit
+    - labels: label cluster tiap baris
+    """
+    if algorithm == "auto":
+        algorithm = "minibatch" if X.shape[0] >= minibatch_threshold else "full"
+
+    if algorithm == "minibatch":
+        model = MiniBatchKMeans(
+            n_clusters=k,
+            random_state=random_state,
+            batch_size=batch_size,
+            max_no_improvement=max_no_improvement,
+            reassignment_ratio=reassignment_ratio
+        )
+    elif algorithm == "full":
+        model = KMeans(n_clusters=k, random_state=random_state)
+    else:
+        raise ValueError(f"algorithm tidak dikenal: {algorithm}")
 
-def run_kmeans(X, k=3):
-    model = KMeans(n_clusters=k, random_state=42)
     labels = model.fit_predict(X)
     return model, labels
+
+def run_review_clustering(X, wisata, k=3, random_state=42):
+    """
+    Clustering per review dengan spherical (cosine) K-Means
+
+    Parameters:
+    - X: matriks TF-IDF per review (sparse, satu baris per review)
+    - wisata: nama tempat untuk setiap baris X
+    - k: jumlah cluster
+    - random_state: seed inisialisasi centroid
+
+    Returns:
+    - model: SphericalKMeans yang sudah di-fit
+    - labels: label cluster tiap review (-1 = baris TF-IDF nol, tanpa cluster)
+    - distribution: DataFrame distribusi cluster per tempat (lihat rollup_clusters)
+    """
+    model = SphericalKMeans(n_clusters=k, random_state=random_state)
+    labels = model.fit_predict(X)
+    distribution = rollup_clusters(wisata, labels, k)
+    return model, labels, distribution
+
+def rollup_clusters(wisata, labels, k):
+    """
+    Ringkas label per review menjadi distribusi cluster per tempat
+
+    Review berlabel -1 (tanpa cluster) tidak ikut dihitung di proporsi,
+    hanya dilaporkan di kolom n_tanpa_cluster.
+
+    Returns:
+    - DataFrame [wisata, n_reviews, n_tanpa_cluster, proporsi_c0..proporsi_c{k-1},
+      cluster] dengan cluster = cluster dominan tempat tersebut (-1 jika
+      tidak ada review yang punya cluster)
+    """
+    wisata = pd.Series(wisata, name="wisata").to_numpy()
+    labels = np.asarray(labels)
+    assigned = labels >= 0
+    places = pd.Index(wisata).dropna().unique().sort_values()
+
+    counts = pd.crosstab(wisata[assigned], labels[assigned])
+    counts = counts.reindex(index=places, columns=range(k), fill_value=0)
+
+    n_reviews = pd.Series(wisata).value_counts().reindex(places, fill_value=0)
+    n_assigned = counts.sum(axis=1)
+    proportions = counts.div(n_assigned.where(n_assigned > 0), axis=0).fillna(0.0)
+    proportions.columns = [f"proporsi_c{c}" for c in range(k)]
+
+    distribution = proportions.copy()
+    distribution.insert(0, "n_reviews", n_reviews.to_numpy())
+    distribution.insert(1, "n_tanpa_cluster", (n_reviews - n_assigned).to_numpy())
+    distribution["cluster"] = np.where(
+        n_assigned.to_numpy() > 0, counts.to_numpy().argmax(axis=1), -1
+    )
+    distribution.index.name = "wisata"
+    return distribution.reset_index()
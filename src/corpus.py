@@ -0,0 +1,156 @@
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+# ===============================
+# KORPUS TERTOKENISASI
+# ===============================
+class TokenizedCorpus:
+    """
+    Korpus yang ditokenisasi sekali dan dipakai ulang oleh semua tahap
+
+    Semua token disimpan sebagai satu array id (int32) ditambah offset
+    awal tiap dokumen, dengan kosakata bersama. Vectorizer dan fungsi
+    analyzer membaca array ini langsung, sehingga teks besar tidak perlu
+    di-lowercase/split berulang kali.
+
+    Atribut:
+    - token_ids: array id token seluruh dokumen (berurutan)
+    - offsets: array n_docs + 1, token dokumen i = token_ids[offsets[i]:offsets[i+1]]
+    - vocabulary: array kata, vocabulary[id] = kata
+    """
+
+    def __init__(self, token_ids, offsets, vocabulary):
+        self.token_ids = token_ids
+        self.offsets = offsets
+        self.vocabulary = vocabulary
+        self._vocabulary_index = None
+
+    @classmethod
+    def from_texts(cls, texts):
+        """Tokenisasi (lowercase + split spasi) banyak teks sekaligus"""
+        split = [text.lower().split() for text in texts]
+        lengths = np.fromiter(map(len, split), dtype=np.int64, count=len(split))
+        tokens = np.fromiter(chain.from_iterable(split), dtype=object, count=int(lengths.sum()))
+
+        codes, vocabulary = pd.factorize(tokens)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        return cls(codes.astype(np.int32), offsets, np.asarray(vocabulary, dtype=object))
+
+    @property
+    def n_docs(self):
+        return len(self.offsets) - 1
+
+    @property
+    def vocabulary_index(self):
+        """dict {kata: id}"""
+        if self._vocabulary_index is None:
+            self._vocabulary_index = {w: i for i, w in enumerate(self.vocabulary)}
+        return self._vocabulary_index
+
+    def doc_ids(self):
+        """Id dokumen untuk setiap token"""
+        return np.repeat(np.arange(self.n_docs), np.diff(self.offsets))
+
+    def doc_tokens(self, i):
+        """List kata dokumen ke-i"""
+        return self.vocabulary[self.token_ids[self.offsets[i]:self.offsets[i + 1]]].tolist()
+
+    def group(self, keys):
+        """
+        Gabungkan dokumen per key (mis. wisata), urutan token dipertahankan
+
+        Setara dengan df.groupby(keys) lalu " ".join per grup: key
+        diurutkan dan key kosong (NaN) dibuang.
+
+        Returns:
+        - group_keys: array key terurut
+        - corpus: TokenizedCorpus satu dokumen per key
+        """
+        codes, group_keys = pd.factorize(pd.Series(keys).to_numpy(), sort=True)
+        token_group = codes[self.doc_ids()]
+
+        keep = token_group >= 0
+        token_group = token_group[keep]
+        # Sort stabil menjaga urutan asli token di dalam grup
+        order = np.argsort(token_group, kind="stable")
+        token_ids = self.token_ids[keep][order]
+
+        sizes = np.bincount(token_group, minlength=len(group_keys))
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        return np.asarray(group_keys), TokenizedCorpus(token_ids, offsets, self.vocabulary)
+
+    def count_matrix(self):
+        """Matriks count unigram (n_docs x n_vocab, CSR)"""
+        # Salin index: sum_duplicates mengurutkan index secara in-place
+        X = sp.csr_matrix(
+            (np.ones(len(self.token_ids), dtype=np.int64), self.token_ids.copy(), self.offsets.copy()),
+            shape=(self.n_docs, len(self.vocabulary))
+        )
+        X.sum_duplicates()
+        return X
+
+    def ngrams(self, n):
+        """
+        Semua n-gram (n >= 2) yang tidak melewati batas dokumen
+
+        Returns:
+        - doc_ids: dokumen untuk tiap kemunculan n-gram
+        - gram_ids: id n-gram (0..n_grams-1) untuk tiap kemunculan
+        - names: nama n-gram ("kata1 kata2 ...") per id
+        """
+        doc_of = self.doc_ids()
+        n_tokens = len(self.token_ids)
+        if n_tokens < n:
+            return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, dtype=object)
+
+        # Posisi awal yang n-gram-nya masih di dokumen yang sama
+        starts = np.where(doc_of[:n_tokens - n + 1] == doc_of[n - 1:])[0]
+
+        # Id n-gram dibangun bertahap: kode (n-1)-gram * V + token berikutnya
+        vocab_size = len(self.vocabulary)
+        codes = self.token_ids[starts].astype(np.int64)
+        for step in range(1, n):
+            codes = codes * vocab_size + self.token_ids[starts + step]
+            codes, _ = pd.factorize(codes)
+            codes = codes.astype(np.int64)
+
+        n_grams = codes.max() + 1 if len(codes) else 0
+        first = np.full(n_grams, -1, dtype=np.int64)
+        # Posisi contoh untuk tiap n-gram (untuk membangun namanya)
+        first[codes[::-1]] = starts[::-1]
+        # Nama dibangun per kolom kata (operasi array object), bukan per n-gram
+        words = self.vocabulary
+        names = words[self.token_ids[first]]
+        for step in range(1, n):
+            names = names + " " + words[self.token_ids[first + step]]
+        return doc_of[starts], codes, names
+
+    def ngram_matrix(self, ngram_range=(1, 2)):
+        """
+        Matriks count n-gram untuk vectorizer
+
+        Returns:
+        - counts: sparse matrix (n_docs x n_terms)
+        - terms: nama term per kolom
+        """
+        min_n, max_n = ngram_range
+        blocks = []
+        names = []
+        for n in range(min_n, max_n + 1):
+            if n == 1:
+                blocks.append(self.count_matrix())
+                names.append(self.vocabulary)
+                continue
+            doc_ids, gram_ids, gram_names = self.ngrams(n)
+            block = sp.csr_matrix(
+                (np.ones(len(gram_ids), dtype=np.int64), (doc_ids, gram_ids)),
+                shape=(self.n_docs, len(gram_names))
+            )
+            blocks.append(block)
+            names.append(gram_names)
+
+        counts = sp.hstack(blocks, format="csr")
+        return counts, np.concatenate(names)
@@ -0,0 +1,106 @@
+"""
+Cache LRU untuk panel detail tempat di GUI
+
+Dua level, keduanya dengan key nama wisata:
+- data detail : baris hasil clustering, jumlah review, dan halaman review
+                pertama (dibatasi jumlah item dan perkiraan ukuran byte)
+- frame detail: frame detail yang sudah dibangun; saat pindah tempat frame
+                hanya disembunyikan (pack_forget), dan baru di-destroy saat
+                tergeser dari cache
+
+Membuka lagi tempat yang baru dilihat cukup menampilkan ulang frame-nya.
+"""
+
+from collections import OrderedDict
+
+# Batas cache data detail (jumlah tempat, perkiraan byte teks review)
+DETAIL_DATA_ITEMS = 256
+DETAIL_DATA_BYTES = 32 * 1024 * 1024
+
+# Batas frame detail yang disimpan (widget Tk jauh lebih mahal dari data)
+DETAIL_FRAME_ITEMS = 12
+
+# Perkiraan ukuran satu baris hasil (tanpa teks review)
+ROW_BYTES = 1024
+
+class LRUCache:
+    """
+    Cache LRU dengan batas jumlah item dan (opsional) total ukuran
+
+    Parameters:
+    - max_items: jumlah item maksimum
+    - max_bytes: total ukuran maksimum (None = tanpa batas ukuran)
+    - sizeof: fungsi (value) -> perkiraan ukuran byte, wajib jika max_bytes diisi
+    - on_evict: callback(key, value) saat item tergeser atau cache di-clear
+    """
+
+    def __init__(self, max_items, max_bytes=None, sizeof=None, on_evict=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self._items = OrderedDict()
+        self._sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def values(self):
+        return list(self._items.values())
+
+    def get(self, key, default=None):
+        """Ambil item dan tandai sebagai yang terakhir dipakai"""
+        if key not in self._items:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, value):
+        """Simpan item (mengganti yang lama), lalu geser item terlama jika melebihi batas"""
+        self.pop(key)
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        self._items[key] = value
+        self._sizes[key] = size
+        self.bytes += size
+
+        # Item yang baru disimpan tidak pernah ikut tergeser
+        while len(self._items) > 1 and (
+            len(self._items) > self.max_items
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            old_key, old_value = self._items.popitem(last=False)
+            self.bytes -= self._sizes.pop(old_key)
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+
+    def pop(self, key, default=None):
+        """Keluarkan item tanpa on_evict (pemanggil yang mengurus value)"""
+        if key not in self._items:
+            return default
+        self.bytes -= self._sizes.pop(key)
+        return self._items.pop(key)
+
+    def clear(self):
+        """Kosongkan cache (on_evict dipanggil untuk semua item)"""
+        items = list(self._items.items())
+        self._items.clear()
+        self._sizes.clear()
+        self.bytes = 0
+        if self.on_evict is not None:
+            for key, value in items:
+                self.on_evict(key, value)
+
+    def stats(self):
+        return {"items": len(self._items), "bytes": self.bytes, "hits": self.hits, "misses": self.misses}
+
+def detail_data_size(data):
+    """Perkiraan ukuran data detail: baris hasil + teks halaman review pertama"""
+    return ROW_BYTES + sum(len(review) for review in data["first_page"] or [])
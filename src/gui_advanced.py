@@ -1,6 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
+
+from results_io import (
+    load_results, load_cluster_detail, results_exist, saved_format, load_run_config
+)
+from review_store import open_review_store
+from review_view import PagedReviewList, PAGE_SIZE
+from query import PlaceIndex, SearchWorker, SEARCH_DEBOUNCE_MS, SEARCH_POLL_MS
+from background import run_in_thread, PipelineProcess, POLL_MS
+from progress_view import ProgressPanel
+from recluster_view import ReclusterDialog, k_range
+from detail_cache import (
+    LRUCache, detail_data_size, DETAIL_DATA_ITEMS, DETAIL_DATA_BYTES, DETAIL_FRAME_ITEMS
+)
 
 class WisataClusteringAdvancedGUI:
     """
@@ -36,27 +48,106 @@ class WisataClusteringAdvancedGUI:
         # Filter state
         self.current_filter = {'cluster': 'all', 'kategori': 'all'}
         
-        # Load data
-        self.load_data()
+        # Search state (after-id debounce, after-id polling, callback)
+        self._search_after = None
+        self._search_poll = None
+        self._search_done = None
+        
+        # Data di-load di latar belakang; review store baru dibuka saat
+        # detail tempat pertama kali ditampilkan
+        self.df_hasil = None
+        self.df_cluster = None
+        self.review_store = None
+        self._review_loading = False
+        self._pending_reviews = {}
+        self.stat_labels = {}
+        self.current_wisata = None
+        self.recluster_job = None
+        
+        # Cache LRU panel detail: data per tempat + frame yang sudah dibangun
+        self.detail_data = LRUCache(
+            DETAIL_DATA_ITEMS, DETAIL_DATA_BYTES, sizeof=detail_data_size
+        )
+        self.detail_frames = LRUCache(
+            DETAIL_FRAME_ITEMS, on_evict=lambda name, frame: frame.destroy()
+        )
         
-        # Setup UI
-        self.setup_ui()
+        # Window langsung tampil dengan panel progres, UI utama dibangun
+        # setelah hasil clustering selesai di-load
+        self.loading = ProgressPanel(self.root, self.colors, "🏝️ Clustering Wisata Balikpapan")
+        self.loading.pack(fill='both', expand=True)
+        
+        if results_exist("../outputs"):
+            self.load_data()
+        else:
+            self.run_clustering()
         
     def load_data(self):
-        """Load data dari CSV"""
+        """Load hasil clustering di thread latar (window sudah tampil)"""
+        self.loading.set_status("📂 Memuat hasil clustering...")
+        self.loading.set_progress(None)
+        run_in_thread(self.root, self._read_results, self.on_data_loaded, self.on_load_error)
+    
+    def _read_results(self):
+        """Baca hasil + bangun index pencarian (jalan di thread latar)"""
+        df_hasil = load_results("../outputs")
+        
+        # Index pencarian/filter daftar tempat (dibangun sekali)
+        place_index = PlaceIndex(
+            df_hasil,
+            sort_by=("cluster",),
+            format_row=lambda row: (
+                f"{self.get_kategori_emoji(row['kategori'])} [C{row['cluster']}] {row['wisata']}"
+            )
+        )
+        
+        # Load detail cluster
         try:
-            self.df_hasil = pd.read_csv("../outputs/hasil_cluster_per_tempat.csv")
-            self.df_raw = pd.read_csv("../data/raw/wisata_balikpapan.csv")
-            
-            try:
-                self.df_cluster = pd.read_csv("../outputs/detail_cluster.csv")
-            except:
-                self.df_cluster = None
-                
-        except Exception as e:
+            df_cluster = load_cluster_detail("../outputs")
+        except:
+            df_cluster = None
+        
+        return df_hasil, df_cluster, place_index
+    
+    def on_data_loaded(self, data):
+        """Pasang data hasil load lalu bangun UI utama"""
+        self.df_hasil, self.df_cluster, self.place_index = data
+        self.visible_rows = self.place_index.order
+        self.search_worker = SearchWorker(self.place_index)
+        
+        self.loading.destroy()
+        self.setup_ui()
+    
+    def on_load_error(self, e):
+        messagebox.showerror("Error", 
+            f"Gagal load data: {str(e)}\n\n"
+            "Pastikan sudah menjalankan main.py terlebih dahulu!"
+        )
+        self.root.quit()
+    
+    def run_clustering(self):
+        """Hasil belum ada: jalankan clustering di proses terpisah"""
+        self.loading.set_status("⚙️ Hasil belum ada, menjalankan clustering...")
+        self.loading.set_progress(0)
+        self.pipeline = PipelineProcess().start()
+        self.root.after(POLL_MS, self._poll_clustering)
+    
+    def _poll_clustering(self):
+        """Update panel progres dari proses clustering"""
+        self.loading.add_log(self.pipeline.poll())
+        if self.pipeline.progress is not None:
+            self.loading.set_progress(self.pipeline.progress)
+            self.loading.set_status(f"⚙️ {self.pipeline.step_text}")
+        
+        if self.pipeline.state == "running":
+            self.root.after(POLL_MS, self._poll_clustering)
+        elif self.pipeline.state == "done":
+            self.load_data()
+        else:
+            # Traceback lengkap dari proses clustering ada di bagian detail dialog
             messagebox.showerror("Error", 
-                f"Gagal load data: {str(e)}\n\n"
-                "Pastikan sudah menjalankan main.py terlebih dahulu!"
+                f"Gagal menjalankan clustering:\n\n{self.pipeline.error.strip().splitlines()[-1]}",
+                detail=self.pipeline.error
             )
             self.root.quit()
     
@@ -105,7 +196,7 @@ class WisataClusteringAdvancedGUI:
         stats = [
             ("📍 Tempat", len(self.df_hasil)),
             ("🏷️ Cluster", self.df_hasil['cluster'].nunique()),
-            ("💬 Review", len(self.df_raw))
+            ("💬 Review", len(self.review_store) if self.review_store is not None else "…")
         ]
         
         for label, value in stats:
@@ -113,13 +204,15 @@ class WisataClusteringAdvancedGUI:
                               relief='flat', bd=0)
             stat_box.pack(side='left', padx=5)
             
-            tk.Label(
+            value_label = tk.Label(
                 stat_box,
                 text=str(value),
                 font=('Segoe UI', 20, 'bold'),
                 bg=self.colors['secondary'],
                 fg=self.colors['white']
-            ).pack(padx=15, pady=(10, 0))
+            )
+            value_label.pack(padx=15, pady=(10, 0))
+            self.stat_labels[label] = value_label
             
             tk.Label(
                 stat_box,
@@ -195,6 +288,20 @@ class WisataClusteringAdvancedGUI:
             command=self.reset_filters
         )
         reset_btn.pack(side='left', padx=5)
+        
+        # Re-cluster button (K / stopwords baru tanpa restart GUI)
+        self.recluster_btn = tk.Button(
+            toolbar,
+            text="⚙️ Cluster Ulang",
+            font=('Segoe UI', 10),
+            bg=self.colors['warning'],
+            fg=self.colors['white'],
+            relief='flat',
+            padx=15,
+            cursor='hand2',
+            command=self.open_recluster_dialog
+        )
+        self.recluster_btn.pack(side='left', padx=5)
     
     def create_sidebar(self, parent):
         """Create sidebar with list"""
@@ -263,7 +370,6 @@ class WisataClusteringAdvancedGUI:
         self.wisata_listbox.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.wisata_listbox.yview)
         
-        self.populate_listbox()
         self.wisata_listbox.bind('<<ListboxSelect>>', self.on_select_wisata)
         
         # Count label
@@ -276,6 +382,9 @@ class WisataClusteringAdvancedGUI:
             pady=8
         )
         self.count_label.pack(fill='x', side='bottom')
+        
+        # Populate listbox - setelah count_label dibuat
+        self.populate_listbox()
     
     def create_detail_panel(self, parent):
         """Create detail panel"""
@@ -308,6 +417,7 @@ class WisataClusteringAdvancedGUI:
         
         canvas.create_window((0, 0), window=self.detail_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+        self.detail_canvas = canvas
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -333,34 +443,68 @@ class WisataClusteringAdvancedGUI:
             anchor='w'
         )
         self.status_label.pack(side='left', padx=15, fill='x', expand=True)
+        
+        # Progress clustering ulang (hanya tampil saat berjalan)
+        self.status_progress = ttk.Progressbar(status, length=180, maximum=1.0)
     
-    def populate_listbox(self, filtered_df=None):
-        """Populate listbox"""
+    def populate_listbox(self, rows=None):
+        """Populate listbox with wisata data (id baris dari place_index)"""
         self.wisata_listbox.delete(0, tk.END)
         
-        df = filtered_df if filtered_df is not None else self.df_hasil
+        if rows is None:
+            rows = self.place_index.order
+        self.visible_rows = rows
         
-        for idx, row in df.sort_values('cluster').iterrows():
-            emoji = self.get_kategori_emoji(row['kategori'])
-            display = f"{emoji} [C{row['cluster']}] {row['wisata']}"
-            self.wisata_listbox.insert(tk.END, display)
+        # Format: emoji [Cluster] Nama (teks sudah disiapkan di index)
+        lines = self.place_index.lines(rows)
+        if lines:
+            self.wisata_listbox.insert(tk.END, *lines)
         
-        self.count_label.config(text=f"Menampilkan: {len(df)} tempat")
+        # Update count
+        self.count_label.config(text=f"Menampilkan: {len(rows)} tempat")
     
     def filter_list(self, *args):
-        """Filter list based on search"""
-        search = self.search_var.get().lower()
-        filtered = self.df_hasil[
-            self.df_hasil['wisata'].str.lower().str.contains(search)
-        ]
+        """Jadwalkan pencarian (debounce: query jalan setelah user berhenti mengetik)"""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DEBOUNCE_MS, self.run_search)
+    
+    def run_search(self, on_done=None):
+        """
+        Kirim query (search + filter) ke worker thread
+        
+        Parameters:
+        - on_done: callback(rows) setelah listbox diisi hasil query ini
+        """
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+            self._search_after = None
+        
+        self.search_worker.submit(
+            self.search_var.get(),
+            cluster=self.current_filter['cluster'],
+            kategori=self.current_filter['kategori']
+        )
+        self._search_done = on_done
+        if self._search_poll is None:
+            self._search_poll = self.root.after(SEARCH_POLL_MS, self._poll_search)
+    
+    def _poll_search(self):
+        """Ambil hasil dari worker di thread Tk (hasil usang sudah dibuang worker)"""
+        result = self.search_worker.poll()
+        if result is None:
+            self._search_poll = self.root.after(SEARCH_POLL_MS, self._poll_search)
+            return
+        self._search_poll = None
         
-        # Apply existing filters
-        if self.current_filter['cluster'] != 'all':
-            filtered = filtered[filtered['cluster'] == self.current_filter['cluster']]
-        if self.current_filter['kategori'] != 'all':
-            filtered = filtered[filtered['kategori'] == self.current_filter['kategori']]
+        _, rows, error = result
+        if error is not None:
+            self.status_label.config(text=f"❌ Pencarian gagal: {error}")
+            return
         
-        self.populate_listbox(filtered)
+        self.populate_listbox(rows)
+        if self._search_done is not None:
+            self._search_done(rows)
     
     def apply_filters(self, event=None):
         """Apply cluster and kategori filters"""
@@ -378,22 +522,12 @@ class WisataClusteringAdvancedGUI:
         else:
             self.current_filter['kategori'] = kategori_val
         
-        # Apply filters
-        filtered = self.df_hasil.copy()
-        
-        if self.current_filter['cluster'] != 'all':
-            filtered = filtered[filtered['cluster'] == self.current_filter['cluster']]
-        
-        if self.current_filter['kategori'] != 'all':
-            filtered = filtered[filtered['kategori'] == self.current_filter['kategori']]
-        
-        # Apply search if any
-        search = self.search_var.get().lower()
-        if search:
-            filtered = filtered[filtered['wisata'].str.lower().str.contains(search)]
-        
-        self.populate_listbox(filtered)
-        self.status_label.config(text=f"✅ Filter diterapkan: {len(filtered)} hasil")
+        # Apply filters (termasuk search), status diupdate setelah hasil masuk
+        self.run_search(
+            on_done=lambda rows: self.status_label.config(
+                text=f"✅ Filter diterapkan: {len(rows)} hasil"
+            )
+        )
     
     def reset_filters(self):
         """Reset all filters"""
@@ -401,9 +535,121 @@ class WisataClusteringAdvancedGUI:
         self.kategori_filter.set('Semua')
         self.search_var.set('')
         self.current_filter = {'cluster': 'all', 'kategori': 'all'}
-        self.populate_listbox()
+        self.run_search()
         self.status_label.config(text="✅ Filter direset")
     
+    def open_recluster_dialog(self):
+        """Dialog parameter clustering ulang (default: konfigurasi run terakhir)"""
+        if self.recluster_job is not None:
+            return
+        last = load_run_config("../outputs")
+        ReclusterDialog(
+            self.root,
+            self.colors,
+            k=last.get('k', self.df_hasil['cluster'].nunique()),
+            stopwords=last.get('extra_stopwords') or [],
+            on_submit=self.start_recluster,
+            max_k=k_range(len(self.df_hasil))[1]
+        )
+    
+    def start_recluster(self, k, stopwords):
+        """
+        Jalankan pipeline di proses terpisah dengan K/stopwords baru
+        
+        Tahap yang input-nya tidak berubah diambil dari cache tahap
+        (main.run_pipeline), mis. hanya mengganti K tidak menghitung ulang
+        cleaning, TF-IDF, maupun analisis sentimen/tema.
+        """
+        min_k, max_k = k_range(len(self.df_hasil))
+        if not min_k <= k <= max_k:
+            messagebox.showwarning(
+                "Input tidak valid", f"K harus {min_k}-{max_k} untuk {len(self.df_hasil)} tempat"
+            )
+            return
+        
+        self.recluster_job = PipelineProcess({
+            'k': k,
+            'extra_stopwords': stopwords,
+            'output_dir': "../outputs",
+            'output_format': saved_format("../outputs")
+        }).start()
+        
+        self.recluster_btn.config(state='disabled')
+        self.status_progress.config(value=0)
+        self.status_progress.pack(side='right', padx=15)
+        self.status_label.config(text=f"⚙️ Clustering ulang (K={k})...")
+        self.root.after(POLL_MS, self._poll_recluster)
+    
+    def _poll_recluster(self):
+        """Update status bar dari proses clustering ulang"""
+        job = self.recluster_job
+        job.poll()
+        if job.progress is not None:
+            self.status_progress.config(value=job.progress)
+            self.status_label.config(text=f"⚙️ Clustering ulang: {job.step_text}")
+        
+        if job.state == "running":
+            self.root.after(POLL_MS, self._poll_recluster)
+        elif job.state == "done":
+            self.status_label.config(text="📂 Memuat hasil clustering baru...")
+            run_in_thread(self.root, self._read_results, self.on_recluster_loaded, self.on_recluster_error)
+        else:
+            self.on_recluster_error(job.error.strip().splitlines()[-1], detail=job.error)
+    
+    def on_recluster_loaded(self, data):
+        """Ganti data lama dengan hasil baru tanpa membangun ulang UI"""
+        k = self.recluster_job.config['k']
+        self.df_hasil, self.df_cluster, self.place_index = data
+        
+        # Query berikutnya memakai index baru (hasil query lama dibuang worker)
+        self.search_worker.index = self.place_index
+        
+        # Cache detail berisi data lama (frame ikut di-destroy)
+        self.detail_data.clear()
+        self.detail_frames.clear()
+        
+        # Pilihan filter
+        clusters = ['Semua'] + [f"Cluster {i}" for i in sorted(self.df_hasil['cluster'].unique())]
+        kategori = ['Semua'] + sorted(self.df_hasil['kategori'].unique().tolist())
+        self.cluster_filter.config(values=clusters)
+        self.kategori_filter.config(values=kategori)
+        if self.cluster_filter.get() not in clusters:
+            self.cluster_filter.set('Semua')
+            self.current_filter['cluster'] = 'all'
+        if self.kategori_filter.get() not in kategori:
+            self.kategori_filter.set('Semua')
+            self.current_filter['kategori'] = 'all'
+        
+        # Statistik
+        self.stat_labels["📍 Tempat"].config(text=str(len(self.df_hasil)))
+        self.stat_labels["🏷️ Cluster"].config(text=str(self.df_hasil['cluster'].nunique()))
+        
+        # Daftar tempat: isi langsung (tanpa filter), lalu terapkan filter aktif
+        self.populate_listbox(self.place_index.order)
+        self.run_search()
+        
+        # Detail tempat yang sedang dibuka
+        if self.current_wisata in self.place_index.positions:
+            self.show_detail(self.current_wisata)
+        else:
+            self.show_welcome()
+        
+        self._finish_recluster()
+        self.status_label.config(
+            text=f"✅ Clustering ulang selesai: K={k}, {len(self.df_hasil)} tempat"
+        )
+    
+    def on_recluster_error(self, e, detail=None):
+        """detail: traceback lengkap dari proses clustering (jika ada)"""
+        self._finish_recluster()
+        self.status_label.config(text="❌ Clustering ulang gagal")
+        messagebox.showerror("Error", f"Gagal menjalankan clustering ulang:\n\n{e}", detail=detail)
+    
+    def _finish_recluster(self):
+        self.recluster_job = None
+        self.recluster_btn.config(state='normal')
+        self.status_progress.pack_forget()
+    
     def show_welcome(self):
         """Show welcome message"""
         for widget in self.detail_frame.winfo_children():
@@ -441,38 +687,72 @@ class WisataClusteringAdvancedGUI:
         if not selection:
             return
         
-        selected = self.wisata_listbox.get(selection[0])
-        # Extract name
-        parts = selected.split('] ', 1)
-        if len(parts) > 1:
-            name = parts[1]
-        else:
-            name = selected
+        # Nama wisata dari id baris yang sedang tampil
+        name = self.place_index.names[self.visible_rows[selection[0]]]
         
         self.show_detail(name)
         self.status_label.config(text=f"✅ Menampilkan: {name}")
     
     def show_detail(self, wisata_name):
-        """Show detail for selected wisata"""
-        for widget in self.detail_frame.winfo_children():
-            widget.destroy()
+        """Show detail for selected wisata (frame dari cache LRU jika ada)"""
+        main = self.detail_frames.get(wisata_name)
         
-        # Get data
-        data = self.df_hasil[self.df_hasil['wisata'] == wisata_name].iloc[0]
-        reviews = self.df_raw[self.df_raw['wisata'] == wisata_name]['review'].tolist()
+        # Frame yang ada di cache hanya disembunyikan
+        cached = self.detail_frames.values()
+        for widget in self.detail_frame.winfo_children():
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
         
         # Update header
         self.detail_header.config(text=f"📍 {wisata_name}")
+        self.current_wisata = wisata_name
         
-        # Main container
-        main = tk.Frame(self.detail_frame, bg=self.colors['white'])
-        main.pack(fill='both', expand=True, padx=25, pady=20)
-        
-        # Info cards
-        self.create_info_cards(main, data)
+        if main is None:
+            # Get data
+            data = self.get_detail_data(wisata_name)
+            
+            # Main container
+            main = tk.Frame(self.detail_frame, bg=self.colors['white'])
+            
+            # Info cards
+            self.create_info_cards(main, data['row'])
+            
+            # Reviews section
+            self.create_reviews_section(main, wisata_name)
+            
+            self.detail_frames.put(wisata_name, main)
         
-        # Reviews section
-        self.create_reviews_section(main, reviews)
+        main.pack(fill='both', expand=True, padx=25, pady=20)
+    
+    def get_detail_data(self, wisata_name):
+        """
+        Data detail satu tempat (dari cache LRU jika ada)
+        
+        Returns:
+        - dict: row (baris df_hasil), n_reviews dan first_page (None
+          selama review store belum dibuka)
+        """
+        data = self.detail_data.get(wisata_name)
+        if data is None or (data['first_page'] is None and self.review_store is not None):
+            data = {
+                'row': self.df_hasil.iloc[self.place_index.positions[wisata_name]],
+                'n_reviews': None,
+                'first_page': None
+            }
+            if self.review_store is not None:
+                data['n_reviews'] = self.review_store.count(wisata_name)
+                data['first_page'] = self.review_store.reviews(wisata_name, 0, PAGE_SIZE)
+            self.detail_data.put(wisata_name, data)
+        return data
+    
+    def fetch_reviews(self, wisata_name, start, stop):
+        """Review satu halaman (halaman pertama dari cache data detail)"""
+        first_page = self.get_detail_data(wisata_name)['first_page']
+        if start == 0 and stop <= len(first_page):
+            return first_page[:stop]
+        return self.review_store.reviews(wisata_name, start, stop)
     
     def create_info_cards(self, parent, data):
         """Create info cards"""
@@ -577,53 +857,69 @@ class WisataClusteringAdvancedGUI:
         
         return card
     
-    def create_reviews_section(self, parent, reviews):
-        """Create reviews section"""
-        section = tk.Frame(parent, bg=self.colors['white'])
-        section.pack(fill='both', expand=True)
-        
-        # Header
-        header = tk.Frame(section, bg=self.colors['secondary'])
-        header.pack(fill='x')
-        
-        tk.Label(
-            header,
-            text=f"💬 Review Pengunjung ({len(reviews)} review)",
-            font=('Segoe UI', 12, 'bold'),
-            bg=self.colors['secondary'],
-            fg=self.colors['white'],
-            anchor='w'
-        ).pack(fill='x', padx=15, pady=10)
-        
-        # Reviews
-        for i, review in enumerate(reviews, 1):
-            review_card = tk.Frame(section, bg=self.colors['light'], 
-                                  relief='solid', bd=1)
-            review_card.pack(fill='x', pady=8)
-            
-            # Number badge
-            badge = tk.Label(
-                review_card,
-                text=f"#{i}",
-                font=('Segoe UI', 10, 'bold'),
-                bg=self.colors['info'],
-                fg=self.colors['white'],
-                padx=10,
-                pady=5
+    def create_reviews_section(self, parent, wisata_name):
+        """Create reviews section (per halaman, widget didaur ulang)"""
+        if self.review_store is None:
+            # Review store dibuka saat pertama dibutuhkan (di thread latar)
+            placeholder = tk.Label(
+                parent,
+                text="⏳ Memuat review...",
+                font=('Segoe UI', 11),
+                bg=self.colors['white'],
+                fg=self.colors['text_light']
             )
-            badge.pack(anchor='nw', padx=10, pady=10)
+            placeholder.pack(fill='x', pady=20)
+            self._pending_reviews[wisata_name] = placeholder
             
-            # Review text
-            tk.Label(
-                review_card,
-                text=review,
-                font=('Segoe UI', 11),
-                bg=self.colors['light'],
-                fg=self.colors['text'],
-                wraplength=700,
-                justify='left',
-                anchor='w'
-            ).pack(fill='x', padx=15, pady=(0, 15))
+            if not self._review_loading:
+                self._review_loading = True
+                run_in_thread(
+                    self.root,
+                    lambda: open_review_store("../data/raw/wisata_balikpapan.csv"),
+                    self.on_review_store_loaded,
+                    self.on_review_store_error
+                )
+            return
+        
+        PagedReviewList(
+            parent,
+            self.colors,
+            total=self.get_detail_data(wisata_name)['n_reviews'],
+            fetch=lambda start, stop: self.fetch_reviews(wisata_name, start, stop),
+            on_page=self.scroll_detail_to
+        ).pack(fill='both', expand=True)
+    
+    def on_review_store_loaded(self, store):
+        """Review store siap: isi section review yang sedang menunggu"""
+        self.review_store = store
+        self._review_loading = False
+        self.stat_labels["💬 Review"].config(text=str(len(store)))
+        
+        # Semua frame yang dibangun sebelum store siap (termasuk yang
+        # tersembunyi di cache detail) diisi review-nya
+        pending, self._pending_reviews = self._pending_reviews, {}
+        for wisata_name, placeholder in pending.items():
+            # Placeholder hilang jika frame-nya sudah tergeser dari cache
+            if placeholder.winfo_exists():
+                parent = placeholder.master
+                placeholder.destroy()
+                self.create_reviews_section(parent, wisata_name)
+    
+    def on_review_store_error(self, e):
+        self._review_loading = False
+        pending, self._pending_reviews = self._pending_reviews, {}
+        for wisata_name, placeholder in pending.items():
+            # Frame berisi pesan error tidak disimpan, dibangun ulang nanti
+            self.detail_frames.pop(wisata_name)
+            if placeholder.winfo_exists():
+                placeholder.config(text=f"❌ Gagal memuat review: {e}")
+
+    def scroll_detail_to(self, widget):
+        """Scroll panel detail sampai widget terlihat di atas"""
+        self.root.update_idletasks()
+        height = max(1, self.detail_frame.winfo_height())
+        y = widget.winfo_rooty() - self.detail_frame.winfo_rooty()
+        self.detail_canvas.yview_moveto(y / height)
     
     def get_kategori_emoji(self, kategori):
         """Get emoji for kategori"""
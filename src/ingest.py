@@ -0,0 +1,65 @@
+from collections import Counter
+
+import pandas as pd
+
+from preprocess import preprocess_series
+from tfidf import count_ngrams
+
+# ===============================
+# INGESTION CSV SECARA STREAMING
+# ===============================
+def stream_term_counts(path, chunksize=100_000, ngram_range=(1, 2),
+                       cache=None, n_jobs=1):
+    """
+    Baca CSV review per chunk dan akumulasi hitungan term per tempat
+
+    Hasilnya setara dengan menggabungkan semua review per tempat
+    (" ".join) lalu menghitung n-gram, tetapi tanpa pernah membuat string
+    gabungan: memori hanya sebesar kosakata per tempat.
+
+    Parameters:
+    - path: path CSV dengan kolom 'wisata' dan 'review'
+    - chunksize: jumlah baris per chunk
+    - ngram_range: n-gram yang dihitung (sama dengan vectorizer)
+    - cache: CleanCache opsional untuk preprocessing
+    - n_jobs: jumlah proses preprocessing per chunk
+
+    Returns:
+    - DataFrame [wisata, n_reviews, term_counts] terurut berdasarkan wisata
+    """
+    term_counts = {}
+    n_reviews = Counter()
+    # Token terakhir per tempat, untuk n-gram yang menyambung antar review
+    tails = {}
+    tail_len = ngram_range[1] - 1
+
+    for chunk in pd.read_csv(path, usecols=["wisata", "review"], chunksize=chunksize):
+        chunk = chunk.dropna(subset=["wisata"])
+        cleaned = preprocess_series(
+            chunk["review"], n_jobs=n_jobs, cache=cache, save_cache=False
+        )
+
+        for wisata, text in zip(chunk["wisata"], cleaned):
+            n_reviews[wisata] += 1
+            counts = term_counts.get(wisata)
+            if counts is None:
+                counts = term_counts[wisata] = Counter()
+
+            tokens = text.split()
+            if not tokens:
+                continue
+
+            context = tails.get(wisata, ())
+            count_ngrams(tokens, ngram_range, counts, context=context)
+            if tail_len > 0:
+                tails[wisata] = (list(context) + tokens)[-tail_len:]
+
+    if cache is not None:
+        cache.save()
+
+    places = sorted(term_counts)
+    return pd.DataFrame({
+        "wisata": places,
+        "n_reviews": [n_reviews[w] for w in places],
+        "term_counts": [term_counts[w] for w in places]
+    })
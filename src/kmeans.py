@@ -0,0 +1,471 @@
+import numpy as np
+import scipy.sparse as sp
+
+# ===============================
+# UTILITAS JARAK
+# ===============================
+def _as_float_matrix(X):
+    """CSR float64 untuk input sparse, ndarray float64 untuk input dense"""
+    if sp.issparse(X):
+        return sp.csr_matrix(X, dtype=np.float64)
+    return np.asarray(X, dtype=np.float64)
+
+def _row_sq_norms(X):
+    """||x||^2 per baris (sparse maupun dense)"""
+    if sp.issparse(X):
+        return np.asarray(X.multiply(X).sum(axis=1)).ravel()
+    return np.einsum("ij,ij->i", X, X)
+
+def _dot(X, centers):
+    """X @ centers.T sebagai array dense"""
+    product = X @ centers.T
+    return np.asarray(product)
+
+def squared_distances(X, centers, x_sq_norms=None):
+    """
+    Jarak Euclidean kuadrat setiap baris X ke setiap center
+
+    Returns:
+    - array (n_samples x n_centers)
+    """
+    if x_sq_norms is None:
+        x_sq_norms = _row_sq_norms(X)
+
+    distances = -2.0 * _dot(X, centers)
+    distances += x_sq_norms[:, np.newaxis]
+    distances += np.einsum("ij,ij->i", centers, centers)[np.newaxis, :]
+    np.maximum(distances, 0, out=distances)
+    return distances
+
+def _tolerance(X, tol):
+    """Toleransi konvergensi relatif terhadap rata-rata varians fitur"""
+    if tol == 0:
+        return 0.0
+    if sp.issparse(X):
+        mean = np.asarray(X.mean(axis=0)).ravel()
+        mean_sq = np.asarray(X.multiply(X).mean(axis=0)).ravel()
+        variances = mean_sq - mean ** 2
+    else:
+        variances = np.var(X, axis=0)
+    return np.mean(variances) * tol
+
+def _cluster_sums(X, labels, n_clusters):
+    """Jumlah vektor dan jumlah anggota per cluster (tanpa loop Python)"""
+    n_samples = X.shape[0]
+    membership = sp.csr_matrix(
+        (np.ones(n_samples), (labels, np.arange(n_samples))),
+        shape=(n_clusters, n_samples)
+    )
+    sums = membership @ X
+    if sp.issparse(sums):
+        sums = sums.toarray()
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+    return np.asarray(sums), counts
+
+def _row(X, i):
+    """Satu baris X sebagai vektor dense"""
+    if sp.issparse(X):
+        return X[[i]].toarray().ravel()
+    return X[i]
+
+# ===============================
+# INISIALISASI K-MEANS++
+# ===============================
+def kmeans_plusplus(X, n_clusters, random_state, x_sq_norms=None, n_local_trials=None):
+    """
+    Pilih center awal dengan k-means++ (greedy, beberapa kandidat per langkah)
+
+    Returns:
+    - centers: array (n_clusters x n_features)
+    - indices: indeks baris X yang dipilih sebagai center
+    """
+    n_samples, n_features = X.shape
+    if x_sq_norms is None:
+        x_sq_norms = _row_sq_norms(X)
+    if n_local_trials is None:
+        n_local_trials = 2 + int(np.log(n_clusters))
+
+    sample_weight = np.ones(n_samples)
+    centers = np.empty((n_clusters, n_features), dtype=np.float64)
+    indices = np.full(n_clusters, -1, dtype=int)
+
+    # Center pertama dipilih acak
+    center_id = random_state.choice(n_samples, p=sample_weight / sample_weight.sum())
+    centers[0] = _row(X, center_id)
+    indices[0] = center_id
+
+    closest_dist_sq = squared_distances(X, centers[[0]], x_sq_norms).T
+    current_pot = closest_dist_sq @ sample_weight
+
+    for c in range(1, n_clusters):
+        # Kandidat diambil dengan peluang sebanding jarak kuadrat ke center terdekat
+        rand_vals = random_state.uniform(size=n_local_trials) * current_pot
+        candidate_ids = np.searchsorted(np.cumsum(sample_weight * closest_dist_sq), rand_vals)
+        np.clip(candidate_ids, None, closest_dist_sq.size - 1, out=candidate_ids)
+
+        if sp.issparse(X):
+            candidates = X[candidate_ids].toarray()
+        else:
+            candidates = X[candidate_ids]
+        distance_to_candidates = squared_distances(X, candidates, x_sq_norms).T
+
+        # Pilih kandidat yang paling menurunkan total jarak
+        np.minimum(closest_dist_sq, distance_to_candidates, out=distance_to_candidates)
+        candidates_pot = distance_to_candidates @ sample_weight.reshape(-1, 1)
+
+        best = np.argmin(candidates_pot)
+        current_pot = candidates_pot[best]
+        closest_dist_sq = distance_to_candidates[best]
+        best_id = candidate_ids[best]
+
+        centers[c] = _row(X, best_id)
+        indices[c] = best_id
+
+    return centers, indices
+
+# ===============================
+# K-MEANS (LLOYD)
+# ===============================
+class KMeans:
+    """
+    K-Means (algoritma Lloyd) dengan NumPy/SciPy, mendukung input sparse
+
+    Inisialisasi, kriteria konvergensi, dan penanganan cluster kosong
+    mengikuti sklearn.cluster.KMeans sehingga hasil dengan random_state
+    yang sama identik.
+
+    Parameters:
+    - n_clusters: jumlah cluster
+    - random_state: seed (int) atau None
+    - max_iter: iterasi maksimum per inisialisasi
+    - tol: toleransi pergeseran center (relatif terhadap varians data)
+    - n_init: jumlah inisialisasi, diambil yang inertia-nya terkecil
+    """
+
+    def __init__(self, n_clusters=8, random_state=None, max_iter=300, tol=1e-4, n_init=1):
+        self.n_clusters = n_clusters
+        self.random_state = random_state
+        self.max_iter = max_iter
+        self.tol = tol
+        self.n_init = n_init
+
+    def fit(self, X):
+        X = _as_float_matrix(X)
+        if X.shape[0] < self.n_clusters:
+            raise ValueError(
+                f"n_samples={X.shape[0]} should be >= n_clusters={self.n_clusters}."
+            )
+
+        random_state = _check_random_state(self.random_state)
+        x_sq_norms = _row_sq_norms(X)
+        tol = _tolerance(X, self.tol)
+
+        best = None
+        for _ in range(self.n_init):
+            centers, _ = kmeans_plusplus(X, self.n_clusters, random_state, x_sq_norms)
+            result = self._lloyd(X, centers, x_sq_norms, tol)
+            if best is None or result[1] < best[1]:
+                best = result
+
+        self.labels_, self.inertia_, self.cluster_centers_, self.n_iter_ = best
+        return self
+
+    def fit_predict(self, X):
+        return self.fit(X).labels_
+
+    def predict(self, X):
+        X = _as_float_matrix(X)
+        return self._assign(X, self.cluster_centers_)
+
+    @staticmethod
+    def _assign(X, centers):
+        """E-step: label center terdekat"""
+        # ||x||^2 sama untuk semua center, jadi cukup ||c||^2 - 2 x.c
+        scores = -2.0 * _dot(X, centers)
+        scores += np.einsum("ij,ij->i", centers, centers)[np.newaxis, :]
+        return scores.argmin(axis=1).astype(np.int32)
+
+    def _lloyd(self, X, centers, x_sq_norms, tol):
+        """Satu run Lloyd dari center awal; return (labels, inertia, centers, n_iter)"""
+        labels_old = np.full(X.shape[0], -1, dtype=np.int32)
+        strict_convergence = False
+
+        for i in range(self.max_iter):
+            labels = self._assign(X, centers)
+            new_centers = self._update_centers(X, labels, centers)
+            center_shift = np.sqrt(((new_centers - centers) ** 2).sum(axis=1))
+            centers = new_centers
+
+            if np.array_equal(labels, labels_old):
+                strict_convergence = True
+                break
+            if (center_shift ** 2).sum() <= tol:
+                break
+            labels_old = labels
+
+        if not strict_convergence:
+            # Samakan label dengan posisi center terakhir
+            labels = self._assign(X, centers)
+
+        inertia = float(_distance_to_assigned(X, centers, labels, x_sq_norms).sum())
+        return labels, inertia, centers, i + 1
+
+    def _update_centers(self, X, labels, centers_old):
+        """M-step: rata-rata anggota; cluster kosong dipindah ke titik terjauh"""
+        sums, counts = _cluster_sums(X, labels, self.n_clusters)
+
+        empty = np.where(counts == 0)[0]
+        if len(empty):
+            # Titik paling jauh dari center-nya menjadi center cluster kosong
+            far_dist = _distance_to_assigned(X, centers_old, labels)
+            far = np.argpartition(far_dist, -len(empty))[:-len(empty) - 1:-1]
+            for cluster_id, idx in zip(empty, far):
+                point = _row(X, idx)
+                old_cluster = labels[idx]
+                sums[old_cluster] -= point
+                counts[old_cluster] -= 1
+                sums[cluster_id] = point
+                counts[cluster_id] = 1
+
+        nonzero = counts > 0
+        new_centers = centers_old.copy()
+        new_centers[nonzero] = sums[nonzero] / counts[nonzero, np.newaxis]
+        return new_centers
+
+def _distance_to_assigned(X, centers, labels, x_sq_norms=None):
+    """||x - c_label||^2 per baris (X sparse tidak di-densify)"""
+    assigned = centers[labels]
+    if not sp.issparse(X):
+        return _row_sq_norms(X - assigned)
+
+    if x_sq_norms is None:
+        x_sq_norms = _row_sq_norms(X)
+    cross = np.asarray(X.multiply(assigned).sum(axis=1)).ravel()
+    terms = x_sq_norms - 2.0 * cross + np.einsum("ij,ij->i", assigned, assigned)
+    return np.maximum(terms, 0.0)
+
+def _check_random_state(seed):
+    """Terjemahkan seed menjadi np.random.RandomState"""
+    if seed is None:
+        return np.random.mtrand._rand
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    return np.random.RandomState(seed)
+
+# ===============================
+# MINI-BATCH K-MEANS
+# ===============================
+class MiniBatchKMeans(KMeans):
+    """
+    K-Means mini-batch untuk korpus besar (mis. clustering per review)
+
+    Setiap langkah hanya memakai batch_size baris acak dari X (boleh sparse),
+    center digeser dengan learning rate 1/jumlah anggota. Berhenti jika
+    inertia rata-rata (EWA) tidak membaik selama max_no_improvement langkah.
+
+    Parameters:
+    - n_clusters, random_state: sama dengan KMeans
+    - batch_size: jumlah baris per mini-batch
+    - max_iter: jumlah maksimum pass (epoch) atas data
+    - max_no_improvement: langkah tanpa perbaikan sebelum berhenti
+      (None = nonaktif)
+    - reassignment_ratio: center dengan anggota < ratio * anggota terbanyak
+      dipindahkan ke titik acak dari batch
+    - tol: berhenti jika pergeseran center (relatif varians) <= tol
+    """
+
+    def __init__(self, n_clusters=8, random_state=None, batch_size=1024, max_iter=100,
+                 max_no_improvement=10, reassignment_ratio=0.01, tol=0.0):
+        super().__init__(n_clusters=n_clusters, random_state=random_state,
+                         max_iter=max_iter, tol=tol)
+        self.batch_size = batch_size
+        self.max_no_improvement = max_no_improvement
+        self.reassignment_ratio = reassignment_ratio
+
+    def fit(self, X):
+        X = _as_float_matrix(X)
+        n_samples = X.shape[0]
+        if n_samples < self.n_clusters:
+            raise ValueError(
+                f"n_samples={n_samples} should be >= n_clusters={self.n_clusters}."
+            )
+
+        random_state = _check_random_state(self.random_state)
+        batch_size = min(self.batch_size, n_samples)
+        x_sq_norms = _row_sq_norms(X)
+        tol = _tolerance(X, self.tol)
+
+        # Inisialisasi k-means++ pada subset acak (3x batch)
+        init_size = min(max(3 * batch_size, self.n_clusters), n_samples)
+        init_idx = random_state.randint(0, n_samples, init_size)
+        centers, _ = kmeans_plusplus(X[init_idx], self.n_clusters, random_state,
+                                     x_sq_norms[init_idx])
+        counts = np.zeros(self.n_clusters)
+
+        n_steps = max(1, (self.max_iter * n_samples) // batch_size)
+        ewa_inertia = None
+        best_inertia = None
+        no_improvement = 0
+        steps_since_reassign = 0
+
+        for step in range(n_steps):
+            idx = random_state.randint(0, n_samples, batch_size)
+            X_batch = X[idx]
+            labels = self._assign(X_batch, centers)
+
+            # Update center: rata-rata berjalan dengan bobot jumlah anggota
+            sums, batch_counts = _cluster_sums(X_batch, labels, self.n_clusters)
+            new_counts = counts + batch_counts
+            updated = batch_counts > 0
+            new_centers = centers.copy()
+            new_centers[updated] = (
+                centers[updated] * counts[updated, np.newaxis] + sums[updated]
+            ) / new_counts[updated, np.newaxis]
+            center_shift = ((new_centers - centers) ** 2).sum()
+            centers, counts = new_centers, new_counts
+
+            steps_since_reassign += 1
+            if self.reassignment_ratio > 0 and steps_since_reassign >= 10 + counts.min():
+                self._reassign(X_batch, x_sq_norms[idx], centers, counts, random_state)
+                steps_since_reassign = 0
+
+            # Konvergensi berdasarkan inertia batch (dirata-rata eksponensial)
+            batch_inertia = _distance_to_assigned(
+                X_batch, centers, labels, x_sq_norms[idx]
+            ).sum() / batch_size
+            if ewa_inertia is None:
+                ewa_inertia = batch_inertia
+            else:
+                alpha = min(1.0, batch_size * 2.0 / (n_samples + 1))
+                ewa_inertia = ewa_inertia * (1 - alpha) + batch_inertia * alpha
+
+            if tol > 0.0 and center_shift <= tol:
+                break
+
+            if best_inertia is None or ewa_inertia < best_inertia:
+                best_inertia = ewa_inertia
+                no_improvement = 0
+            else:
+                no_improvement += 1
+            if self.max_no_improvement is not None and no_improvement >= self.max_no_improvement:
+                break
+
+        self.cluster_centers_ = centers
+        self.labels_ = self._assign(X, centers)
+        self.inertia_ = float(_distance_to_assigned(X, centers, self.labels_, x_sq_norms).sum())
+        self.n_iter_ = step + 1
+        return self
+
+    def _reassign(self, X_batch, batch_sq_norms, centers, counts, random_state):
+        """Pindahkan center yang nyaris tidak punya anggota ke titik batch acak"""
+        to_reassign = counts < self.reassignment_ratio * counts.max()
+        n_reassign = int(to_reassign.sum())
+        if n_reassign == 0:
+            return
+
+        # Titik dipilih dengan peluang sebanding jarak ke center terdekat
+        distances = squared_distances(X_batch, centers, batch_sq_norms).min(axis=1)
+        if distances.sum() > 0:
+            p = distances / distances.sum()
+        else:
+            p = None
+        n_reassign = min(n_reassign, X_batch.shape[0])
+        new_idx = random_state.choice(X_batch.shape[0], size=n_reassign, replace=False, p=p)
+
+        if sp.issparse(X_batch):
+            new_points = X_batch[new_idx].toarray()
+        else:
+            new_points = X_batch[new_idx]
+        reassign_ids = np.where(to_reassign)[0][:n_reassign]
+        centers[reassign_ids] = new_points
+        # Anggap center baru setara center paling kecil yang tersisa
+        kept = counts[~to_reassign]
+        counts[reassign_ids] = kept.min() if len(kept) else 0
+
+# ===============================
+# SPHERICAL K-MEANS (COSINE)
+# ===============================
+def normalize_rows(X):
+    """Normalisasi L2 per baris; baris nol dibiarkan nol"""
+    norms = np.sqrt(_row_sq_norms(X))
+    norms[norms == 0.0] = 1.0
+    if sp.issparse(X):
+        return sp.csr_matrix(sp.diags(1.0 / norms) @ X)
+    return X / norms[:, np.newaxis]
+
+class SphericalKMeans(KMeans):
+    """
+    K-Means dengan kemiripan cosine untuk baris TF-IDF sparse
+
+    Baris dinormalisasi L2, label = center dengan dot product terbesar
+    (sparse x dense, X tidak pernah di-densify), dan center = jumlah anggota
+    yang dinormalisasi ke panjang 1. inertia_ = total jarak cosine
+    (1 - kemiripan) ke center masing-masing.
+
+    Baris nol (mis. review tanpa term TF-IDF) kemiripannya 0 ke semua
+    center, jadi tidak punya center terdekat: baris ini tidak ikut fit,
+    diberi label -1, dan jumlahnya dicatat di n_unassigned_.
+    """
+
+    def fit(self, X):
+        X = normalize_rows(_as_float_matrix(X))
+        assigned = np.flatnonzero(_row_sq_norms(X) > 0)
+        X_fit = X[assigned]
+        if X_fit.shape[0] < self.n_clusters:
+            raise ValueError(
+                f"n_samples={X_fit.shape[0]} (baris non-nol) should be >= "
+                f"n_clusters={self.n_clusters}."
+            )
+
+        random_state = _check_random_state(self.random_state)
+        x_sq_norms = _row_sq_norms(X_fit)
+
+        best = None
+        for _ in range(self.n_init):
+            # Untuk vektor satuan, jarak Euclidean setara dengan cosine
+            centers, _ = kmeans_plusplus(X_fit, self.n_clusters, random_state, x_sq_norms)
+            result = self._spherical(X_fit, normalize_rows(centers))
+            if best is None or result[1] < best[1]:
+                best = result
+
+        labels_fit, self.inertia_, self.cluster_centers_, self.n_iter_ = best
+        self.labels_ = np.full(X.shape[0], -1, dtype=np.int32)
+        self.labels_[assigned] = labels_fit
+        self.n_unassigned_ = X.shape[0] - len(assigned)
+        return self
+
+    def predict(self, X):
+        X = normalize_rows(_as_float_matrix(X))
+        labels = _dot(X, self.cluster_centers_).argmax(axis=1).astype(np.int32)
+        labels[_row_sq_norms(X) == 0] = -1
+        return labels
+
+    def _spherical(self, X, centers):
+        """Iterasi spherical K-Means; return (labels, inertia, centers, n_iter)"""
+        labels_old = np.full(X.shape[0], -1, dtype=np.int32)
+
+        for i in range(self.max_iter):
+            similarity = _dot(X, centers)
+            labels = similarity.argmax(axis=1).astype(np.int32)
+            best_sim = similarity[np.arange(len(labels)), labels]
+            if np.array_equal(labels, labels_old):
+                break
+
+            sums, counts = _cluster_sums(X, labels, self.n_clusters)
+            empty = np.where(counts == 0)[0]
+            if len(empty):
+                # Titik yang paling tidak mirip dengan center-nya
+                far = np.argsort(best_sim)[:len(empty)]
+                for cluster_id, idx in zip(empty, far):
+                    point = _row(X, idx)
+                    sums[labels[idx]] -= point
+                    sums[cluster_id] = point
+                    labels[idx] = cluster_id
+
+            centers = normalize_rows(sums)
+            labels_old = labels
+
+        similarity = _dot(X, centers)
+        labels = similarity.argmax(axis=1).astype(np.int32)
+        inertia = float((1.0 - similarity[np.arange(len(labels)), labels]).sum())
+        return labels, inertia, centers, i + 1
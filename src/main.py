@@ -1,137 +1,471 @@
+import json
+import os
+
 import pandas as pd
-from preprocess import preprocess_series
-from vectorize import vectorize_text
-from cluster import run_kmeans
+from preprocess import preprocess_series, config_version, remove_words
+from cache import CleanCache, StageCache, file_digest, fingerprint
+from corpus import TokenizedCorpus
+from vectorize import vectorize_corpus, vectorize_counts, TFIDF_PARAMS, NGRAM_RANGE
+from cluster import run_kmeans, run_review_clustering, CLUSTER_VERSION
 from summarize import top_words_per_cluster
-from analyzer import analyze_sentiment, detect_tema, get_cluster_label, extract_top_keywords
-
-print("="*60)
-print("CLUSTERING WISATA BALIKPAPAN - TF-IDF & K-MEANS")
-print("="*60)
-
-# ===============================
-# 1. LOAD DATA
-# ===============================
-print("\n[1/7] Loading data...")
-df = pd.read_csv("../data/raw/wisata_balikpapan.csv")
-print(f"   Total reviews: {len(df)}")
-print(f"   Total tempat wisata: {df['wisata'].nunique()}")
-
-# ===============================
-# 2. PREPROCESS REVIEW
-# ===============================
-print("\n[2/7] Preprocessing reviews...")
-df["clean_review"] = preprocess_series(df["review"])
-
-# ===============================
-# 3. GABUNG REVIEW PER TEMPAT
-# ===============================
-print("\n[3/7] Menggabungkan review per tempat...")
-grouped = (
-    df.groupby("wisata")["clean_review"]
-    .apply(lambda x: " ".join(x))
-    .reset_index()
+from ingest import stream_term_counts
+from profiler import StageProfiler
+from results_io import (
+    OUTPUT_FORMATS, RUN_REPORT_FILE, DISTRIBUTION_FILE, require_pyarrow, save_parquet,
+    save_matrices, remove_stale_outputs
+)
+from analyzer import (
+    get_cluster_label, detect_tema_corpus, extract_top_keywords_corpus,
+    detect_tema_from_counts, extract_top_keywords_from_counts,
+    analyze_sentiment_corpus, sentiment_from_matrix, term_matrix_from_counts,
+    lexicon_version
 )
-grouped.rename(columns={"clean_review": "all_reviews"}, inplace=True)
-
-# ===============================
-# 4. TF-IDF (PER TEMPAT)
-# ===============================
-print("\n[4/7] Melakukan TF-IDF vectorization...")
-vectorizer, X = vectorize_text(grouped["all_reviews"])
-print(f"   Shape matrix: {X.shape}")
 
 # ===============================
-# 5. K-MEANS CLUSTERING
+# KONFIGURASI DEFAULT
 # ===============================
-K = 3  # jumlah cluster
-print(f"\n[5/7] Running K-Means (k={K})...")
-model, labels = run_kmeans(X, k=K)
-grouped["cluster"] = labels
+DEFAULT_CONFIG = {
+    "data_path": "../data/raw/wisata_balikpapan.csv",
+    "output_dir": "../outputs",       # None = hasil tidak disimpan ke file
+    # "csv", "parquet" (kolom bertipe + matriks TF-IDF/centroid biner,
+    # butuh pyarrow) atau "both"
+    "output_format": "csv",
+    "k": 3,                           # jumlah cluster
+    "random_state": 42,               # seed inisialisasi K-Means
 
-# ===============================
-# 6. ANALISIS TAMBAHAN
-# ===============================
-print("\n[6/7] Menganalisis sentimen dan tema...")
+    # Level clustering: "tempat" (satu dokumen gabungan per tempat) atau
+    # "review" (spherical K-Means per review, lalu diringkas per tempat).
+    # Mode "review" butuh review individual sehingga tidak bisa digabung
+    # dengan mode streaming.
+    "cluster_level": "tempat",
 
-# Analisis per tempat
-grouped[["kategori", "sentimen_score"]] = grouped["all_reviews"].apply(
-    lambda x: pd.Series(analyze_sentiment(x))
-)
+    # Stopwords tambahan untuk run ini (mis. nama tempat yang mendominasi).
+    # Dibuang dari teks bersih sebelum TF-IDF, sehingga cache cleaning tetap
+    # terpakai. Tidak bisa digabung dengan mode streaming.
+    "extra_stopwords": (),
 
-grouped[["tema_utama", "tema_terkait"]] = grouped["all_reviews"].apply(
-    lambda x: pd.Series(detect_tema(x))
-)
+    # Mode streaming: isi jumlah baris per chunk (mis. 100_000) untuk file
+    # review yang sangat besar. CSV dibaca bertahap dan review per tempat
+    # disimpan sebagai hitungan term, bukan string gabungan.
+    "stream_chunksize": None,
 
-grouped["kata_kunci"] = grouped["all_reviews"].apply(
-    lambda x: ", ".join(extract_top_keywords(x, top_n=5))
-)
+    # Jumlah proses preprocessing (1 = serial, None/-1 = semua core). Mode
+    # paralel baru dipakai untuk input >= preprocess.MIN_PARALLEL_SIZE baris
+    # (per chunk di mode streaming); hasilnya identik dengan mode serial.
+    "n_jobs": 1,
 
-# Analisis per cluster
-cluster_summary = top_words_per_cluster(vectorizer, model, top_n=10)
-cluster_labels = {c: get_cluster_label(words) for c, words in cluster_summary.items()}
+    # Cache teks bersih per review (None = tanpa cache). Tidak dipakai di
+    # mode streaming: cache menyimpan semua review dalam satu dict di
+    # memori, sehingga memori kembali tumbuh sebanding jumlah baris.
+    "cache_path": "../outputs/.cache/clean_reviews.pkl",
 
-grouped["cluster_label"] = grouped["cluster"].map(cluster_labels)
+    # Cache output per tahap (teks bersih, TF-IDF, label/centroid, analisis).
+    # Tahap yang fingerprint input-nya tidak berubah dilewati, mis. mengganti
+    # K hanya menjalankan ulang clustering. None = tanpa cache tahap.
+    "stage_cache_dir": "../outputs/.cache/stages",
+    # Instrumentasi: laporan waktu/memori per tahap selalu ditulis ke
+    # laporan_run.json di output_dir. trace_memory=True menambah peak alokasi
+    # via tracemalloc (lebih lambat); profile_stage = nama tahap ("clean",
+    # "tfidf", "kmeans", ...) yang di-dump dengan cProfile.
+    "trace_memory": False,
+    "profile_stage": None,
 
-# ===============================
-# 7. SIMPAN HASIL
-# ===============================
-print("\n[7/7] Menyimpan hasil...")
+    "verbose": True,
+}
 
-# Pilih kolom yang relevan untuk output
-output_df = grouped[[
-    "wisata", 
-    "cluster", 
+OUTPUT_COLUMNS = [
+    "wisata",
+    "cluster",
     "cluster_label",
     "kategori",
     "tema_utama",
     "kata_kunci",
     "tema_terkait"
-]]
+]
+
+def _quiet(*args, **kwargs):
+    pass
+
+# ===============================
+# PIPELINE
+# ===============================
+def run_pipeline(config=None, log=None):
+    """
+    Jalankan seluruh pipeline clustering (bisa dipanggil berulang kali)
+
+    Parameters:
+    - config: dict, key yang tidak diisi memakai DEFAULT_CONFIG
+    - log: fungsi pengganti print untuk pesan progres (mis. kirim ke GUI);
+      None = print jika config["verbose"]
+
+    Returns:
+    - dict berisi:
+      - grouped: DataFrame hasil per tempat
+      - cluster_summary: dict {cluster: list kata dominan}
+      - cluster_labels: dict {cluster: label}
+      - model: model K-Means yang sudah di-fit
+      - vectorizer: model TF-IDF yang sudah di-fit
+      - X: sparse matrix TF-IDF
+      - distribution: distribusi cluster review per tempat (mode review)
+      - config: konfigurasi lengkap yang dipakai
+      - report: laporan waktu/memori per tahap (lihat StageProfiler)
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    if log is None:
+        log = print if config["verbose"] else _quiet
+
+    data_path = config["data_path"]
+    stream_chunksize = config["stream_chunksize"]
+    cluster_level = config["cluster_level"]
+    k = config["k"]
+
+    if config["output_format"] not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format tidak dikenal: {config['output_format']}")
+    if config["output_dir"] and config["output_format"] != "csv":
+        require_pyarrow()
+    if cluster_level not in ("tempat", "review"):
+        raise ValueError(f"cluster_level tidak dikenal: {cluster_level}")
+    if stream_chunksize and cluster_level == "review":
+        raise ValueError("cluster_level='review' tidak bisa dipakai dengan stream_chunksize")
+    extra_stopwords = tuple(sorted({
+        word.strip().lower() for word in config["extra_stopwords"] if word.strip()
+    }))
+    if stream_chunksize and extra_stopwords:
+        raise ValueError("extra_stopwords tidak bisa dipakai dengan stream_chunksize")
+
+    # Mode streaming harus tetap hemat memori -> tanpa CleanCache (hasil
+    # per tempat tetap di-cache oleh StageCache tahap "stream_counts")
+    use_clean_cache = config["cache_path"] and not stream_chunksize
+    clean_cache = CleanCache(config["cache_path"]) if use_clean_cache else None
+    stages = StageCache(config["stage_cache_dir"])
+    profiler = StageProfiler(
+        trace_memory=config["trace_memory"], profile_stage=config["profile_stage"]
+    )
+
+    log("="*60)
+    log("CLUSTERING WISATA BALIKPAPAN - TF-IDF & K-MEANS")
+    log("="*60)
+
+    # Fingerprint tiap tahap memuat fingerprint tahap sebelumnya
+    fp_clean = fingerprint(file_digest(data_path), config_version(), stream_chunksize is not None)
+    fp_tfidf = fingerprint(fp_clean, extra_stopwords, TFIDF_PARAMS, NGRAM_RANGE, cluster_level)
+    fp_cluster = fingerprint(fp_tfidf, k, config["random_state"], CLUSTER_VERSION)
+    fp_analysis = fingerprint(fp_clean, extra_stopwords, lexicon_version())
+
+    if stream_chunksize:
+        # ===============================
+        # 1-3. LOAD + PREPROCESS + HITUNG TERM PER TEMPAT (STREAMING)
+        # ===============================
+        log(f"\n[1/7] Streaming data (chunk {stream_chunksize} baris)...")
+        log("\n[2/7] Preprocessing reviews per chunk...")
+        log("\n[3/7] Mengakumulasi hitungan term per tempat...")
+
+        def compute_counts():
+            counts = stream_term_counts(
+                data_path, chunksize=stream_chunksize, cache=clean_cache, n_jobs=config["n_jobs"]
+            )
+            if clean_cache is not None:
+                log(f"   Cache cleaning: {clean_cache.stats()}")
+            return {"grouped": counts}
+
+        with profiler.stage("stream_counts") as info:
+            counts = stages.run("stream_counts", fp_clean, compute_counts)["grouped"]
+            info.update(
+                cache=stages.status["stream_counts"],
+                rows=counts["n_reviews"].sum(),
+                places=len(counts)
+            )
+        log(f"   Total reviews: {counts['n_reviews'].sum()}")
+        log(f"   Total tempat wisata: {len(counts)}")
 
-output_df.to_csv("../outputs/hasil_cluster_per_tempat.csv", index=False)
+        # ===============================
+        # 4. TF-IDF (PER TEMPAT)
+        # ===============================
+        log("\n[4/7] Melakukan TF-IDF vectorization...")
+        with profiler.stage("tfidf") as info:
+            tfidf = stages.run("tfidf", fp_tfidf, lambda: dict(zip(
+                ("vectorizer", "X"), vectorize_counts(counts["term_counts"])
+            )))
+            info.update(cache=stages.status["tfidf"], shape=tfidf["X"].shape, nnz=tfidf["X"].nnz)
+    else:
+        # ===============================
+        # 1-2. LOAD DATA + PREPROCESS REVIEW
+        # ===============================
+        def compute_clean():
+            log("\n[1/7] Loading data...")
+            df = pd.read_csv(data_path)
 
-# Simpan juga detail cluster
-cluster_detail = pd.DataFrame([
-    {"cluster": c, "label": cluster_labels[c], "kata_dominan": ", ".join(words[:10])}
-    for c, words in cluster_summary.items()
-])
-cluster_detail.to_csv("../outputs/detail_cluster.csv", index=False)
+            log("\n[2/7] Preprocessing reviews...")
+            df["clean_review"] = preprocess_series(
+                df["review"], n_jobs=config["n_jobs"], cache=clean_cache
+            )
+            if clean_cache is not None:
+                log(f"   Cache cleaning: {clean_cache.stats()}")
+            return {"reviews": df[["wisata", "clean_review"]]}
 
-print("   ✓ Hasil disimpan ke '../outputs/hasil_cluster_per_tempat.csv'")
-print("   ✓ Detail cluster disimpan ke '../outputs/detail_cluster.csv'")
+        with profiler.stage("clean") as info:
+            df = stages.run("clean", fp_clean, compute_clean)["reviews"]
+            info.update(cache=stages.status["clean"], rows=len(df))
+        log(f"   Total reviews: {len(df)}")
+        log(f"   Total tempat wisata: {df['wisata'].nunique()}")
+
+        # ===============================
+        # 3. GABUNG REVIEW PER TEMPAT
+        # ===============================
+        # Tokenisasi sekali (hanya jika ada tahap yang perlu dihitung);
+        # dipakai TF-IDF, sentimen, tema, dan kata kunci
+        corpora = {}
+
+        def get_corpora():
+            if not corpora:
+                log("\n[3/7] Menggabungkan review per tempat...")
+                with profiler.stage("group") as info:
+                    texts = df["clean_review"]
+                    if extra_stopwords:
+                        texts = remove_words(texts, extra_stopwords)
+                    corpora["review"] = TokenizedCorpus.from_texts(texts)
+                    corpora["wisata"], corpora["tempat"] = corpora["review"].group(df["wisata"])
+                    info.update(
+                        tokens=len(corpora["review"].token_ids),
+                        vocabulary=len(corpora["review"].vocabulary),
+                        places=len(corpora["wisata"])
+                    )
+            return corpora
+
+        # ===============================
+        # 4. TF-IDF (PER TEMPAT / PER REVIEW)
+        # ===============================
+        log("\n[4/7] Melakukan TF-IDF vectorization...")
+        with profiler.stage("tfidf") as info:
+            tfidf = stages.run("tfidf", fp_tfidf, lambda: dict(zip(
+                ("vectorizer", "X"), vectorize_corpus(get_corpora()[cluster_level])
+            )))
+            info.update(cache=stages.status["tfidf"], shape=tfidf["X"].shape, nnz=tfidf["X"].nnz)
+
+    vectorizer, X = tfidf["vectorizer"], tfidf["X"]
+    log(f"   Shape matrix: {X.shape}")
+
+    # ===============================
+    # 5. K-MEANS CLUSTERING
+    # ===============================
+    def compute_cluster():
+        distribution = None
+        if cluster_level == "review":
+            model, labels, distribution = run_review_clustering(
+                X, df["wisata"], k=k, random_state=config["random_state"]
+            )
+        else:
+            model, labels = run_kmeans(X, k=k, random_state=config["random_state"])
+        return {
+            "labels": labels,
+            "centroids": model.cluster_centers_,
+            "model": model,
+            "distribution": distribution,
+        }
+
+    if cluster_level == "review":
+        log(f"\n[5/7] Running Spherical K-Means per review (k={k})...")
+    else:
+        log(f"\n[5/7] Running K-Means (k={k})...")
+    with profiler.stage("kmeans") as info:
+        clustering = stages.run("kmeans", fp_cluster, compute_cluster)
+        info.update(
+            cache=stages.status["kmeans"],
+            k=k,
+            rows=len(clustering["labels"]),
+            centroids_shape=clustering["centroids"].shape
+        )
+        if cluster_level == "review":
+            info["unassigned"] = int((clustering["labels"] < 0).sum())
+    model = clustering["model"]
+    distribution = clustering["distribution"]
+    if cluster_level == "review":
+        log(f"   Review tanpa cluster (vektor TF-IDF nol): {info['unassigned']}")
+
+    # ===============================
+    # 6. ANALISIS TAMBAHAN
+    # ===============================
+    log("\n[6/7] Menganalisis sentimen dan tema...")
+
+    # Analisis per tempat (tidak bergantung pada K)
+    def compute_analysis():
+        if stream_chunksize:
+            analysis = pd.DataFrame({"wisata": counts["wisata"].to_numpy()})
+            analysis["kategori"], analysis["sentimen_score"] = sentiment_from_matrix(
+                *term_matrix_from_counts(counts["term_counts"])
+            )
+            tema = [detect_tema_from_counts(x) for x in counts["term_counts"]]
+            kata_kunci = [
+                extract_top_keywords_from_counts(x, top_n=5) for x in counts["term_counts"]
+            ]
+        else:
+            place_corpus = get_corpora()["tempat"]
+            analysis = pd.DataFrame({"wisata": get_corpora()["wisata"]})
+            analysis["kategori"], analysis["sentimen_score"] = analyze_sentiment_corpus(place_corpus)
+            tema = detect_tema_corpus(place_corpus)
+            kata_kunci = extract_top_keywords_corpus(place_corpus, top_n=5)
+
+        analysis["tema_utama"] = [utama for utama, _ in tema]
+        analysis["tema_terkait"] = [terkait for _, terkait in tema]
+        analysis["kata_kunci"] = [", ".join(words) for words in kata_kunci]
+        return {"analysis": analysis}
+
+    with profiler.stage("analysis") as info:
+        grouped = stages.run("analysis", fp_analysis, compute_analysis)["analysis"].copy()
+        info.update(cache=stages.status["analysis"], rows=len(grouped))
+
+    with profiler.stage("label") as info:
+        if cluster_level == "review":
+            # Cluster tempat = cluster dominan dari review-reviewnya
+            grouped = grouped.merge(distribution, on="wisata", how="left")
+        else:
+            grouped["cluster"] = clustering["labels"]
+
+        # Analisis per cluster
+        cluster_summary = top_words_per_cluster(vectorizer, model, top_n=10)
+        cluster_labels = {c: get_cluster_label(words) for c, words in cluster_summary.items()}
+
+        grouped["cluster_label"] = grouped["cluster"].map(cluster_labels).fillna("Tanpa cluster")
+        info["clusters"] = len(cluster_labels)
+    log(f"   Cache tahap: {stages.stats()}")
+
+    result = {
+        "grouped": grouped,
+        "cluster_summary": cluster_summary,
+        "cluster_labels": cluster_labels,
+        "model": model,
+        "vectorizer": vectorizer,
+        "X": X,
+        "distribution": distribution,
+        "config": config,
+    }
+
+    # ===============================
+    # 7. SIMPAN HASIL
+    # ===============================
+    if config["output_dir"]:
+        log("\n[7/7] Menyimpan hasil...")
+        with profiler.stage("save") as info:
+            written = save_results(result, config["output_dir"], config["output_format"])
+            info["files"] = len(written)
+        for path in written:
+            log(f"   ✓ Disimpan ke '{path}'")
+
+    # Laporan waktu/memori per tahap
+    result["report"] = profiler.report(
+        config={key: config[key] for key in ("data_path", "k", "random_state",
+                                             "cluster_level", "stream_chunksize",
+                                             "extra_stopwords")}
+    )
+    profiler.stop()
+    log("\n   Waktu per tahap:")
+    log(profiler.summary())
+
+    if config["output_dir"]:
+        report_path = os.path.join(config["output_dir"], RUN_REPORT_FILE)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(result["report"], f, indent=2, ensure_ascii=False)
+        log(f"   ✓ Laporan run disimpan ke '{report_path}'")
+
+        if config["profile_stage"]:
+            profile_path = os.path.join(config["output_dir"], f"profil_{config['profile_stage']}.prof")
+            if profiler.save_profile(profile_path):
+                log(f"   ✓ Profil cProfile disimpan ke '{profile_path}'")
+
+    return result
+
+def save_results(result, output_dir, output_format="csv"):
+    """
+    Simpan hasil run_pipeline ke folder output
+
+    Parameters:
+    - output_format: "csv", "parquet", atau "both"
+
+    Returns:
+    - list path file yang ditulis
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+
+    # Pilih kolom yang relevan untuk output
+    hasil = result["grouped"][OUTPUT_COLUMNS]
+
+    # Detail cluster
+    cluster_labels = result["cluster_labels"]
+    cluster_detail = pd.DataFrame([
+        {"cluster": c, "label": cluster_labels[c], "kata_dominan": ", ".join(words[:10])}
+        for c, words in result["cluster_summary"].items()
+    ])
+
+    if output_format in ("csv", "both"):
+        path = os.path.join(output_dir, "hasil_cluster_per_tempat.csv")
+        hasil.to_csv(path, index=False)
+        written.append(path)
+
+        path = os.path.join(output_dir, "detail_cluster.csv")
+        cluster_detail.to_csv(path, index=False)
+        written.append(path)
+
+    if output_format in ("parquet", "both"):
+        written += save_parquet(hasil, cluster_detail, output_dir)
+        written += save_matrices(
+            result["X"],
+            result["model"].cluster_centers_,
+            result["vectorizer"].get_feature_names_out(),
+            output_dir
+        )
+
+    # File format lain dari run sebelumnya akan dibaca reader sebagai hasil
+    remove_stale_outputs(output_dir, output_format, result["config"]["cluster_level"])
+
+    if result["distribution"] is not None:
+        # Distribusi cluster review per tempat
+        path = os.path.join(output_dir, DISTRIBUTION_FILE)
+        result["distribution"].to_csv(path, index=False)
+        written.append(path)
+
+    return written
 
 # ===============================
 # 8. CETAK HASIL
 # ===============================
-print("\n" + "="*60)
-print("HASIL CLUSTERING")
-print("="*60)
-
-for cluster_id in sorted(grouped["cluster"].unique()):
-    cluster_data = grouped[grouped["cluster"] == cluster_id]
-    print(f"\n{'═'*60}")
-    print(f"CLUSTER {cluster_id}: {cluster_labels[cluster_id]}")
-    print(f"{'═'*60}")
-    print(f"Jumlah tempat: {len(cluster_data)}")
-    print(f"Kata dominan : {', '.join(cluster_summary[cluster_id][:8])}")
-    print(f"\nDaftar tempat wisata:")
-    
-    for idx, (_, row) in enumerate(cluster_data.iterrows(), 1):
-        print(f"\n  {idx}. {row['wisata']}")
-        print(f"     • Kategori    : {row['kategori']}")
-        print(f"     • Tema        : {row['tema_utama']}")
-        print(f"     • Kata Kunci  : {row['kata_kunci']}")
-
-print("\n" + "="*60)
-print("CLUSTERING SELESAI!")
-print("="*60)
-
-# Statistik tambahan
-print(f"\nStatistik:")
-print(f"- Total tempat wisata   : {len(grouped)}")
-print(f"- Jumlah cluster        : {K}")
-print(f"- Kategori 'Sangat Baik': {len(grouped[grouped['kategori'] == 'Sangat Baik'])}")
-print(f"- Kategori 'Baik'       : {len(grouped[grouped['kategori'] == 'Baik'])}")
-print(f"- Kategori 'Kurang Baik': {len(grouped[grouped['kategori'] == 'Kurang Baik'])}")
-print(f"- Kategori 'Netral'     : {len(grouped[grouped['kategori'] == 'Netral'])}")
\ No newline at end of file
+def print_results(result):
+    """Cetak ringkasan hasil clustering ke console"""
+    grouped = result["grouped"]
+    cluster_summary = result["cluster_summary"]
+    cluster_labels = result["cluster_labels"]
+
+    print("\n" + "="*60)
+    print("HASIL CLUSTERING")
+    print("="*60)
+
+    for cluster_id in sorted(grouped["cluster"].unique()):
+        cluster_data = grouped[grouped["cluster"] == cluster_id]
+        print(f"\n{'═'*60}")
+        print(f"CLUSTER {cluster_id}: {cluster_labels.get(cluster_id, 'Tanpa cluster')}")
+        print(f"{'═'*60}")
+        print(f"Jumlah tempat: {len(cluster_data)}")
+        print(f"Kata dominan : {', '.join(cluster_summary.get(cluster_id, [])[:8])}")
+        print(f"\nDaftar tempat wisata:")
+
+        for idx, (_, row) in enumerate(cluster_data.iterrows(), 1):
+            print(f"\n  {idx}. {row['wisata']}")
+            print(f"     • Kategori    : {row['kategori']}")
+            print(f"     • Tema        : {row['tema_utama']}")
+            print(f"     • Kata Kunci  : {row['kata_kunci']}")
+
+    print("\n" + "="*60)
+    print("CLUSTERING SELESAI!")
+    print("="*60)
+
+    # Statistik tambahan
+    print(f"\nStatistik:")
+    print(f"- Total tempat wisata   : {len(grouped)}")
+    print(f"- Jumlah cluster        : {result['config']['k']}")
+    print(f"- Kategori 'Sangat Baik': {len(grouped[grouped['kategori'] == 'Sangat Baik'])}")
+    print(f"- Kategori 'Baik'       : {len(grouped[grouped['kategori'] == 'Baik'])}")
+    print(f"- Kategori 'Kurang Baik': {len(grouped[grouped['kategori'] == 'Kurang Baik'])}")
+    print(f"- Kategori 'Netral'     : {len(grouped[grouped['kategori'] == 'Netral'])}")
+
+if __name__ == "__main__":
+    print_results(run_pipeline())
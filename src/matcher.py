@@ -0,0 +1,102 @@
+from collections import deque
+
+# ===============================
+# AHO-CORASICK MULTI-PATTERN MATCHER
+# ===============================
+class AhoCorasick:
+    """
+    Automaton Aho-Corasick: cari banyak keyword sekaligus dalam satu scan
+
+    Automaton dibangun sekali dari daftar pattern (boleh berisi spasi,
+    mis. "air terjun"). Biaya pencarian O(panjang teks + jumlah match),
+    tidak bergantung pada banyaknya keyword.
+
+    Parameters:
+    - patterns: list string pattern (duplikat diabaikan)
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._build()
+
+    def _build(self):
+        # 1. Trie dari semua pattern
+        for pid, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] = self._out[node] + (pid,)
+
+        # 2. Failure link (BFS); output node diwarisi dari failure-nya
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+        # 3. Transisi lengkap (DFA): setiap node langsung tahu tujuan untuk
+        #    setiap karakter di alfabet pattern, tanpa menelusuri failure
+        #    link saat scan. Karakter di luar alfabet selalu kembali ke root.
+        self._delta = [dict(edges) for edges in self._goto]
+        order = deque(self._goto[0].values())
+        while order:
+            node = order.popleft()
+            inherited = self._delta[self._fail[node]]
+            delta = self._delta[node]
+            for ch, target in inherited.items():
+                delta.setdefault(ch, target)
+            order.extend(self._goto[node].values())
+
+    def iter_matches(self, text):
+        """Yield (posisi_akhir, id_pattern) untuk setiap kemunculan"""
+        delta = self._delta
+        out = self._out
+        node = 0
+        for pos, ch in enumerate(text):
+            node = delta[node].get(ch, 0)
+            if out[node]:
+                for pid in out[node]:
+                    yield pos, pid
+
+    def find(self, text, word_boundary=False):
+        """
+        Kumpulan id pattern yang muncul di teks
+
+        Parameters:
+        - word_boundary: jika True, pattern harus berdiri sebagai kata utuh
+          (karakter sebelum/sesudahnya bukan huruf/angka), sehingga "air"
+          tidak cocok di dalam "pair" atau "airnya"
+        """
+        found = set()
+        n_patterns = len(self.patterns)
+        for end, pid in self.iter_matches(text):
+            if pid in found:
+                continue
+            if word_boundary and not self._at_boundary(text, end, pid):
+                continue
+            found.add(pid)
+            if len(found) == n_patterns:
+                break
+        return found
+
+    def _at_boundary(self, text, end, pid):
+        start = end - len(self.patterns[pid]) + 1
+        before_ok = start == 0 or not text[start - 1].isalnum()
+        after_ok = end + 1 == len(text) or not text[end + 1].isalnum()
+        return before_ok and after_ok
@@ -1,4 +1,11 @@
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from cache import text_digest
 
 # Stopwords Bahasa Indonesia (tambahkan sesuai kebutuhan)
 STOPWORDS_ID = {
@@ -10,27 +17,201 @@ STOPWORDS_ID = {
     'aja', 'yg', 'dgn', 'utk', 'gak', 'ga', 'si', 'ke', 'dr', 'sama'
 }
 
+# Pola tokenizer dikompilasi sekali. _TOKEN_RE meniru urutan langkah lama
+# dalam satu scan: URL dibuang utuh, mention/hashtag dibuang tanpa menelan
+# URL yang menempel, dan token hanya berisi huruf a-z. Lookahead menjaga
+# agar awal URL tidak ikut tertelan token lain.
+_TOKEN_RE = re.compile(
+    r"(?:http|www)\S+"                     # URL -> dibuang
+    r"|[@#](?:(?!http\S|www\S)\w)+"        # mention/hashtag -> dibuang
+    r"|((?:(?!http\S|www\S)[a-z])+)"       # token huruf -> diambil
+)
+# Jalur cepat untuk teks tanpa URL/mention (hampir semua review)
+_WORD_RE = re.compile(r"[a-z]+")
+_NOISE_MARKERS = ("http", "www", "@", "#")
+
+MIN_WORD_LEN = 3
+
+# Pengaturan mode paralel
+CHUNK_SIZE = 20000
+MIN_PARALLEL_SIZE = 50000
+
+def _find_tokens(text):
+    """Scan teks lowercase dan kembalikan token huruf (belum difilter)"""
+    for marker in _NOISE_MARKERS:
+        if marker in text:
+            return _TOKEN_RE.findall(text)
+    return _WORD_RE.findall(text)
+
+def tokenize(text: str) -> list:
+    """
+    Tokenisasi satu teks: lowercase, buang URL/mention, ambil huruf,
+    filter panjang kata dan stopwords
+
+    Returns:
+    - list token bersih
+    """
+    if not isinstance(text, str):
+        return []
+
+    return [
+        w for w in _find_tokens(text.lower())
+        if len(w) >= MIN_WORD_LEN and w not in STOPWORDS_ID
+    ]
+
 def clean_text(text: str) -> str:
     """Membersihkan teks dari noise dan normalisasi"""
-    if not isinstance(text, str):
-        return ""
-    
-    text = text.lower()
-    # Hapus URL
-    text = re.sub(r"http\S+|www\S+", " ", text)
-    # Hapus mention/hashtag jika ada
-    text = re.sub(r"@\w+|#\w+", " ", text)
-    # Hapus angka dan karakter khusus, tapi pertahankan huruf
-    text = re.sub(r"[^a-zA-Z\s]", " ", text)
-    # Hapus whitespace berlebih
-    text = re.sub(r"\s+", " ", text).strip()
-    
-    # Hapus stopwords
-    words = text.split()
-    words = [w for w in words if w not in STOPWORDS_ID and len(w) > 2]
-    
-    return " ".join(words)
-
-def preprocess_series(series):
-    """Apply cleaning ke seluruh series"""
-    return series.fillna("").apply(clean_text)
\ No newline at end of file
+    return " ".join(tokenize(text))
+
+def clean_texts(texts):
+    """
+    Versi batch dari clean_text untuk seluruh array teks sekaligus
+
+    Parameters:
+    - texts: list/series/array teks mentah
+
+    Returns:
+    - list teks bersih dengan urutan yang sama
+    """
+    # Semua lookup di-bind lokal agar loop tidak membayar overhead
+    # Series.apply dan atribut global per review
+    find_tokens = _find_tokens
+    stopwords = STOPWORDS_ID
+    min_len = MIN_WORD_LEN
+
+    cleaned = []
+    append = cleaned.append
+    for text in texts:
+        if not isinstance(text, str):
+            append("")
+            continue
+        append(" ".join([
+            w for w in find_tokens(text.lower())
+            if len(w) >= min_len and w not in stopwords
+        ]))
+    return cleaned
+
+def remove_words(texts, words):
+    """
+    Buang kata tertentu dari teks yang sudah bersih (token dipisah spasi)
+
+    Dipakai untuk stopwords tambahan per run tanpa mengulang cleaning.
+
+    Returns:
+    - list teks dengan urutan yang sama
+    """
+    words = set(words)
+    return [
+        " ".join([w for w in text.split() if w not in words]) if isinstance(text, str) else ""
+        for text in texts
+    ]
+
+def config_version():
+    """
+    Fingerprint konfigurasi preprocessing (stopwords + pola regex)
+
+    Dipakai sebagai versi CleanCache: setiap perubahan STOPWORDS_ID atau
+    pola tokenizer menghasilkan versi baru sehingga cache lama tidak dipakai.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (_TOKEN_RE.pattern, _WORD_RE.pattern, str(MIN_WORD_LEN)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    for word in sorted(STOPWORDS_ID):
+        h.update(word.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _resolve_workers(n_jobs):
+    """Terjemahkan n_jobs (None/-1 = semua core) menjadi jumlah worker"""
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    return max(1, n_jobs)
+
+def clean_texts_parallel(texts, n_jobs=None, chunk_size=CHUNK_SIZE):
+    """
+    Bersihkan teks secara paralel dengan ProcessPoolExecutor
+
+    Teks dipecah menjadi chunk berurutan, tiap chunk dibersihkan di proses
+    terpisah (bebas dari GIL), lalu hasilnya disambung kembali sesuai
+    urutan asli.
+
+    Parameters:
+    - texts: list/array teks mentah
+    - n_jobs: jumlah proses worker (None/-1 = semua core)
+    - chunk_size: jumlah review per chunk yang dikirim ke worker
+
+    Returns:
+    - list teks bersih dengan urutan yang sama
+    """
+    texts = list(texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    workers = min(_resolve_workers(n_jobs), len(chunks))
+
+    if workers <= 1:
+        return clean_texts(texts)
+
+    cleaned = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map mempertahankan urutan chunk
+        for part in executor.map(clean_texts, chunks):
+            cleaned.extend(part)
+    return cleaned
+
+def _clean_values(values, n_jobs, chunk_size, min_parallel_size):
+    """Pilih jalur serial atau paralel sesuai ukuran input"""
+    if n_jobs == 1 or len(values) < min_parallel_size:
+        return clean_texts(values)
+    return clean_texts_parallel(values, n_jobs=n_jobs, chunk_size=chunk_size)
+
+def _clean_with_cache(values, cache, n_jobs, chunk_size, min_parallel_size, save):
+    """Bersihkan hanya review yang belum ada di cache"""
+    cache.ensure_version(config_version())
+
+    # Nilai non-string selalu menjadi "" dan tidak perlu di-cache
+    cleaned = ["" for _ in values]
+    positions = [i for i, text in enumerate(values) if isinstance(text, str)]
+    keys = [text_digest(values[i]) for i in positions]
+
+    found, missing = cache.lookup(keys)
+    for pos, value in zip(positions, found):
+        if value is not None:
+            cleaned[pos] = value
+
+    if missing:
+        miss_texts = [values[positions[i]] for i in missing]
+        miss_clean = _clean_values(miss_texts, n_jobs, chunk_size, min_parallel_size)
+        for i, value in zip(missing, miss_clean):
+            cleaned[positions[i]] = value
+        cache.update([keys[i] for i in missing], miss_clean)
+
+    if save:
+        cache.save()
+    return cleaned
+
+def preprocess_series(series, n_jobs=1, chunk_size=CHUNK_SIZE,
+                      min_parallel_size=MIN_PARALLEL_SIZE, cache=None,
+                      save_cache=True):
+    """
+    Apply cleaning ke seluruh series
+
+    Parameters:
+    - series: series review mentah
+    - n_jobs: jumlah proses (1 = serial, None/-1 = semua core)
+    - chunk_size: ukuran chunk untuk mode paralel
+    - min_parallel_size: di bawah jumlah baris ini selalu serial, karena
+      biaya start proses lebih besar dari waktu pembersihan
+    - cache: CleanCache opsional; hanya review baru/berubah yang dibersihkan
+    - save_cache: tulis cache ke disk setelah selesai (matikan jika
+      dipanggil berulang per chunk, lalu panggil cache.save() sekali)
+    """
+    values = series.to_numpy(dtype=object)
+
+    if cache is None:
+        cleaned = _clean_values(values, n_jobs, chunk_size, min_parallel_size)
+    else:
+        cleaned = _clean_with_cache(
+            values, cache, n_jobs, chunk_size, min_parallel_size, save_cache
+        )
+
+    return pd.Series(cleaned, index=series.index, name=series.name)
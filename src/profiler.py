@@ -0,0 +1,162 @@
+import cProfile
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ===============================
+# MEMORI PROSES
+# ===============================
+def peak_rss_mb():
+    """Peak RSS proses sejauh ini (MB), None jika tidak didukung OS"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+# ===============================
+# PROFILER PER TAHAP
+# ===============================
+class StageProfiler:
+    """
+    Catat waktu dan memori setiap tahap pipeline
+
+    Per tahap dicatat: wall time, CPU time, peak RSS proses (dan berapa
+    tahap itu menaikkannya), serta - jika trace_memory=True - peak alokasi
+    Python via tracemalloc. Tahap bisa menambah info sendiri (jumlah baris,
+    shape matriks, status cache) lewat dict yang di-yield oleh stage().
+
+    Parameters:
+    - trace_memory: aktifkan tracemalloc (lebih akurat, tapi memperlambat)
+    - profile_stage: nama tahap yang di-profile dengan cProfile (opsional)
+    """
+
+    def __init__(self, trace_memory=False, profile_stage=None):
+        self.trace_memory = trace_memory
+        self.profile_stage = profile_stage
+        self.profile = None
+        self.stages = []
+        self._stack = []
+        self._started = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+        self._owns_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Context manager untuk satu tahap
+
+        Contoh:
+            with profiler.stage("tfidf") as info:
+                ...
+                info["shape"] = X.shape
+        """
+        info = {}
+        record = {"stage": name}
+        if self._stack:
+            record["parent"] = self._stack[-1]
+        self._stack.append(name)
+
+        profile = None
+        if name == self.profile_stage:
+            profile = cProfile.Profile()
+
+        rss_before = peak_rss_mb()
+        if self.trace_memory:
+            traced_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profile is not None:
+            profile.enable()
+
+        try:
+            yield info
+        finally:
+            if profile is not None:
+                profile.disable()
+                self.profile = profile
+
+            record["wall_s"] = round(time.perf_counter() - wall, 6)
+            record["cpu_s"] = round(time.process_time() - cpu, 6)
+
+            rss_after = peak_rss_mb()
+            if rss_after is not None:
+                record["peak_rss_mb"] = _round(rss_after)
+                record["rss_growth_mb"] = round(rss_after - rss_before, 2)
+            if self.trace_memory:
+                traced_peak = tracemalloc.get_traced_memory()[1]
+                record["tracemalloc_peak_mb"] = round((traced_peak - traced_before) / (1024 * 1024), 2)
+
+            record.update({key: _jsonable(value) for key, value in info.items()})
+            self._stack.pop()
+            self.stages.append(record)
+
+    def report(self, **extra):
+        """
+        Laporan run (dict siap di-JSON-kan)
+
+        Total waktu hanya menjumlahkan tahap level atas (tanpa parent).
+        """
+        top_level = [s for s in self.stages if "parent" not in s]
+        report = {
+            "total_wall_s": round(time.perf_counter() - self._started, 6),
+            "total_cpu_s": round(time.process_time() - self._started_cpu, 6),
+            "stage_wall_s": round(sum(s["wall_s"] for s in top_level), 6),
+            "peak_rss_mb": _round(peak_rss_mb()),
+            "stages": self.stages,
+        }
+        report.update({key: _jsonable(value) for key, value in extra.items()})
+        return report
+
+    def stop(self):
+        """Matikan tracemalloc jika dinyalakan oleh profiler ini"""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def save_profile(self, path):
+        """Dump hasil cProfile (buka dengan pstats/snakeviz); None jika tidak ada"""
+        if self.profile is None:
+            return None
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.profile.dump_stats(path)
+        return path
+
+    def summary(self):
+        """Ringkasan satu baris per tahap untuk log console"""
+        lines = []
+        for s in self.stages:
+            indent = "     " if "parent" in s else "   "
+            line = f"{indent}{s['stage']:<10} {s['wall_s']:>8.3f}s wall {s['cpu_s']:>8.3f}s cpu"
+            if "peak_rss_mb" in s:
+                line += f"  peak RSS {s['peak_rss_mb']:.1f} MB"
+            lines.append(line)
+        return "\n".join(lines)
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+def _jsonable(value):
+    """Konversi tipe NumPy/tuple ke tipe dasar JSON"""
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        return value.item()
+    return value
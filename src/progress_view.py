@@ -0,0 +1,76 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Jumlah baris log yang ditampilkan
+LOG_LINES = 8
+
+class ProgressPanel(tk.Frame):
+    """
+    Panel progres (judul, status, progress bar, potongan log) yang tampil
+    selama data di-load atau clustering berjalan
+
+    Parameters:
+    - parent: widget induk
+    - colors: skema warna GUI (key: bg, primary, text, text_light)
+    - title: judul panel
+    """
+
+    def __init__(self, parent, colors, title):
+        super().__init__(parent, bg=colors['bg'])
+        self.colors = colors
+        self._lines = []
+
+        body = tk.Frame(self, bg=colors['bg'])
+        body.place(relx=0.5, rely=0.45, anchor='center')
+
+        tk.Label(
+            body,
+            text=title,
+            font=('Segoe UI', 24, 'bold'),
+            bg=colors['bg'],
+            fg=colors['primary']
+        ).pack(pady=(0, 20))
+
+        self.status_label = tk.Label(
+            body,
+            font=('Segoe UI', 12),
+            bg=colors['bg'],
+            fg=colors['text']
+        )
+        self.status_label.pack(pady=(0, 10))
+
+        self.progress_bar = ttk.Progressbar(body, length=420, maximum=1.0)
+        self.progress_bar.pack(pady=(0, 15))
+
+        self.log_label = tk.Label(
+            body,
+            font=('Consolas', 9),
+            bg=colors['bg'],
+            fg=colors['text_light'],
+            justify='left',
+            anchor='w'
+        )
+        self.log_label.pack(fill='x')
+
+    def set_status(self, text):
+        self.status_label.config(text=text)
+
+    def set_progress(self, fraction):
+        """fraction 0..1, atau None untuk progress bar berjalan (tak tentu)"""
+        if fraction is None:
+            if str(self.progress_bar.cget('mode')) != 'indeterminate':
+                self.progress_bar.config(mode='indeterminate', maximum=100)
+                self.progress_bar.start(15)
+            return
+        if str(self.progress_bar.cget('mode')) != 'determinate':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', maximum=1.0)
+        self.progress_bar.config(value=fraction)
+
+    def add_log(self, lines):
+        """Tambah baris log (hanya LOG_LINES baris terakhir yang tampil)"""
+        lines = [line for text in lines for line in text.splitlines() if line.strip()]
+        if not lines:
+            return
+        self._lines = (self._lines + lines)[-LOG_LINES:]
+        self.log_label.config(text="\n".join(self._lines))
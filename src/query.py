@@ -0,0 +1,208 @@
+import queue
+import threading
+
+import numpy as np
+
+# Panjang n-gram maksimum di index pencarian
+MAX_GRAM = 3
+
+# Jeda (ms) setelah ketikan terakhir sebelum query dijalankan, dan
+# interval (ms) GUI mengecek hasil dari worker thread
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_POLL_MS = 15
+
+class PlaceIndex:
+    """
+    Index in-memory untuk pencarian dan filter daftar tempat di GUI
+
+    Dibangun sekali saat data di-load:
+    - nama lowercase dan teks tampilan per tempat (sudah jadi)
+    - posisi baris per nama tempat
+    - urutan tampil yang sudah di-sort
+    - bitmap (array boolean) per cluster dan per kategori
+    - index n-gram (1..MAX_GRAM karakter) -> id tempat untuk search box
+
+    Query = irisan bitmap + kandidat dari index n-gram, tanpa copy
+    DataFrame. Hasil query terakhir disimpan, sehingga mengetik satu huruf
+    lagi (query baru diawali query lama) cukup menyaring hasil sebelumnya.
+
+    Parameters:
+    - df: DataFrame hasil clustering (kolom wisata, cluster, kategori)
+    - sort_by: kolom urutan tampil
+    - format_row: fungsi (row dict) -> teks tampilan di listbox
+    """
+
+    def __init__(self, df, sort_by=("cluster", "wisata"), format_row=None):
+        self.n = len(df)
+        self.names = df["wisata"].astype(str).to_numpy(dtype=object)
+        self.lower = np.array([name.lower() for name in self.names], dtype=object)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+
+        # Urutan tampil (sort stabil)
+        self.order = df.reset_index(drop=True).sort_values(
+            list(sort_by), kind="stable"
+        ).index.to_numpy()
+
+        self.cluster_bitmaps = self._bitmaps(df["cluster"])
+        self.kategori_bitmaps = self._bitmaps(df["kategori"])
+        self.grams = self._build_grams(self.lower)
+
+        records = df.to_dict("records")
+        if format_row is None:
+            format_row = lambda row: str(row["wisata"])
+        self.display = [format_row(row) for row in records]
+
+        self._last_search = None
+        self._last_match = None
+
+    def _bitmaps(self, values):
+        """{nilai: array boolean baris dengan nilai tsb}"""
+        values = np.asarray(values)
+        return {value: values == value for value in dict.fromkeys(values.tolist())}
+
+    @staticmethod
+    def _build_grams(names):
+        """n-gram (1..MAX_GRAM) -> array id tempat yang namanya memuat n-gram itu"""
+        postings = {}
+        for i, name in enumerate(names):
+            seen = set()
+            for size in range(1, MAX_GRAM + 1):
+                for start in range(len(name) - size + 1):
+                    seen.add(name[start:start + size])
+            for gram in seen:
+                postings.setdefault(gram, []).append(i)
+        return {gram: np.asarray(ids, dtype=np.int64) for gram, ids in postings.items()}
+
+    def search(self, text):
+        """
+        Bitmap tempat yang namanya memuat text (case-insensitive, substring)
+        """
+        text = text.lower()
+        if not text:
+            return np.ones(self.n, dtype=bool)
+
+        if self._last_search and text.startswith(self._last_search):
+            # Query diperpanjang: kandidat = hasil query sebelumnya
+            candidates = np.flatnonzero(self._last_match)
+            verify = True
+        else:
+            # Kandidat = irisan posting list semua n-gram query
+            size = min(len(text), MAX_GRAM)
+            candidates = None
+            for start in range(len(text) - size + 1):
+                ids = self.grams.get(text[start:start + size])
+                if ids is None:
+                    candidates = np.zeros(0, dtype=np.int64)
+                    break
+                candidates = ids if candidates is None else np.intersect1d(
+                    candidates, ids, assume_unique=True
+                )
+            # Query sepanjang <= MAX_GRAM adalah n-gram itu sendiri (pasti cocok)
+            verify = len(text) > MAX_GRAM
+
+        if verify:
+            lower = self.lower
+            candidates = [i for i in candidates.tolist() if text in lower[i]]
+
+        match = np.zeros(self.n, dtype=bool)
+        match[candidates] = True
+
+        self._last_search = text
+        self._last_match = match
+        return match
+
+    def query(self, search="", cluster="all", kategori="all"):
+        """
+        Id baris yang lolos semua filter, dalam urutan tampil
+
+        Parameters:
+        - search: teks pencarian nama (kosong = semua)
+        - cluster: nilai cluster atau 'all'
+        - kategori: nilai kategori atau 'all'
+        """
+        mask = self.search(search)
+        if cluster != "all":
+            mask = mask & self.cluster_bitmaps.get(cluster, np.zeros(self.n, dtype=bool))
+        if kategori != "all":
+            mask = mask & self.kategori_bitmaps.get(kategori, np.zeros(self.n, dtype=bool))
+        return self.order[mask[self.order]]
+
+    def lines(self, rows):
+        """Teks tampilan listbox untuk id baris"""
+        display = self.display
+        return [display[i] for i in rows.tolist()]
+
+
+class SearchWorker:
+    """
+    Menjalankan PlaceIndex.query di satu thread latar belakang
+
+    GUI memanggil submit() dari thread Tk dan mengambil hasil lewat poll()
+    (mis. dengan root.after), sehingga widget Tk hanya disentuh dari
+    thread Tk. Setiap submit menaikkan nomor generasi:
+    - query yang belum sempat jalan diganti query terbaru (coalescing)
+    - hasil query yang sudah usang (generasi lama) dibuang
+
+    Hanya satu worker per index: PlaceIndex menyimpan query terakhir untuk
+    prefix narrowing, jadi query tidak boleh berjalan paralel.
+
+    Parameters:
+    - index: PlaceIndex
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self._cond = threading.Condition()
+        self._pending = None
+        self._generation = 0
+        self._results = queue.Queue()
+        self._thread = None
+
+    def submit(self, search="", cluster="all", kategori="all"):
+        """
+        Antrekan query (menggantikan query yang belum jalan)
+
+        Returns:
+        - nomor generasi query
+        """
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, (search, cluster, kategori))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return self._generation
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                generation, args = self._pending
+                self._pending = None
+
+            try:
+                rows, error = self.index.query(*args), None
+            except Exception as e:
+                rows, error = None, e
+
+            # Sudah ada query yang lebih baru -> hasil ini tidak dipakai
+            if generation == self._generation:
+                self._results.put((generation, rows, error))
+
+    def poll(self):
+        """
+        Hasil query terbaru jika sudah selesai
+
+        Returns:
+        - (generasi, rows, error) atau None jika belum ada hasil terbaru
+        """
+        latest = None
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                return latest
+            if item[0] == self._generation:
+                latest = item
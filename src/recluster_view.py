@@ -0,0 +1,138 @@
+import tkinter as tk
+from tkinter import messagebox
+
+# Rentang K yang bisa dipilih
+MIN_K = 2
+MAX_K = 15
+
+def k_range(n_places):
+    """
+    Rentang K yang valid untuk n_places tempat
+
+    Returns:
+    - (min_k, max_k): K paling banyak n_places - 1 (dan tidak lebih dari MAX_K)
+    """
+    return MIN_K, min(MAX_K, n_places - 1)
+
+class ReclusterDialog(tk.Toplevel):
+    """
+    Dialog parameter clustering ulang (K dan stopwords tambahan)
+
+    Parameters:
+    - parent: window induk
+    - colors: skema warna GUI (key: white, primary, secondary, text, text_light)
+    - k: nilai K awal
+    - stopwords: list stopwords tambahan awal
+    - on_submit: callback(k, stopwords) saat tombol Jalankan ditekan
+    - max_k: K terbesar yang boleh dipilih (lihat k_range)
+    """
+
+    def __init__(self, parent, colors, k, stopwords, on_submit, max_k=MAX_K):
+        super().__init__(parent, bg=colors['white'])
+        self.on_submit = on_submit
+        self.max_k = max_k
+        self.title("Clustering Ulang")
+        self.resizable(False, False)
+        self.transient(parent)
+
+        body = tk.Frame(self, bg=colors['white'])
+        body.pack(fill='both', expand=True, padx=20, pady=15)
+
+        tk.Label(
+            body,
+            text="⚙️ Clustering Ulang",
+            font=('Segoe UI', 14, 'bold'),
+            bg=colors['white'],
+            fg=colors['primary']
+        ).grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 10))
+
+        # Jumlah cluster
+        tk.Label(
+            body,
+            text="Jumlah cluster (K):",
+            font=('Segoe UI', 10),
+            bg=colors['white'],
+            fg=colors['text']
+        ).grid(row=1, column=0, sticky='w', pady=5)
+
+        self.k_var = tk.IntVar(value=k)
+        tk.Spinbox(
+            body,
+            from_=MIN_K,
+            to=max_k,
+            textvariable=self.k_var,
+            width=6,
+            font=('Segoe UI', 10)
+        ).grid(row=1, column=1, sticky='w', pady=5)
+
+        # Stopwords tambahan
+        tk.Label(
+            body,
+            text="Stopwords tambahan:",
+            font=('Segoe UI', 10),
+            bg=colors['white'],
+            fg=colors['text']
+        ).grid(row=2, column=0, sticky='w', pady=5)
+
+        self.stopwords_var = tk.StringVar(value=", ".join(stopwords))
+        tk.Entry(
+            body,
+            textvariable=self.stopwords_var,
+            width=36,
+            font=('Segoe UI', 10)
+        ).grid(row=2, column=1, sticky='w', pady=5)
+
+        tk.Label(
+            body,
+            text="Pisahkan dengan koma. Jika hanya K yang diubah, TF-IDF\n"
+                 "diambil dari cache sehingga clustering ulang jauh lebih cepat.",
+            font=('Segoe UI', 9, 'italic'),
+            bg=colors['white'],
+            fg=colors['text_light'],
+            justify='left'
+        ).grid(row=3, column=0, columnspan=2, sticky='w', pady=(5, 10))
+
+        # Tombol
+        buttons = tk.Frame(body, bg=colors['white'])
+        buttons.grid(row=4, column=0, columnspan=2, sticky='e')
+
+        tk.Button(
+            buttons,
+            text="Batal",
+            font=('Segoe UI', 10),
+            relief='flat',
+            padx=15,
+            cursor='hand2',
+            command=self.destroy
+        ).pack(side='right', padx=(5, 0))
+
+        tk.Button(
+            buttons,
+            text="▶ Jalankan",
+            font=('Segoe UI', 10, 'bold'),
+            bg=colors['secondary'],
+            fg=colors['white'],
+            relief='flat',
+            padx=15,
+            cursor='hand2',
+            command=self.submit
+        ).pack(side='right')
+
+        self.bind('<Return>', lambda event: self.submit())
+        self.bind('<Escape>', lambda event: self.destroy())
+        self.grab_set()
+
+    def submit(self):
+        try:
+            k = int(self.k_var.get())
+        except (tk.TclError, ValueError):
+            k = None
+        if k is None or not MIN_K <= k <= self.max_k:
+            messagebox.showwarning(
+                "Input tidak valid", f"K harus bilangan bulat {MIN_K}-{self.max_k}", parent=self
+            )
+            return
+
+        stopwords = [w.strip().lower() for w in self.stopwords_var.get().split(",") if w.strip()]
+        self.destroy()
+        self.on_submit(k, stopwords)
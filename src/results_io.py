@@ -0,0 +1,223 @@
+"""
+Baca/tulis hasil clustering
+
+Format:
+- csv     : hasil_cluster_per_tempat.csv + detail_cluster.csv (default,
+            tema_terkait tersimpan sebagai teks list Python)
+- parquet : file .parquet dengan kolom bertipe (cluster, kategori,
+            tema_utama dictionary/categorical, kategori cluster disimpan
+            sebagai string; tema_terkait dan kata_dominan list string), ditambah matriks TF-IDF (.npz sparse) dan centroid
+            (.npz) dalam bentuk biner. Butuh pyarrow.
+
+Reader (load_results, load_cluster_detail) memilih Parquet jika ada dan
+pyarrow terpasang, dan jatuh ke CSV jika tidak; keduanya menghasilkan
+DataFrame dengan tipe yang sama.
+Karena itu setiap run menghapus file format lain yang tidak ikut ditulis
+(remove_stale_outputs), agar reader tidak membaca hasil lama.
+"""
+
+import ast
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+OUTPUT_DIR = "../outputs"
+HASIL_FILE = "hasil_cluster_per_tempat"
+DETAIL_FILE = "detail_cluster"
+MATRIX_FILE = "tfidf_matrix.npz"
+MODEL_FILE = "centroids.npz"
+RUN_REPORT_FILE = "laporan_run.json"
+DISTRIBUTION_FILE = "distribusi_cluster_review.csv"
+
+CATEGORICAL_COLUMNS = ["cluster", "kategori", "tema_utama"]
+OUTPUT_FORMATS = ("csv", "parquet", "both")
+
+def require_pyarrow():
+    if pyarrow is None:
+        raise ImportError(
+            "Format parquet butuh pyarrow. Install dengan: pip install pyarrow"
+        )
+
+# ===============================
+# TULIS
+# ===============================
+def typed_results(df):
+    """Kolom kategori jadi categorical, tema_terkait jadi list"""
+    df = df.copy()
+    if "cluster" in df.columns:
+        # Di Parquet kategori cluster tersimpan sebagai string (lihat save_parquet)
+        df["cluster"] = df["cluster"].astype(str).astype(np.int64)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    if "tema_terkait" in df.columns:
+        df["tema_terkait"] = df["tema_terkait"].map(_as_list)
+    return df
+
+def save_parquet(hasil, cluster_detail, output_dir=OUTPUT_DIR):
+    """
+    Simpan hasil per tempat dan detail cluster sebagai Parquet
+
+    Returns:
+    - list path file yang ditulis
+    """
+    require_pyarrow()
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Kategori integer ditulis pyarrow sebagai int64 biasa, jadi kategori
+    # cluster disimpan sebagai string agar kolomnya tetap dictionary di Parquet
+    hasil = typed_results(hasil)
+    hasil["cluster"] = hasil["cluster"].cat.rename_categories(str)
+    hasil_path = os.path.join(output_dir, f"{HASIL_FILE}.parquet")
+    hasil.to_parquet(hasil_path, index=False)
+
+    detail = cluster_detail.copy()
+    detail["kata_dominan"] = detail["kata_dominan"].map(_split_words)
+    detail_path = os.path.join(output_dir, f"{DETAIL_FILE}.parquet")
+    detail.to_parquet(detail_path, index=False)
+
+    return [hasil_path, detail_path]
+
+def save_matrices(X, centroids, feature_names, output_dir=OUTPUT_DIR):
+    """
+    Simpan matriks TF-IDF (sparse .npz) dan centroid + nama fitur (.npz)
+
+    Returns:
+    - list path file yang ditulis
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    matrix_path = os.path.join(output_dir, MATRIX_FILE)
+    sp.save_npz(matrix_path, sp.csr_matrix(X))
+
+    model_path = os.path.join(output_dir, MODEL_FILE)
+    np.savez(
+        model_path,
+        centroids=np.asarray(centroids),
+        feature_names=np.asarray(feature_names, dtype=str)
+    )
+    return [matrix_path, model_path]
+
+def remove_stale_outputs(output_dir=OUTPUT_DIR, output_format="csv", cluster_level="tempat"):
+    """
+    Hapus file hasil format lain yang tidak ikut ditulis run ini
+
+    Reader memilih Parquet jika ada, jadi Parquet lama yang tertinggal
+    setelah run CSV akan menutupi hasil baru (begitu juga CSV lama setelah
+    run Parquet saja, jika pyarrow tidak terpasang saat membaca).
+    Distribusi cluster review hanya ditulis run level review, jadi ikut
+    dihapus pada run level tempat.
+
+    Returns:
+    - list path file yang dihapus
+    """
+    if output_format == "csv":
+        names = [f"{HASIL_FILE}.parquet", f"{DETAIL_FILE}.parquet", MATRIX_FILE, MODEL_FILE]
+    elif output_format == "parquet":
+        names = [f"{HASIL_FILE}.csv", f"{DETAIL_FILE}.csv"]
+    else:
+        names = []
+    if cluster_level != "review":
+        names.append(DISTRIBUTION_FILE)
+
+    removed = []
+    for name in names:
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+# ===============================
+# BACA
+# ===============================
+def results_exist(output_dir=OUTPUT_DIR):
+    """Cek apakah hasil per tempat yang bisa dibaca load_results sudah ada"""
+    if pyarrow is not None and os.path.exists(os.path.join(output_dir, f"{HASIL_FILE}.parquet")):
+        return True
+    return os.path.exists(os.path.join(output_dir, f"{HASIL_FILE}.csv"))
+
+def saved_format(output_dir=OUTPUT_DIR):
+    """
+    output_format untuk run ulang yang menimpa hasil di output_dir: "both"
+    jika ada Parquet yang terbaca load_results (agar tidak tertinggal
+    versi lama), selain itu "csv"
+    """
+    if pyarrow is not None and os.path.exists(os.path.join(output_dir, f"{HASIL_FILE}.parquet")):
+        return "both"
+    return "csv"
+
+def load_run_config(output_dir=OUTPUT_DIR):
+    """
+    Konfigurasi run terakhir dari laporan run (k, extra_stopwords, ...)
+
+    Returns:
+    - dict (kosong jika laporan belum ada / tidak terbaca)
+    """
+    try:
+        with open(os.path.join(output_dir, RUN_REPORT_FILE), encoding="utf-8") as f:
+            return json.load(f).get("config", {})
+    except (OSError, ValueError):
+        return {}
+
+def load_results(output_dir=OUTPUT_DIR):
+    """
+    Load hasil per tempat (Parquet jika tersedia, jika tidak CSV)
+
+    Returns:
+    - DataFrame dengan cluster/kategori/tema_utama categorical dan
+      tema_terkait berupa list
+    """
+    parquet_path = os.path.join(output_dir, f"{HASIL_FILE}.parquet")
+    if pyarrow is not None and os.path.exists(parquet_path):
+        # Kolom list dibaca pyarrow sebagai array NumPy -> dinormalkan ke list
+        return typed_results(pd.read_parquet(parquet_path))
+
+    return typed_results(pd.read_csv(os.path.join(output_dir, f"{HASIL_FILE}.csv")))
+
+def load_cluster_detail(output_dir=OUTPUT_DIR):
+    """
+    Load detail cluster (Parquet jika tersedia, jika tidak CSV)
+
+    Returns:
+    - DataFrame dengan kata_dominan berupa list kata
+    """
+    parquet_path = os.path.join(output_dir, f"{DETAIL_FILE}.parquet")
+    if pyarrow is not None and os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path)
+    else:
+        df = pd.read_csv(os.path.join(output_dir, f"{DETAIL_FILE}.csv"))
+    df["kata_dominan"] = df["kata_dominan"].map(_split_words)
+    return df
+
+def load_matrices(output_dir=OUTPUT_DIR):
+    """
+    Load matriks TF-IDF dan centroid yang disimpan save_matrices
+
+    Returns:
+    - X: sparse matrix TF-IDF
+    - centroids: array (k x n_fitur)
+    - feature_names: array nama fitur
+    """
+    X = sp.load_npz(os.path.join(output_dir, MATRIX_FILE))
+    with np.load(os.path.join(output_dir, MODEL_FILE)) as model:
+        return X, model["centroids"], model["feature_names"]
+
+def _as_list(value):
+    """tema_terkait dari CSV ("['Pantai', 'Kuliner']") atau list -> list"""
+    if isinstance(value, str):
+        return list(ast.literal_eval(value)) if value.startswith("[") else [value]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    return list(value)
+
+def _split_words(value):
+    return [w for w in value.split(", ") if w] if isinstance(value, str) else list(value)
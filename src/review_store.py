@@ -0,0 +1,185 @@
+"""
+Penyimpanan review mentah untuk lookup cepat per tempat
+
+Review diurutkan per tempat dan teksnya (UTF-8) disimpan dalam satu
+file byte yang di-memory-map, ditambah array offset per review dan
+index tempat -> (start, end). Membuka review satu tempat cukup dengan
+satu slice, tanpa parsing CSV atau scan seluruh tabel.
+
+File di folder store:
+- reviews.bin  : teks semua review, berurutan per tempat
+- offsets.npy  : int64 (n_review + 1), review i = reviews.bin[offsets[i]:offsets[i+1]]
+- index.json   : daftar tempat + start/end, dan identitas file CSV sumber
+"""
+
+import json
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+
+STORE_DIR = "../outputs/.cache/review_store"
+REVIEWS_FILE = "reviews.bin"
+OFFSETS_FILE = "offsets.npy"
+INDEX_FILE = "index.json"
+
+# Jumlah baris CSV yang dibaca per chunk saat membangun store
+BUILD_CHUNKSIZE = 100_000
+
+def _source_id(csv_path):
+    """Identitas file sumber (ukuran + waktu modifikasi) untuk cek kedaluwarsa"""
+    stat = os.stat(csv_path)
+    return {"path": os.path.abspath(csv_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+# ===============================
+# BANGUN STORE
+# ===============================
+def build_review_store(csv_path, folder=STORE_DIR, chunksize=BUILD_CHUNKSIZE):
+    """
+    Bangun review store dari CSV [wisata, review]
+
+    Dua tahap agar memori tetap kecil untuk CSV besar:
+    1. CSV dibaca per chunk, teks ditulis apa adanya ke file sementara
+       sambil mencatat (tempat, offset, panjang) tiap review
+    2. Review diurutkan per tempat (stabil, urutan asli dipertahankan)
+       lalu disalin dari file sementara (mmap) ke reviews.bin
+
+    Returns:
+    - ReviewStore yang sudah dibuka
+    """
+    os.makedirs(folder, exist_ok=True)
+    tmp_path = os.path.join(folder, REVIEWS_FILE + ".unsorted")
+
+    places, lengths = [], []
+    with open(tmp_path, "wb") as f:
+        for chunk in pd.read_csv(csv_path, usecols=["wisata", "review"], chunksize=chunksize):
+            chunk = chunk[chunk["wisata"].notna()]
+            encoded = [text.encode("utf-8") for text in chunk["review"].fillna("").astype(str)]
+            f.write(b"".join(encoded))
+            places.extend(chunk["wisata"].astype(str))
+            lengths.extend(map(len, encoded))
+
+    lengths = np.asarray(lengths, dtype=np.int64)
+    src_offsets = np.concatenate(([0], np.cumsum(lengths)))
+    codes, place_names = pd.factorize(np.asarray(places, dtype=object), sort=True)
+    order = np.argsort(codes, kind="stable")
+
+    offsets = np.concatenate(([0], np.cumsum(lengths[order])))
+    with open(tmp_path, "rb") as src, open(os.path.join(folder, REVIEWS_FILE), "wb") as dst:
+        if src_offsets[-1] > 0:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for i in order:
+                    dst.write(buf[src_offsets[i]:src_offsets[i + 1]])
+    os.remove(tmp_path)
+    np.save(os.path.join(folder, OFFSETS_FILE), offsets)
+
+    bounds = np.searchsorted(codes[order], np.arange(len(place_names) + 1))
+    index = {
+        "source": _source_id(csv_path),
+        "n_reviews": int(len(order)),
+        "places": [str(p) for p in place_names],
+        "starts": bounds[:-1].tolist(),
+        "ends": bounds[1:].tolist(),
+    }
+    # Index ditulis terakhir: store tanpa index dianggap belum jadi
+    tmp_index = os.path.join(folder, INDEX_FILE + ".tmp")
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_index, os.path.join(folder, INDEX_FILE))
+
+    return ReviewStore(folder)
+
+def open_review_store(csv_path, folder=STORE_DIR):
+    """
+    Buka review store untuk csv_path, bangun ulang jika belum ada atau
+    CSV sumber sudah berubah
+
+    Returns:
+    - ReviewStore
+    """
+    index_path = os.path.join(folder, INDEX_FILE)
+    if os.path.exists(index_path):
+        try:
+            store = ReviewStore(folder)
+            if store.source == _source_id(csv_path):
+                return store
+            store.close()
+        except Exception:
+            # Store rusak / format lama -> bangun ulang
+            pass
+    return build_review_store(csv_path, folder)
+
+# ===============================
+# BACA STORE
+# ===============================
+class ReviewStore:
+    """
+    Akses read-only ke review per tempat
+
+    Contoh:
+        store = open_review_store("../data/raw/wisata_balikpapan.csv")
+        reviews = store.reviews("pantai_melawai")   # list string
+    """
+
+    def __init__(self, folder=STORE_DIR):
+        with open(os.path.join(folder, INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+
+        self.folder = folder
+        self.source = index["source"]
+        self.places = index["places"]
+        self.index = {
+            place: (start, end)
+            for place, start, end in zip(index["places"], index["starts"], index["ends"])
+        }
+        self.offsets = np.load(os.path.join(folder, OFFSETS_FILE), mmap_mode="r")
+        self._n_reviews = index["n_reviews"]
+
+        self._file = open(os.path.join(folder, REVIEWS_FILE), "rb")
+        if self.offsets[-1] > 0:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = b""
+
+    def __len__(self):
+        return self._n_reviews
+
+    def __contains__(self, place):
+        return place in self.index
+
+    def count(self, place):
+        """Jumlah review satu tempat"""
+        start, end = self.index.get(place, (0, 0))
+        return end - start
+
+    def reviews(self, place, start=0, stop=None):
+        """
+        Review satu tempat (urutan sama dengan CSV)
+
+        Parameters:
+        - place: nama tempat wisata
+        - start, stop: ambil sebagian saja (mis. untuk paging)
+
+        Returns:
+        - list string review
+        """
+        first, last = self.index.get(place, (0, 0))
+        stop = last - first if stop is None else min(stop, last - first)
+        if start >= stop:
+            return []
+
+        offsets = np.asarray(self.offsets[first + start:first + stop + 1])
+        block = self._buffer[offsets[0]:offsets[-1]].decode("utf-8")
+        if len(block) == offsets[-1] - offsets[0]:
+            # Semua ASCII: offset byte = offset karakter, cukup slice string
+            rel = (offsets - offsets[0]).tolist()
+            return [block[rel[i]:rel[i + 1]] for i in range(len(rel) - 1)]
+
+        data = self._buffer
+        return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
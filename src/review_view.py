@@ -0,0 +1,134 @@
+import tkinter as tk
+
+# Jumlah review yang ditampilkan per halaman
+PAGE_SIZE = 20
+
+class PagedReviewList(tk.Frame):
+    """
+    Daftar review per halaman dengan widget yang didaur ulang
+
+    Hanya PAGE_SIZE kartu review (frame + badge + label) yang pernah
+    dibuat, berapa pun jumlah review tempat tersebut. Pindah halaman
+    cukup mengganti teks kartu yang sudah ada, dan review diambil per
+    halaman lewat fetch(start, stop) sehingga teks yang tidak tampil
+    tidak pernah dibaca.
+
+    Parameters:
+    - parent: widget induk
+    - colors: skema warna GUI (key: secondary, light, info, white, text)
+    - total: jumlah review
+    - fetch: fungsi (start, stop) -> list review
+    - page_size: jumlah review per halaman
+    - on_page: callback(widget) setelah pindah halaman (mis. scroll ke atas)
+    """
+
+    def __init__(self, parent, colors, total, fetch, page_size=PAGE_SIZE, on_page=None):
+        super().__init__(parent, bg=colors['white'])
+        self.colors = colors
+        self.total = total
+        self.fetch = fetch
+        self.page_size = page_size
+        self.on_page = on_page
+        self.page = 0
+        self.n_pages = max(1, -(-total // page_size))
+
+        # Header
+        header = tk.Frame(self, bg=colors['secondary'])
+        header.pack(fill='x')
+
+        tk.Label(
+            header,
+            text=f"💬 Review Pengunjung ({total} review)",
+            font=('Segoe UI', 12, 'bold'),
+            bg=colors['secondary'],
+            fg=colors['white'],
+            anchor='w'
+        ).pack(side='left', fill='x', padx=15, pady=10)
+
+        self.top_nav = self._create_nav(header, colors['secondary'], colors['white'])
+
+        # Pool kartu review (dibuat sekali, dipakai ulang tiap halaman)
+        self.cards_frame = tk.Frame(self, bg=colors['white'])
+        self.cards_frame.pack(fill='both', expand=True)
+        self.cards = [self._create_card() for _ in range(min(page_size, total))]
+
+        self.bottom_nav = self._create_nav(self, colors['white'], colors['text'])
+
+        self.show_page(0, notify=False)
+
+    def _create_nav(self, parent, bg, fg):
+        """Tombol halaman sebelumnya/berikutnya + label posisi"""
+        if self.n_pages <= 1:
+            return None
+        nav = tk.Frame(parent, bg=bg)
+        nav.pack(side='right', padx=10, pady=5)
+
+        prev_btn = tk.Button(nav, text="◀", width=3, relief='flat', cursor='hand2',
+                             command=lambda: self.show_page(self.page - 1))
+        prev_btn.pack(side='left')
+        label = tk.Label(nav, font=('Segoe UI', 10), bg=bg, fg=fg, padx=8)
+        label.pack(side='left')
+        next_btn = tk.Button(nav, text="▶", width=3, relief='flat', cursor='hand2',
+                             command=lambda: self.show_page(self.page + 1))
+        next_btn.pack(side='left')
+        return prev_btn, label, next_btn
+
+    def _create_card(self):
+        card = tk.Frame(
+            self.cards_frame,
+            bg=self.colors['light'],
+            relief='solid',
+            bd=1
+        )
+
+        # Review number badge
+        badge = tk.Label(
+            card,
+            font=('Segoe UI', 10, 'bold'),
+            bg=self.colors['info'],
+            fg=self.colors['white'],
+            padx=10,
+            pady=5
+        )
+        badge.pack(anchor='nw', padx=10, pady=10)
+
+        # Review text
+        text = tk.Label(
+            card,
+            font=('Segoe UI', 11),
+            bg=self.colors['light'],
+            fg=self.colors['text'],
+            wraplength=700,
+            justify='left',
+            anchor='w'
+        )
+        text.pack(fill='x', padx=15, pady=(0, 15))
+        return card, badge, text
+
+    def show_page(self, page, notify=True):
+        """Tampilkan halaman ke-page (0-based) dengan kartu yang sudah ada"""
+        page = max(0, min(page, self.n_pages - 1))
+        self.page = page
+
+        start = page * self.page_size
+        reviews = self.fetch(start, min(start + self.page_size, self.total))
+
+        for i, (card, badge, text) in enumerate(self.cards):
+            if i < len(reviews):
+                badge.config(text=f"#{start + i + 1}")
+                text.config(text=reviews[i])
+                if not card.winfo_manager():
+                    card.pack(fill='x', pady=8)
+            else:
+                card.pack_forget()
+
+        for nav in (self.top_nav, self.bottom_nav):
+            if nav is None:
+                continue
+            prev_btn, label, next_btn = nav
+            label.config(text=f"{page + 1} / {self.n_pages}")
+            prev_btn.config(state='normal' if page > 0 else 'disabled')
+            next_btn.config(state='normal' if page < self.n_pages - 1 else 'disabled')
+
+        if notify and self.on_page is not None:
+            self.on_page(self)
@@ -1,6 +1,7 @@
 """
 Launcher untuk GUI Clustering Wisata Balikpapan
-Otomatis cek data dan jalankan clustering jika perlu
+Otomatis cek data; jika hasil clustering belum ada, GUI menjalankannya
+di proses terpisah sambil menampilkan progres
 """
 
 import os
@@ -21,22 +22,6 @@ def check_files():
     
     return missing
 
-def run_clustering():
-    """Jalankan clustering jika file hasil belum ada"""
-    print("="*60)
-    print("FILE HASIL CLUSTERING TIDAK DITEMUKAN")
-    print("="*60)
-    print("\nMenjalankan clustering terlebih dahulu...")
-    print("Mohon tunggu...\n")
-    
-    try:
-        import main
-        print("\n✅ Clustering selesai!")
-        return True
-    except Exception as e:
-        print(f"\n❌ Error saat menjalankan clustering: {e}")
-        return False
-
 def main():
     """Main launcher function"""
     print("\n" + "="*60)
@@ -67,12 +52,8 @@ def main():
             input("\nTekan Enter untuk keluar...")
             sys.exit(1)
         
-        # File hasil tidak ada, jalankan clustering
-        print("\n[2/3] Running clustering...")
-        if not run_clustering():
-            print("\n❌ Gagal menjalankan clustering!")
-            input("\nTekan Enter untuk keluar...")
-            sys.exit(1)
+        # File hasil tidak ada, clustering dijalankan oleh GUI (latar belakang)
+        print("\n[2/3] Clustering akan dijalankan di GUI (dengan progress bar)")
     else:
         print("   ✅ Semua file ditemukan!")
         print("\n[2/3] Skipping clustering (file sudah ada)")
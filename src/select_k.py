@@ -0,0 +1,255 @@
+"""
+Pemilihan jumlah cluster (k) otomatis
+
+Fit run_kmeans untuk beberapa nilai k secara paralel, hitung inertia,
+silhouette (di-sampling untuk data besar) dan Davies-Bouldin, lalu
+rekomendasikan k dengan silhouette tertinggi.
+
+Pemakaian:
+  cd src
+  python select_k.py --min-k 2 --max-k 8
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from cluster import run_kmeans
+
+# ===============================
+# MATRIKS DI SHARED MEMORY
+# ===============================
+def share_matrix(X):
+    """
+    Salin X (sparse CSR atau dense) sekali ke shared memory
+
+    Returns:
+    - desc: deskripsi yang bisa dikirim (pickle) ke worker
+    - blocks: list SharedMemory milik proses induk (wajib di-close/unlink)
+    """
+    if sp.issparse(X):
+        X = sp.csr_matrix(X)
+        arrays = {"data": X.data, "indices": X.indices, "indptr": X.indptr}
+    else:
+        arrays = {"data": np.ascontiguousarray(X)}
+
+    desc = {"sparse": sp.issparse(X), "shape": X.shape, "arrays": {}}
+    blocks = []
+    for name, arr in arrays.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+        desc["arrays"][name] = (shm.name, arr.shape, arr.dtype.str)
+        blocks.append(shm)
+    return desc, blocks
+
+def attach_matrix(desc):
+    """
+    Bangun ulang matriks di worker di atas buffer shared memory (tanpa copy)
+
+    Returns:
+    - X: matriks yang memakai buffer bersama
+    - blocks: SharedMemory yang harus tetap hidup selama X dipakai
+    """
+    arrays = {}
+    blocks = []
+    for name, (shm_name, shape, dtype) in desc["arrays"].items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        blocks.append(shm)
+
+    if desc["sparse"]:
+        X = sp.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=desc["shape"], copy=False
+        )
+    else:
+        X = arrays["data"]
+    return X, blocks
+
+# ===============================
+# METRIK EVALUASI CLUSTER
+# ===============================
+def _dense_rows(X, idx):
+    if sp.issparse(X):
+        return X[idx].toarray()
+    return np.asarray(X[idx], dtype=np.float64)
+
+def _pairwise_distances(A):
+    """Jarak Euclidean antar semua baris A (dense)"""
+    sq = np.einsum("ij,ij->i", A, A)
+    d2 = sq[:, np.newaxis] - 2.0 * (A @ A.T) + sq[np.newaxis, :]
+    np.maximum(d2, 0, out=d2)
+    np.fill_diagonal(d2, 0.0)
+    return np.sqrt(d2)
+
+def silhouette_score(X, labels, sample_size=None, random_state=42):
+    """
+    Rata-rata silhouette (jarak Euclidean)
+
+    Parameters:
+    - sample_size: jika diisi dan n lebih besar, hitung pada sampel acak
+      berukuran ini (biaya O(sample_size^2) alih-alih O(n^2))
+    """
+    labels = np.asarray(labels)
+    n = len(labels)
+    idx = np.arange(n)
+    if sample_size is not None and n > sample_size:
+        idx = np.random.RandomState(random_state).choice(n, sample_size, replace=False)
+        labels = labels[idx]
+
+    clusters, labels = np.unique(labels, return_inverse=True)
+    if not 1 < len(clusters) < len(labels):
+        raise ValueError("silhouette butuh 2 <= jumlah label <= n_samples - 1")
+
+    D = _pairwise_distances(_dense_rows(X, idx))
+    onehot = np.zeros((len(labels), len(clusters)))
+    onehot[np.arange(len(labels)), labels] = 1.0
+    sums = D @ onehot
+    sizes = onehot.sum(axis=0)
+
+    own = np.arange(len(labels)), labels
+    own_size = sizes[labels]
+    a = np.divide(sums[own], own_size - 1, out=np.zeros(len(labels)), where=own_size > 1)
+    mean_other = sums / sizes
+    mean_other[own] = np.inf
+    b = mean_other.min(axis=1)
+
+    s = (b - a) / np.maximum(a, b)
+    # Titik yang sendirian di cluster-nya diberi skor 0
+    s[(own_size <= 1) | ~np.isfinite(s)] = 0.0
+    return float(s.mean())
+
+def davies_bouldin_score(X, labels):
+    """Indeks Davies-Bouldin (lebih kecil = cluster lebih terpisah)"""
+    labels = np.asarray(labels)
+    clusters, labels = np.unique(labels, return_inverse=True)
+    k = len(clusters)
+    n = len(labels)
+
+    membership = sp.csr_matrix((np.ones(n), (labels, np.arange(n))), shape=(k, n))
+    sizes = np.bincount(labels, minlength=k).astype(np.float64)
+    centroids = np.asarray((membership @ X).toarray() if sp.issparse(X) else membership @ X)
+    centroids = centroids / sizes[:, np.newaxis]
+
+    # Rata-rata jarak anggota ke centroid-nya
+    assigned = centroids[labels]
+    if sp.issparse(X):
+        x_sq = np.asarray(X.multiply(X).sum(axis=1)).ravel()
+        cross = np.asarray(X.multiply(assigned).sum(axis=1)).ravel()
+    else:
+        x_sq = np.einsum("ij,ij->i", X, X)
+        cross = np.einsum("ij,ij->i", X, assigned)
+    dist = np.sqrt(np.maximum(x_sq - 2.0 * cross + np.einsum("ij,ij->i", assigned, assigned), 0))
+    scatter = np.bincount(labels, weights=dist, minlength=k) / sizes
+
+    centroid_dist = _pairwise_distances(centroids)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (scatter[:, np.newaxis] + scatter[np.newaxis, :]) / centroid_dist
+    ratio[~np.isfinite(ratio)] = 0.0
+    np.fill_diagonal(ratio, 0.0)
+    return float(ratio.max(axis=1).mean())
+
+# ===============================
+# EVALUASI PER K
+# ===============================
+def evaluate_k(X, k, algorithm="full", silhouette_sample=2000):
+    """Fit K-Means untuk satu k dan hitung metrik evaluasinya"""
+    model, labels = run_kmeans(X, k=k, algorithm=algorithm)
+    return {
+        "k": k,
+        "inertia": float(model.inertia_),
+        "silhouette": silhouette_score(X, labels, sample_size=silhouette_sample),
+        "davies_bouldin": davies_bouldin_score(X, labels),
+        "n_iter": int(model.n_iter_),
+        "cluster_sizes": np.bincount(labels, minlength=k).tolist()
+    }
+
+# State worker: matriks hasil attach (sekali per proses)
+_WORKER = {}
+
+def _init_worker(desc):
+    _WORKER["X"], _WORKER["blocks"] = attach_matrix(desc)
+
+def _evaluate_in_worker(args):
+    k, algorithm, silhouette_sample = args
+    return evaluate_k(_WORKER["X"], k, algorithm, silhouette_sample)
+
+def select_k(X, k_values=range(2, 11), n_jobs=None, algorithm="full",
+             silhouette_sample=2000):
+    """
+    Cari k terbaik untuk matriks TF-IDF X
+
+    Parameters:
+    - X: matriks TF-IDF (sparse) dari vectorize_text
+    - k_values: kandidat k (di luar 2..n_samples-1 diabaikan)
+    - n_jobs: jumlah proses (None = semua core, 1 = serial)
+    - algorithm: diteruskan ke run_kmeans ("full"/"minibatch"/"auto")
+    - silhouette_sample: ukuran sampel silhouette untuk data besar
+
+    Returns:
+    - best_k: k dengan silhouette tertinggi
+    - report: DataFrame metrik per k
+    """
+    n_samples = X.shape[0]
+    k_values = [k for k in k_values if 2 <= k < n_samples]
+    if not k_values:
+        raise ValueError(f"Tidak ada k valid untuk {n_samples} data")
+
+    workers = min(os.cpu_count() or 1 if n_jobs is None else n_jobs, len(k_values))
+    tasks = [(k, algorithm, silhouette_sample) for k in k_values]
+
+    if workers <= 1:
+        rows = [evaluate_k(X, *task) for task in tasks]
+    else:
+        # Matriks dikirim sekali lewat shared memory, bukan di-pickle per tugas
+        desc, blocks = share_matrix(X)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(desc,)) as executor:
+                rows = list(executor.map(_evaluate_in_worker, tasks))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    report = pd.DataFrame(rows).set_index("k")
+    # Silhouette tertinggi; jika sama, pilih k terkecil
+    best_k = int(report["silhouette"].idxmax())
+    return best_k, report
+
+def main():
+    from preprocess import preprocess_series
+    from vectorize import vectorize_text
+
+    parser = argparse.ArgumentParser(description="Pilih jumlah cluster (k) otomatis")
+    parser.add_argument("--data", default="../data/raw/wisata_balikpapan.csv")
+    parser.add_argument("--min-k", type=int, default=2)
+    parser.add_argument("--max-k", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--algorithm", default="full", choices=["full", "minibatch", "auto"])
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("PEMILIHAN JUMLAH CLUSTER (k)")
+    print("="*60)
+
+    df = pd.read_csv(args.data)
+    df["clean_review"] = preprocess_series(df["review"])
+    grouped = df.groupby("wisata")["clean_review"].apply(lambda x: " ".join(x))
+    _, X = vectorize_text(grouped)
+    print(f"\nShape matrix: {X.shape}")
+
+    best_k, report = select_k(
+        X, range(args.min_k, args.max_k + 1), n_jobs=args.jobs, algorithm=args.algorithm
+    )
+
+    print("\n" + report.to_string(float_format=lambda v: f"{v:.4f}"))
+    print(f"\n✓ Rekomendasi k = {best_k} (silhouette tertinggi)")
+
+if __name__ == "__main__":
+    main()
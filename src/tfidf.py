@@ -0,0 +1,411 @@
+import pickle
+import re
+from collections import Counter
+
+import numpy as np
+import scipy.sparse as sp
+
+# ===============================
+# HITUNG N-GRAM
+# ===============================
+def count_ngrams(tokens, ngram_range=(1, 2), counts=None, context=()):
+    """
+    Hitung frekuensi n-gram dari list token
+
+    Parameters:
+    - tokens: list token (sudah bersih)
+    - ngram_range: (min_n, max_n) seperti TfidfVectorizer
+    - counts: Counter tujuan (opsional, dibuat baru jika None)
+    - context: token sebelumnya dalam dokumen yang sama; n-gram yang
+      menyambung dari context ke tokens ikut dihitung. Dengan ini satu
+      dokumen bisa dihitung bertahap tanpa menyambung string panjang.
+
+    Returns:
+    - Counter {term: jumlah}
+    """
+    if counts is None:
+        counts = Counter()
+
+    min_n, max_n = ngram_range
+    seq = list(context) + list(tokens)
+    offset = len(seq) - len(tokens)
+
+    for n in range(min_n, max_n + 1):
+        if n == 1:
+            counts.update(tokens)
+            continue
+        # Hanya n-gram yang berakhir di dalam tokens baru
+        start = max(0, offset - n + 1)
+        counts.update(" ".join(seq[i:i + n]) for i in range(start, len(seq) - n + 1))
+
+    return counts
+
+# ===============================
+# SELEKSI FITUR & PEMBOBOTAN
+# ===============================
+def _doc_count(value, n_docs):
+    """min_df/max_df: int = jumlah dokumen, float = proporsi dokumen"""
+    if isinstance(value, float):
+        return value * n_docs
+    return value
+
+def select_features(terms, df, tf, n_docs, min_df=1, max_df=1.0, max_features=None):
+    """
+    Pilih fitur dengan aturan yang sama seperti TfidfVectorizer
+
+    Parameters:
+    - terms: array nama term, terurut alfabetis
+    - df: document frequency tiap term
+    - tf: total frekuensi tiap term di seluruh korpus
+    - n_docs: jumlah dokumen
+
+    Returns:
+    - array indeks term terpilih (terurut alfabetis)
+    """
+    max_doc_count = _doc_count(max_df, n_docs)
+    min_doc_count = _doc_count(min_df, n_docs)
+    if max_doc_count < min_doc_count:
+        raise ValueError("max_df corresponds to < documents than min_df")
+
+    mask = (df <= max_doc_count) & (df >= min_doc_count)
+    if max_features is not None and mask.sum() > max_features:
+        # Fitur paling sering muncul di korpus (urutan tie mengikuti sklearn)
+        top = (-tf[mask]).argsort()[:max_features]
+        new_mask = np.zeros(len(df), dtype=bool)
+        new_mask[np.where(mask)[0][top]] = True
+        mask = new_mask
+
+    selected = np.where(mask)[0]
+    if len(selected) == 0:
+        raise ValueError(
+            "After pruning, no terms remain. Try a lower min_df or a higher max_df."
+        )
+    return selected
+
+def smooth_idf(df, n_docs):
+    """IDF dengan smoothing: ln((1 + n) / (1 + df)) + 1"""
+    return np.log((1.0 + n_docs) / (1.0 + np.asarray(df, dtype=np.float64))) + 1.0
+
+def tfidf_weight(counts, idf):
+    """Kalikan matriks count dengan IDF lalu normalisasi L2 per baris"""
+    X = sp.csr_matrix(counts, dtype=np.float64) @ sp.diags(idf)
+    X = sp.csr_matrix(X)
+
+    norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    norms[norms == 0.0] = 1.0
+    X = sp.diags(1.0 / norms) @ X
+    X = sp.csr_matrix(X)
+    X.sort_indices()
+    return X
+
+def count_matrix(docs_counts, terms_index):
+    """
+    Bangun matriks count (CSR) dari list Counter
+
+    Parameters:
+    - docs_counts: list {term: jumlah}, satu per dokumen
+    - terms_index: dict {term: kolom}; term di luar index diabaikan
+    """
+    indptr = [0]
+    indices = []
+    data = []
+    for counts in docs_counts:
+        for term, value in counts.items():
+            col = terms_index.get(term)
+            if col is not None:
+                indices.append(col)
+                data.append(value)
+        indptr.append(len(indices))
+
+    X = sp.csr_matrix(
+        (np.asarray(data, dtype=np.int64),
+         np.asarray(indices, dtype=np.int64),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(docs_counts), len(terms_index))
+    )
+    X.sum_duplicates()
+    return X
+
+# ===============================
+# MODEL TF-IDF DARI COUNT
+# ===============================
+class TfidfModel:
+    """
+    TF-IDF yang di-fit dari hitungan term per dokumen (bukan dari teks)
+
+    Pembobotan dan seleksi fitur sama dengan TfidfVectorizer (smooth idf,
+    normalisasi L2, min_df/max_df/max_features), sehingga hasilnya identik
+    untuk hitungan n-gram yang sama.
+    """
+
+    def __init__(self, min_df=1, max_df=1.0, max_features=None):
+        self.min_df = min_df
+        self.max_df = max_df
+        self.max_features = max_features
+
+    def fit_transform(self, docs_counts):
+        """
+        Fit model dan kembalikan matriks TF-IDF
+
+        Parameters:
+        - docs_counts: list {term: jumlah}, satu per dokumen
+
+        Returns:
+        - X: sparse matrix TF-IDF (n_docs x n_fitur)
+        """
+        docs_counts = list(docs_counts)
+
+        all_terms = set()
+        for counts in docs_counts:
+            all_terms.update(counts)
+        terms = np.array(sorted(all_terms), dtype=object)
+
+        counts = count_matrix(docs_counts, {t: i for i, t in enumerate(terms)})
+        return self.fit_matrix(counts, terms)
+
+    def fit_matrix(self, counts, terms):
+        """
+        Fit model dari matriks count yang sudah jadi
+
+        Parameters:
+        - counts: sparse matrix count (n_docs x n_terms)
+        - terms: nama term untuk setiap kolom (urutan bebas)
+
+        Returns:
+        - X: sparse matrix TF-IDF (n_docs x n_fitur)
+        """
+        terms = np.asarray(terms, dtype=object)
+        order = np.argsort(terms, kind="stable")
+        if not np.array_equal(order, np.arange(len(terms))):
+            terms = terms[order]
+            counts = sp.csr_matrix(counts)[:, order]
+        counts = sp.csr_matrix(counts)
+        n_docs = counts.shape[0]
+
+        df = np.bincount(counts.indices, minlength=len(terms))
+        tf = np.asarray(counts.sum(axis=0)).ravel()
+
+        selected = select_features(
+            terms, df, tf, n_docs,
+            min_df=self.min_df, max_df=self.max_df, max_features=self.max_features
+        )
+
+        self.feature_names_ = terms[selected]
+        self.vocabulary_ = {t: i for i, t in enumerate(self.feature_names_)}
+        self.idf_ = smooth_idf(df[selected], n_docs)
+
+        return tfidf_weight(counts[:, selected], self.idf_)
+
+    def get_feature_names_out(self):
+        return self.feature_names_
+
+# ===============================
+# TF-IDF DARI TEKS
+# ===============================
+# Pola token default TfidfVectorizer: kata minimal 2 karakter
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+class TfidfVectorizer(TfidfModel):
+    """
+    Pengganti sklearn TfidfVectorizer (NumPy/SciPy saja)
+
+    Teks di-lowercase, ditokenisasi dengan TOKEN_PATTERN, dihitung
+    n-gram-nya, lalu diboboti dengan TfidfModel. Untuk parameter yang sama
+    hasilnya identik dengan sklearn.
+    """
+
+    def __init__(self, min_df=1, max_df=1.0, max_features=None, ngram_range=(1, 1)):
+        super().__init__(min_df=min_df, max_df=max_df, max_features=max_features)
+        self.ngram_range = ngram_range
+
+    def _count(self, texts):
+        find_tokens = TOKEN_PATTERN.findall
+        return [
+            count_ngrams(find_tokens(text.lower()), self.ngram_range)
+            for text in texts
+        ]
+
+    def fit_transform(self, texts):
+        return super().fit_transform(self._count(texts))
+
+    def fit_transform_corpus(self, corpus):
+        """
+        Fit langsung dari TokenizedCorpus tanpa tokenisasi ulang
+
+        Token korpus adalah hasil split teks bersih, yang untuk output
+        preprocess sama dengan TOKEN_PATTERN.
+        """
+        counts, terms = corpus.ngram_matrix(self.ngram_range)
+        return self.fit_matrix(counts, terms)
+
+    def fit(self, texts):
+        self.fit_transform(texts)
+        return self
+
+    def transform(self, texts):
+        """Vektor TF-IDF untuk teks baru dengan kosakata & IDF hasil fit"""
+        counts = count_matrix(self._count(texts), self.vocabulary_)
+        return tfidf_weight(counts, self.idf_)
+
+# ===============================
+# MODEL TF-IDF INKREMENTAL
+# ===============================
+class IncrementalTfidf(TfidfModel):
+    """
+    TF-IDF yang bisa menyerap review/tempat baru tanpa fit ulang dari nol
+
+    Model menyimpan hitungan term per dokumen, document frequency dan
+    total frekuensi term. partial_fit hanya menambah statistik untuk dokumen
+    yang berubah; transform menghitung ulang seleksi fitur dan IDF dari
+    statistik tersebut (murah, sebanding jumlah term) dan hanya membangun
+    ulang baris count untuk dokumen yang terdampak. Baris lain dipakai ulang
+    selama fitur terpilih tidak berubah.
+
+    Catatan: n-gram yang menyambung antara batch lama dan batch baru dari
+    dokumen yang sama tidak dihitung.
+    """
+
+    def __init__(self, min_df=1, max_df=1.0, max_features=None):
+        super().__init__(min_df=min_df, max_df=max_df, max_features=max_features)
+        self.reset()
+
+    def reset(self):
+        """Kosongkan seluruh statistik"""
+        self.doc_keys_ = []
+        self._doc_index = {}
+        self._doc_counts = []
+        self._terms = []
+        self._term_index = {}
+        self._df = []
+        self._tf = []
+        self._dirty = set()
+        self._alpha_order = None
+        self._selected = None
+        self._rows = []
+
+    def row_index(self, key):
+        """Posisi baris dokumen `key` di matriks hasil transform"""
+        return self._doc_index[key]
+
+    def partial_fit(self, docs):
+        """
+        Tambahkan hitungan term untuk dokumen baru atau yang sudah ada
+
+        Parameters:
+        - docs: dict {key dokumen: {term: jumlah}}; key yang sudah ada
+          hitungannya dijumlahkan (review baru untuk tempat lama)
+        """
+        term_index = self._term_index
+        df = self._df
+        tf = self._tf
+
+        for key, counts in docs.items():
+            row = self._doc_index.get(key)
+            if row is None:
+                row = len(self.doc_keys_)
+                self._doc_index[key] = row
+                self.doc_keys_.append(key)
+                self._doc_counts.append({})
+                self._rows.append(None)
+            doc = self._doc_counts[row]
+
+            for term, value in counts.items():
+                tid = term_index.get(term)
+                if tid is None:
+                    tid = term_index[term] = len(self._terms)
+                    self._terms.append(term)
+                    df.append(0)
+                    tf.append(0)
+                    self._alpha_order = None
+                if tid not in doc:
+                    doc[tid] = 0
+                    df[tid] += 1
+                doc[tid] += value
+                tf[tid] += value
+
+            self._dirty.add(row)
+
+        return self
+
+    def transform(self):
+        """
+        Hitung matriks TF-IDF untuk semua dokumen (urutan doc_keys_)
+
+        Returns:
+        - X: sparse matrix TF-IDF (n_docs x n_fitur)
+        """
+        n_docs = len(self.doc_keys_)
+        terms = np.array(self._terms, dtype=object)
+        df = np.asarray(self._df, dtype=np.int64)
+        tf = np.asarray(self._tf, dtype=np.int64)
+
+        # Seleksi fitur dilakukan atas term terurut alfabetis (seperti sklearn)
+        if self._alpha_order is None:
+            self._alpha_order = np.argsort(terms, kind="stable")
+        order = self._alpha_order
+        selected = order[select_features(
+            terms[order], df[order], tf[order], n_docs,
+            min_df=self.min_df, max_df=self.max_df, max_features=self.max_features
+        )]
+
+        if self._selected is None or not np.array_equal(selected, self._selected):
+            # Fitur berubah -> semua baris perlu dipetakan ulang
+            rebuild = range(n_docs)
+        else:
+            rebuild = self._dirty
+
+        columns = np.full(len(terms), -1, dtype=np.int64)
+        columns[selected] = np.arange(len(selected))
+        for row in rebuild:
+            self._rows[row] = self._build_row(self._doc_counts[row], columns)
+
+        self._selected = selected
+        self._dirty = set()
+
+        self.feature_names_ = terms[selected]
+        self.vocabulary_ = {t: i for i, t in enumerate(self.feature_names_)}
+        self.idf_ = smooth_idf(df[selected], n_docs)
+
+        return tfidf_weight(self._stack_rows(len(selected)), self.idf_)
+
+    def fit_transform(self, docs_counts):
+        """Fit dari nol; key dokumen = posisi di list"""
+        self.reset()
+        self.partial_fit(dict(enumerate(docs_counts)))
+        return self.transform()
+
+    @staticmethod
+    def _build_row(doc, columns):
+        """Petakan hitungan satu dokumen ke kolom fitur terpilih"""
+        tids = np.fromiter(doc.keys(), dtype=np.int64, count=len(doc))
+        values = np.fromiter(doc.values(), dtype=np.int64, count=len(doc))
+        cols = columns[tids]
+        keep = cols >= 0
+        cols, values = cols[keep], values[keep]
+        order = np.argsort(cols)
+        return cols[order], values[order]
+
+    def _stack_rows(self, n_features):
+        """Gabungkan baris-baris count menjadi satu CSR"""
+        lengths = np.array([len(cols) for cols, _ in self._rows], dtype=np.int64)
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        if len(self._rows):
+            indices = np.concatenate([cols for cols, _ in self._rows])
+            data = np.concatenate([values for _, values in self._rows])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+            data = np.zeros(0, dtype=np.int64)
+        return sp.csr_matrix(
+            (data, indices, indptr), shape=(len(self._rows), n_features)
+        )
+
+    def save(self, path):
+        """Simpan model (termasuk statistik) ke file pickle"""
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path):
+        """Load model yang disimpan dengan save()"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
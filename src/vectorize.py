@@ -1,4 +1,12 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
+from tfidf import TfidfVectorizer, TfidfModel, IncrementalTfidf
+
+# Parameter TF-IDF yang dipakai di seluruh pipeline
+TFIDF_PARAMS = {
+    "min_df": 2,         # Kata harus muncul minimal di 2 dokumen
+    "max_df": 0.85,      # Kata maksimal muncul di 85% dokumen
+    "max_features": 500  # Batasi fitur untuk performa lebih baik
+}
+NGRAM_RANGE = (1, 2)     # Unigram dan bigram
 
 def vectorize_text(texts):
     """
@@ -13,12 +21,65 @@ def vectorize_text(texts):
     """
     vectorizer = TfidfVectorizer(
         # Tidak perlu stopwords karena sudah dibersihkan di preprocess
-        min_df=2,           # Kata harus muncul minimal di 2 dokumen
-        max_df=0.85,        # Kata maksimal muncul di 85% dokumen
-        ngram_range=(1, 2), # Unigram dan bigram
-        max_features=500    # Batasi fitur untuk performa lebih baik
+        ngram_range=NGRAM_RANGE,
+        **TFIDF_PARAMS
     )
     
     X = vectorizer.fit_transform(texts)
     
-    return vectorizer, X
\ No newline at end of file
+    return vectorizer, X
+
+def vectorize_corpus(corpus):
+    """
+    Sama dengan vectorize_text, tetapi dari TokenizedCorpus
+
+    Parameters:
+    - corpus: TokenizedCorpus (satu dokumen per tempat atau per review)
+
+    Returns:
+    - vectorizer: object TfidfVectorizer yang sudah di-fit
+    - X: sparse matrix hasil TF-IDF
+    """
+    vectorizer = TfidfVectorizer(ngram_range=NGRAM_RANGE, **TFIDF_PARAMS)
+    X = vectorizer.fit_transform_corpus(corpus)
+
+    return vectorizer, X
+
+def vectorize_counts(term_counts):
+    """
+    Mengubah hitungan n-gram per dokumen menjadi vektor TF-IDF
+
+    Dipakai oleh mode streaming (hitungan dari ingest.stream_term_counts).
+    N-gram harus dihitung dengan NGRAM_RANGE yang sama.
+
+    Parameters:
+    - term_counts: list/series {term: jumlah}, satu per dokumen
+
+    Returns:
+    - model: TfidfModel yang sudah di-fit
+    - X: sparse matrix hasil TF-IDF
+    """
+    model = TfidfModel(**TFIDF_PARAMS)
+    X = model.fit_transform(term_counts)
+
+    return model, X
+
+def vectorize_incremental(docs, model=None):
+    """
+    Tambahkan hitungan term baru ke model TF-IDF inkremental
+
+    Parameters:
+    - docs: dict {wisata: {term: jumlah}} berisi review baru saja
+    - model: IncrementalTfidf dari run sebelumnya (None = model baru)
+
+    Returns:
+    - model: IncrementalTfidf yang sudah diperbarui
+    - X: sparse matrix TF-IDF untuk semua dokumen (urutan model.doc_keys_)
+    """
+    if model is None:
+        model = IncrementalTfidf(**TFIDF_PARAMS)
+
+    model.partial_fit(docs)
+    X = model.transform()
+
+    return model, X
@@ -1,15 +1,16 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.decomposition import PCA
+
+import results_io
 
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 
 def load_results():
-    """Load hasil clustering"""
-    df = pd.read_csv("../outputs/hasil_cluster_per_tempat.csv")
+    """Load hasil clustering (Parquet jika ada, jika tidak CSV)"""
+    df = results_io.load_results("../outputs")
     return df
 
 def plot_cluster_distribution(df):
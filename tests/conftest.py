@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modul pipeline ada di src/ dan diimport dengan nama top-level
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,71 @@
+"""
+AhoCorasick dan detect_tema dibandingkan dengan pencarian naif (`in` /
+str.find) pada teks acak, termasuk keyword yang saling tumpang tindih
+"""
+
+import random
+
+import pytest
+
+from matcher import AhoCorasick
+from analyzer import TEMA_KEYWORDS, detect_tema
+
+# Keyword yang saling menjadi awalan/akhiran/substring satu sama lain
+OVERLAPPING = ["air", "air terjun", "terjun", "ir", "rjun", "a", "aa", "pantai", "tai", "an"]
+
+def _random_texts(words, n, seed):
+    """Teks acak dari potongan keyword, huruf lepas, dan spasi/tanda baca"""
+    rng = random.Random(seed)
+    pieces = words + list("aeijnprtu") + [" ", " ", ", ", "-"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 30))) for _ in range(n)]
+
+def _naive_find(patterns, text, word_boundary=False):
+    found = set()
+    for pid, pattern in enumerate(patterns):
+        start = text.find(pattern)
+        while start != -1:
+            end = start + len(pattern)
+            if not word_boundary or (
+                (start == 0 or not text[start - 1].isalnum())
+                and (end == len(text) or not text[end].isalnum())
+            ):
+                found.add(pid)
+                break
+            start = text.find(pattern, start + 1)
+    return found
+
+def _naive_tema(text, word_boundary=False):
+    text = text.lower()
+    scores = {}
+    for tema, keywords in TEMA_KEYWORDS.items():
+        score = len(_naive_find(list(dict.fromkeys(keywords)), text, word_boundary))
+        if score > 0:
+            scores[tema] = score
+    if not scores:
+        return "Umum", []
+    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    names = [tema.replace('_', ' ').title() for tema, _ in ranked]
+    return names[0], names[:3]
+
+@pytest.mark.parametrize("word_boundary", [False, True])
+def test_find_matches_naive_scan(word_boundary):
+    matcher = AhoCorasick(OVERLAPPING)
+    for text in _random_texts(OVERLAPPING, 2000, seed=0):
+        assert matcher.find(text, word_boundary) == _naive_find(OVERLAPPING, text, word_boundary), text
+
+def test_iter_matches_reports_every_occurrence():
+    matcher = AhoCorasick(OVERLAPPING)
+    for text in _random_texts(OVERLAPPING, 500, seed=1):
+        expected = sorted(
+            (start + len(pattern) - 1, pid)
+            for pid, pattern in enumerate(OVERLAPPING)
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        )
+        assert sorted(matcher.iter_matches(text)) == expected, text
+
+@pytest.mark.parametrize("word_boundary", [False, True])
+def test_detect_tema_matches_naive_scan(word_boundary):
+    keywords = [keyword for words in TEMA_KEYWORDS.values() for keyword in words]
+    for text in _random_texts(keywords, 2000, seed=2):
+        assert detect_tema(text, word_boundary) == _naive_tema(text, word_boundary), text
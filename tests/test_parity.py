@@ -0,0 +1,63 @@
+"""
+Parity TF-IDF dan K-Means native terhadap scikit-learn
+
+Dilewati jika scikit-learn tidak terpasang (bukan dependency pipeline).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+sklearn_cluster = pytest.importorskip("sklearn.cluster")
+
+from preprocess import preprocess_series
+from vectorize import vectorize_text, TFIDF_PARAMS, NGRAM_RANGE
+from cluster import run_kmeans
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "raw", "wisata_balikpapan.csv"
+)
+
+@pytest.fixture(scope="module")
+def reviews():
+    df = pd.read_csv(DATA_PATH)
+    df["clean_review"] = preprocess_series(df["review"])
+    return df
+
+@pytest.fixture(scope="module")
+def corpora(reviews):
+    """Dokumen per tempat (seperti main.py) dan sampel per review"""
+    places = reviews.groupby("wisata")["clean_review"].apply(" ".join)
+    sample = reviews["clean_review"].iloc[:1500]
+    return {"tempat": places.tolist(), "review": sample.tolist()}
+
+def _sklearn_tfidf(texts):
+    vectorizer = sklearn_text.TfidfVectorizer(ngram_range=NGRAM_RANGE, **TFIDF_PARAMS)
+    return vectorizer, vectorizer.fit_transform(texts)
+
+@pytest.mark.parametrize("level", ["tempat", "review"])
+def test_vectorize_text_matches_sklearn(corpora, level):
+    texts = corpora[level]
+    vectorizer, X = vectorize_text(texts)
+    ref_vectorizer, ref_X = _sklearn_tfidf(texts)
+
+    assert list(vectorizer.get_feature_names_out()) == list(ref_vectorizer.get_feature_names_out())
+    assert X.shape == ref_X.shape
+    np.testing.assert_allclose(X.toarray(), ref_X.toarray(), rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize("level", ["tempat", "review"])
+@pytest.mark.parametrize("k", [2, 3, 5])
+@pytest.mark.parametrize("seed", [0, 42])
+def test_run_kmeans_matches_sklearn(corpora, level, k, seed):
+    _, X = vectorize_text(corpora[level])
+
+    model, labels = run_kmeans(X, k=k, random_state=seed)
+    ref = sklearn_cluster.KMeans(n_clusters=k, random_state=seed, n_init=1).fit(X)
+
+    np.testing.assert_array_equal(labels, ref.labels_)
+    np.testing.assert_allclose(model.cluster_centers_, ref.cluster_centers_, rtol=0, atol=1e-10)
+    assert model.inertia_ == pytest.approx(ref.inertia_, rel=1e-10)
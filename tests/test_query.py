@@ -0,0 +1,59 @@
+"""
+PlaceIndex.search/query dibandingkan dengan filter substring naif,
+termasuk urutan query yang diperpanjang (prefix narrowing) dan dipendekkan
+"""
+
+import random
+
+import pandas as pd
+
+from query import PlaceIndex
+
+def _places(n, seed):
+    rng = random.Random(seed)
+    words = ["pantai", "taman", "air", "terjun", "Kebun", "raya", "hutan", "pant", "ai"]
+    return pd.DataFrame({
+        "wisata": [
+            "_".join(rng.choice(words) for _ in range(rng.randint(1, 3))) + f"_{i}"
+            for i in range(n)
+        ],
+        "cluster": [rng.randrange(3) for _ in range(n)],
+        "kategori": [rng.choice(["Positif", "Netral", "Negatif"]) for _ in range(n)],
+    })
+
+def _typing_session(rng, n):
+    """Query seperti diketik: tambah huruf, hapus huruf, atau ganti query"""
+    text = ""
+    for _ in range(n):
+        action = rng.random()
+        if action < 0.6:
+            text += rng.choice("pantaiurjekbhyn_0123")
+        elif action < 0.85:
+            text = text[:-1]
+        else:
+            text = rng.choice(["", "PANT", "ai_", "_1", "taman_air"])
+        yield text
+
+def test_search_matches_naive_substring():
+    df = _places(300, seed=0)
+    index = PlaceIndex(df)
+    lower = df["wisata"].str.lower().tolist()
+    for text in _typing_session(random.Random(1), 2000):
+        expected = [text.lower() in name for name in lower]
+        assert index.search(text).tolist() == expected, text
+
+def test_query_matches_naive_filter():
+    df = _places(300, seed=2)
+    index = PlaceIndex(df)
+    rng = random.Random(3)
+    ordered = df.sort_values(["cluster", "wisata"], kind="stable")
+    for text in _typing_session(rng, 500):
+        cluster = rng.choice(["all", 0, 1, 2, 7])
+        kategori = rng.choice(["all", "Positif", "Netral", "Lainnya"])
+        expected = ordered[
+            ordered["wisata"].str.lower().str.contains(text.lower(), regex=False)
+            & ((ordered["cluster"] == cluster) if cluster != "all" else True)
+            & ((ordered["kategori"] == kategori) if kategori != "all" else True)
+        ]
+        rows = index.query(text, cluster, kategori)
+        assert rows.tolist() == expected.index.tolist(), (text, cluster, kategori)
@@ -0,0 +1,64 @@
+"""
+Slice ReviewStore dibandingkan dengan filter pandas pada CSV sumber,
+termasuk teks non-ASCII dan review kosong
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from review_store import build_review_store, open_review_store
+
+TEXTS = [
+    "pantainya bersih", "café dekat pantai", "air terjun 🌊 indah", "", "mantap",
+    "harga tiket Rp 10.000", "sangat ramai saat libur — parkir susah", "ñ",
+]
+
+def _write_csv(path, n, seed):
+    rng = random.Random(seed)
+    places = ["pantai_melawai", "hutan_lindung", "kebun_raya", "taman_bekapai", np.nan]
+    df = pd.DataFrame({
+        "wisata": [rng.choice(places) for _ in range(n)],
+        "review": [rng.choice(TEXTS + [np.nan]) for _ in range(n)],
+    })
+    df.to_csv(path, index=False)
+    return pd.read_csv(path)
+
+def test_reviews_match_pandas(tmp_path):
+    csv_path = tmp_path / "reviews.csv"
+    df = _write_csv(csv_path, 500, seed=0)
+    store = build_review_store(str(csv_path), str(tmp_path / "store"), chunksize=37)
+    try:
+        df = df[df["wisata"].notna()]
+        assert len(store) == len(df)
+
+        rng = random.Random(1)
+        for place, group in df.groupby("wisata"):
+            expected = group["review"].fillna("").astype(str).tolist()
+            assert store.count(place) == len(expected)
+            assert store.reviews(place) == expected
+            for _ in range(50):
+                start = rng.randint(0, len(expected) + 3)
+                stop = rng.randint(0, len(expected) + 3)
+                assert store.reviews(place, start, stop) == expected[start:stop], (place, start, stop)
+
+        assert store.reviews("tidak_ada") == []
+        assert store.count("tidak_ada") == 0
+    finally:
+        store.close()
+
+def test_open_reuses_and_rebuilds_store(tmp_path):
+    csv_path = tmp_path / "reviews.csv"
+    _write_csv(csv_path, 50, seed=2)
+    folder = str(tmp_path / "store")
+    store = open_review_store(str(csv_path), folder)
+    store.close()
+
+    # CSV berubah -> store dibangun ulang dari isi baru
+    df = _write_csv(csv_path, 80, seed=3)
+    store = open_review_store(str(csv_path), folder)
+    try:
+        assert len(store) == df["wisata"].notna().sum()
+    finally:
+        store.close()